@@ -1036,7 +1036,8 @@ def kullanici_onerileri_getir(top_n: int = 3) -> dict:
         headers = {"Content-Type": "application/json"}
         data = {
             "user_id": user_id,
-            "top_n": top_n
+            "top_n": top_n,
+            "explain": "summary"  # Sadece kısa açıklama metni kullanılıyor, oda listesi gerekmiyor
         }
         
         response = requests.post(
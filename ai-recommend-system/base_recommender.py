@@ -0,0 +1,809 @@
+import hashlib
+import os
+import time
+import numpy as np
+from typing import List, Dict, Tuple, Any, Optional, Iterator, Sequence
+
+from scoring_engine import RoomTable, score_rooms, rank_rooms, describe_adjustments
+from catalog import CatalogSnapshot
+from features import FeatureScaler, user_feature_row
+from metrics import stage_timer
+
+EXPLAIN_LEVELS = ('none', 'summary', 'full')  # Öneri açıklama düzeyleri (summary: oda listesi olmadan)
+
+
+class ModelArtifactError(Exception):
+    """Model dosyası okunamadığında veya mevcut kod/veri ile uyumsuz olduğunda fırlatılır"""
+
+
+def map_shared_array(directory: str, name: str, array: np.ndarray) -> np.ndarray:
+    """
+    Diziyi dizindeki .npy dosyasına yazar ve dosyaya bellek eşlemeli (mmap) görünümünü döndürür.
+    
+    Eşleme yazıldığında kopyalanan (copy-on-write) türdendir: sayfalar işletim sisteminin sayfa
+    önbelleğinden okunur ve aynı dosyayı eşleyen tüm süreçler arasında paylaşılır; yalnızca
+    yazılan sayfalar sürece özel kopyalanır.
+    """
+    path = os.path.join(directory, f"{name}.npy")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.save(f, np.ascontiguousarray(array))
+    os.replace(tmp_path, path)
+    return np.load(path, mmap_mode='c')
+
+
+class FeatureIndex:
+    """
+    Modelin ID -> indeks eşlemeleri ve donmuş ölçeklerle normalize edilmiş özellik matrisleri
+    (sunum için; eğitim verisi içermez). Modelde olmayan katalog kayıtları indekse alınmaz.
+    """
+    
+    def __init__(self, catalog: CatalogSnapshot, user_ids: Sequence[Any], hotel_ids: Sequence[Any],
+                 user_scaler: FeatureScaler, hotel_scaler: FeatureScaler):
+        """
+        Args:
+            catalog: Katalog görüntüsü
+            user_ids: Embedding satır sırasına göre kullanıcı ID'leri
+            hotel_ids: Embedding satır sırasına göre otel ID'leri
+            user_scaler: Kullanıcı özelliklerinin donmuş ölçeği
+            hotel_scaler: Otel özelliklerinin donmuş ölçeği
+        """
+        self.user_ids = list(user_ids)
+        self.hotel_ids = list(hotel_ids)
+        self.user_id_to_index = {user_id: idx for idx, user_id in enumerate(self.user_ids)}
+        self.hotel_id_to_index = {hotel_id: idx for idx, hotel_id in enumerate(self.hotel_ids)}
+        self.user_scaler = user_scaler
+        self.hotel_scaler = hotel_scaler
+        
+        self.users = [user for user in catalog.users if user['id'] in self.user_id_to_index]
+        self.hotels = [hotel for hotel in catalog.hotels if hotel['id'] in self.hotel_id_to_index]
+        
+        # Ham özellikler katalogdan derlenmiş dizilerden alınır (kayıtlardan yeniden çıkarılmaz)
+        self.user_features = catalog.compiled.user_matrix(len(self.user_ids), self.user_id_to_index, user_scaler)
+        self.hotel_features = catalog.compiled.hotel_matrix(len(self.hotel_ids), self.hotel_id_to_index, hotel_scaler)
+        
+        self.num_users = len(self.user_ids)
+        self.num_hotels = len(self.hotel_ids)
+        self.num_user_features = self.user_features.shape[1]
+        self.num_hotel_features = self.hotel_features.shape[1]
+
+
+class BaseRecommender:
+    """
+    Öneri sıralama, toplu öneri ve açıklama mantığı. Puanlama modeli alt sınıflarca sağlanır
+    (PyTorch: ImprovedLearningRecommender, yalnızca NumPy: NumpyRecommender); bu modül
+    PyTorch içe aktarmaz.
+    
+    Alt sınıfların tanımlaması gerekenler: catalog (CatalogStore), dataset (ID eşlemeleri,
+    user_features/hotel_features ve user_scaler), model_version, model_metadata ve
+    _predict_score_block().
+    """
+    
+    # Oda tablosundaki otellerin model indeksleri (tablo nesnesine göre önbelleklenir)
+    _room_table_indices = None
+    
+    # Tekil önerilerin ileri geçişlerini eşzamanlı isteklerle birleştiren zamanlayıcı
+    # (micro_batching.MicroBatcher, işlem fonksiyonu score_micro_batch); None ise doğrudan puanlanır
+    score_batcher = None
+    
+    def _prepare_inference(self):
+        """Puanlamadan önce modeli çıkarım moduna alır (gerekiyorsa alt sınıflarca uygulanır)"""
+    
+    def warm_up(self, num_users: int = 8):
+        """
+        Modeli sunuma almadan önce ısıtır: oda tablosu indeksleri ve ilk ileri geçişler
+        hazırlanır; hata varsa devreye almadan önce burada ortaya çıkar
+        
+        Args:
+            num_users: Deneme önerisi hazırlanacak kullanıcı sayısı
+        """
+        self._prepare_inference()
+        user_ids = [user['id'] for user in self.catalog.snapshot().users[:num_users]]
+        for _ in self.iter_recommendations_batch(user_ids, top_n=5):
+            pass
+    
+    def share_arrays(self, directory: str):
+        """
+        Özellik matrislerini ve model dizilerini dizindeki dosyalara taşıyıp bellek eşlemeli
+        görünümlerle değiştirir (map_shared_array). Ön-çatallı (pre-fork) işçiler ve aynı dizini
+        eşleyen süreçler bu dizileri tek kopya olarak paylaşır.
+        
+        Args:
+            directory: Dizi dosyalarının yazılacağı dizin
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.dataset.user_features = map_shared_array(directory, 'user_features', self.dataset.user_features)
+        self.dataset.hotel_features = map_shared_array(directory, 'hotel_features', self.dataset.hotel_features)
+        self._share_model_arrays(directory)
+    
+    def _share_model_arrays(self, directory: str):
+        """Model ağırlıklarını ve türetilmiş önbellekleri bellek eşlemeli dosyalara taşır (alt sınıflarca uygulanır)"""
+    
+    def _predict_score_block(self, user_indices: Sequence[Optional[int]], user_features: np.ndarray,
+                             hotel_indices: np.ndarray) -> np.ndarray:
+        """
+        Kullanıcılar x oteller puan bloğunu hesaplar
+        
+        Args:
+            user_indices: Kullanıcıların model indeksleri (kayıtlı olmayanlar için None)
+            user_features: Kullanıcıların normalize edilmiş özellik matrisi (kullanıcı sayısı x özellik sayısı)
+            hotel_indices: Otellerin model indeksleri
+            
+        Returns:
+            (kullanıcı sayısı x otel sayısı) boyutunda tahmin matrisi (float32)
+        """
+        raise NotImplementedError
+    
+    @staticmethod
+    def score_micro_batch(requests: Sequence[Tuple[Any, RoomTable, Optional[int], np.ndarray]]) -> List[np.ndarray]:
+        """
+        Mikro toplu işlemdeki puanlama isteklerini aynı öneri sistemi ve oda tablosuna göre
+        gruplar ve her grup için tek bir ileri geçiş yapar
+        
+        Args:
+            requests: (öneri sistemi, oda tablosu, kullanıcı model indeksi, kullanıcı özellik vektörü) listesi
+            
+        Returns:
+            Her istek için tablodaki modelde bilinen otellerin puanları (istek sırasıyla)
+        """
+        groups = {}
+        for position, (recommender, table, _, _) in enumerate(requests):
+            groups.setdefault((id(recommender), id(table)), []).append(position)
+        
+        results = [None] * len(requests)
+        for positions in groups.values():
+            recommender, table = requests[positions[0]][:2]
+            hotel_indices = recommender._room_table_hotel_indices(table)
+            with stage_timer('model_forward'):
+                block = recommender._predict_score_block(
+                    [requests[position][2] for position in positions],
+                    np.stack([requests[position][3] for position in positions]),
+                    hotel_indices[hotel_indices >= 0]
+                )
+            for row, position in enumerate(positions):
+                results[position] = block[row]
+        return results
+    
+    @staticmethod
+    def _checkpoint_version(path: str) -> str:
+        """
+        Model dosyasının içerik özeti; önbellek anahtarlarında modelin sürümü olarak kullanılır
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()[:16]
+    
+    def _room_table_hotel_indices(self, table: RoomTable) -> np.ndarray:
+        """
+        Oda tablosundaki otellerin model indekslerini döndürür (modelde olmayan oteller için -1)
+        """
+        cached = self._room_table_indices
+        if cached is not None and cached[0] is table:
+            return cached[1]
+        
+        hotel_indices = np.array(
+            [self.dataset.hotel_id_to_index.get(hotel_id, -1) for hotel_id in table.hotel_ids],
+            dtype=np.int64
+        )
+        self._room_table_indices = (table, hotel_indices)
+        return hotel_indices
+    
+    def _predict_hotel_scores(self, user_idx: Optional[int], user_features: np.ndarray,
+                              hotel_indices: np.ndarray) -> np.ndarray:
+        """
+        Bir kullanıcı için verilen otellerin temel puanlarını tek bir ileri geçişle hesaplar
+        
+        Args:
+            user_idx: Kullanıcının model indeksi (kayıtlı olmayan profiller için None)
+            user_features: Kullanıcının normalize edilmiş özellik vektörü
+            hotel_indices: Otellerin model indeksleri
+            
+        Returns:
+            Her otel için tahmin edilen puan (float32)
+        """
+        return self._predict_score_block([user_idx], np.asarray(user_features)[np.newaxis], hotel_indices)[0]
+    
+    def _user_feature_vector(self, user: Dict[str, Any], user_idx: Optional[int]) -> np.ndarray:
+        """
+        Kullanıcının normalize edilmiş özellik vektörü. Model eğitildikten sonra kataloğa
+        eklenen kullanıcılar (user_idx None) donmuş ölçekle normalize edilir.
+        """
+        if user_idx is not None:
+            return self.dataset.user_features[user_idx]
+        return self.dataset.user_scaler.transform([user_feature_row(user)])[0]
+    
+    @staticmethod
+    def _profile_to_user(profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Kayıtlı olmayan bir kullanıcı profilini kullanıcı kaydı biçimine getirir"""
+        return {
+            "id": None,
+            "name": profile.get("name", "Geçici Kullanıcı"),
+            "preferredBudget": profile["preferredBudget"],
+            "preferredRoomType": profile["preferredRoomType"],
+            "requiredCapacity": profile["requiredCapacity"],
+            "preferredAmenities": profile["preferredAmenities"]
+        }
+    
+    def recommend_hotels(self, user_id: int, top_n: int = 5, debug: bool = False,
+                         explain: str = 'none') -> List[Dict[str, Any]]:
+        """
+        Bir kullanıcı için en uygun otelleri önerir
+        Bütçe, oda tipi tercihi ve kapasite gibi kısıtları dikkate alır
+        
+        Args:
+            user_id: Kullanıcı ID'si
+            top_n: Önerilecek otel sayısı
+            debug: Ayrıntılı bilgi gösterme modu
+            explain: Açıklama düzeyi (EXPLAIN_LEVELS); 'none' dışında her öneriye
+                'detailed_explanation' eklenir (sıralamadaki model tahminleri yeniden kullanılır)
+            
+        Returns:
+            Önerilen otellerin listesi
+        """
+        print(f"\n{user_id} ID'li kullanıcı için otel önerileri hazırlanıyor...")
+        start_time = time.time()
+        self._prepare_inference()
+        
+        # Kullanıcı ve otel verileri (bellekteki katalog görüntüsü)
+        with stage_timer('catalog_load'):
+            snapshot = self.catalog.snapshot()
+        
+        try:
+            with stage_timer('feature_lookup'):
+                user_idx = self.dataset.user_id_to_index.get(user_id)
+                user = snapshot.users_by_id.get(user_id)
+                user_features = None if user is None else self._user_feature_vector(user, user_idx)
+            if user is None:
+                print(f"Uyarı: {user_id} ID'li kullanıcı bulunamadı.")
+                return []
+            
+            top_recommendations = self._recommend_for_user(
+                snapshot, user, user_idx, user_features, top_n, debug, explain
+            )
+            
+            print(f"Öneri süresi: {time.time() - start_time:.2f} saniye")
+            return top_recommendations
+            
+        except Exception as e:
+            print(f"Öneri oluşturulurken hata: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return []
+    
+    def recommend_for_profile(self, profile: Dict[str, Any], top_n: int = 5, debug: bool = False,
+                              explain: str = 'none') -> List[Dict[str, Any]]:
+        """
+        Sisteme kayıtlı olmayan bir kullanıcı profili için otel önerir.
+        Profil, eğitimde fit edilmiş ölçekle normalize edilir ve soğuk başlangıç
+        kullanıcı temsiliyle puanlanır; kullanıcı dosyasına yazılmaz.
+        
+        Args:
+            profile: preferredBudget, preferredRoomType, requiredCapacity ve preferredAmenities alanlarını içeren profil
+            top_n: Önerilecek otel sayısı
+            debug: Ayrıntılı bilgi gösterme modu
+            explain: Açıklama düzeyi (EXPLAIN_LEVELS)
+            
+        Returns:
+            Önerilen otellerin listesi
+        """
+        print("\nKayıtlı olmayan kullanıcı profili için otel önerileri hazırlanıyor...")
+        start_time = time.time()
+        self._prepare_inference()
+        
+        with stage_timer('catalog_load'):
+            snapshot = self.catalog.snapshot()
+        
+        try:
+            with stage_timer('feature_lookup'):
+                user = self._profile_to_user(profile)
+                user_features = self.dataset.user_scaler.transform([user_feature_row(user)])[0]
+            
+            top_recommendations = self._recommend_for_user(snapshot, user, None, user_features, top_n, debug, explain)
+            
+            print(f"Öneri süresi: {time.time() - start_time:.2f} saniye")
+            return top_recommendations
+            
+        except Exception as e:
+            print(f"Öneri oluşturulurken hata: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return []
+    
+    def _recommend_for_user(self, snapshot: CatalogSnapshot, user: Dict[str, Any], user_idx: Optional[int],
+                            user_features: np.ndarray, top_n: int, debug: bool,
+                            explain: str = 'none') -> List[Dict[str, Any]]:
+        """
+        Kullanıcı kaydı ve özellik vektörü verilen bir kullanıcı için oda önerilerini sıralar
+        """
+        print(f"Kullanıcı Bilgileri:")
+        print(f"- İsim: {user['name']}")
+        print(f"- Bütçe: {user['preferredBudget']['min']}-{user['preferredBudget']['max']} TL")
+        print(f"- Tercih edilen oda tipi: {user['preferredRoomType']}")
+        print(f"- Gerekli kapasite: {user['requiredCapacity']}")
+        print(f"- Tercih edilen özellikler: {', '.join(user['preferredAmenities'])}")
+        
+        # Tüm oteller için tek bir batch ile model tahmini al - genel otel puanları
+        table = snapshot.room_table
+        hotel_indices = self._room_table_hotel_indices(table)
+        known_hotels = hotel_indices >= 0
+        
+        base_scores = np.zeros(table.num_hotels, dtype=np.float64)
+        if known_hotels.any():
+            if self.score_batcher is not None:
+                # Eşzamanlı isteklerle aynı ileri geçişte puanlanır (süre toplu işlemde ölçülür)
+                base_scores[known_hotels] = self.score_batcher.submit((self, table, user_idx, user_features))
+            else:
+                with stage_timer('model_forward'):
+                    base_scores[known_hotels] = self._predict_hotel_scores(
+                        user_idx, user_features, hotel_indices[known_hotels]
+                    )
+        
+        return self._rank_for_user(table, known_hotels, base_scores, user, top_n, debug, explain)
+    
+    def _rank_for_user(self, table: RoomTable, known_hotels: np.ndarray, base_scores: np.ndarray,
+                       user: Dict[str, Any], top_n: int, debug: bool,
+                       explain: str = 'none') -> List[Dict[str, Any]]:
+        """
+        Otel bazlı temel puanları verilen bir kullanıcı için oda önerilerini sıralar ve öneri kayıtlarını oluşturur
+        """
+        # Oda bazlı bütçe, oda tipi ve özellik çarpanlarını vektörel olarak uygula
+        with stage_timer('room_adjustment'):
+            room_scores, candidates = score_rooms(table, base_scores, user)
+            candidates &= known_hotels[table.room_hotel]
+        
+        if debug:
+            # Kapasite kontrolü - Kritik bir kısıt olarak kullan
+            insufficient = known_hotels[table.room_hotel] & (table.capacity < user['requiredCapacity'])
+            for position in np.flatnonzero(insufficient):
+                room = table.rooms[position]
+                print(f"Oda {room['id']} kapasitesi yetersiz. Gerekli: {user['requiredCapacity']}, Mevcut: {room['capacity']}")
+        
+        # En yüksek puanlı oda önerilerini seç
+        top_recommendations = []
+        with stage_timer('sort'):
+            ranked = rank_rooms(room_scores, candidates, top_n)
+        for position, room_score in ranked:
+            room = table.rooms[position]
+            hotel = table.hotels[table.room_hotel[position]]
+            base_prediction = float(base_scores[table.room_hotel[position]])
+            
+            top_recommendations.append({
+                'hotel_id': hotel['id'],
+                'hotel_name': hotel['name'],
+                'room_id': room['id'],
+                'room_name': room['name'],
+                'room_type': room['type'],
+                'price': room['pricePerNight'],
+                'city': hotel['city'],
+                'address': hotel['address'],
+                'capacity': room['capacity'],
+                'predicted_rating': room_score,
+                'base_score': round(base_prediction, 2),
+                'score_details': describe_adjustments(room, user) if debug else None,
+                'amenities': {
+                    'wifi': room.get('hasWifi', False),
+                    'tv': room.get('hasTV', False),
+                    'balcony': room.get('hasBalcony', False),
+                    'minibar': room.get('hasMinibar', False)
+                }
+            })
+        
+        # Daha açıklayıcı öneri türü ekle
+        for rec in top_recommendations:
+            match_reasons = []
+            if rec['price'] <= user['preferredBudget']['max'] and rec['price'] >= user['preferredBudget']['min']:
+                match_reasons.append("bütçeye uygun")
+            
+            if rec['room_type'] == user['preferredRoomType']:
+                match_reasons.append("tercih edilen oda tipi")
+            
+            amenities_user_wanted = []
+            for amenity in user['preferredAmenities']:
+                if amenity == 'WiFi' and rec['amenities']['wifi']:
+                    amenities_user_wanted.append("WiFi")
+                elif amenity == 'TV' and rec['amenities']['tv']:
+                    amenities_user_wanted.append("TV")
+                elif amenity == 'Balkon' and rec['amenities']['balcony']:
+                    amenities_user_wanted.append("Balkon")
+                elif amenity == 'Minibar' and rec['amenities']['minibar']:
+                    amenities_user_wanted.append("Minibar")
+            
+            if amenities_user_wanted:
+                match_reasons.append(f"istenen özellikler: {', '.join(amenities_user_wanted)}")
+            
+            if match_reasons:
+                rec['recommendation_type'] = f"Bu oda şu açılardan size uygun: {', '.join(match_reasons)}"
+            else:
+                rec['recommendation_type'] = "Alternatif Öneri"
+        
+        if explain != 'none':
+            # Önerilen oteller için açıklamaları tek geçişte, sıralamadaki tahminlerle üret
+            slots = [int(table.room_hotel[position]) for position, _ in ranked]
+            with stage_timer('explanation'):
+                explanations = self._explain_slots(table, slots, base_scores, candidates, user, explain)
+            for rec, slot in zip(top_recommendations, slots):
+                rec['detailed_explanation'] = explanations[slot]
+        
+        return top_recommendations
+    
+    def recommend_hotels_batch(self, user_ids: Sequence[int], top_n: int = 5) -> Dict[int, Optional[List[Dict[str, Any]]]]:
+        """
+        Birden fazla kullanıcı için otel önerilerini toplu olarak hazırlar
+        
+        Args:
+            user_ids: Kullanıcı ID'leri
+            top_n: Kullanıcı başına önerilecek otel sayısı
+            
+        Returns:
+            Kullanıcı ID -> öneri listesi sözlüğü (bulunamayan kullanıcılar için None)
+        """
+        return dict(self.iter_recommendations_batch(user_ids, top_n))
+    
+    def iter_recommendations_batch(self, user_ids: Sequence[int], top_n: int = 5,
+                                   chunk_size: int = 256) -> Iterator[Tuple[int, Optional[List[Dict[str, Any]]]]]:
+        """
+        Kullanıcılar x oteller puan bloğunu parçalar halinde batch ileri geçişle hesaplayıp
+        her kullanıcı için önerileri sırayla üretir (akış halinde yanıt için)
+        
+        Tüm istek boyunca aynı katalog görüntüsü kullanılır. Sonuçlar recommend_hotels ile
+        aynıdır; kullanıcı başına bilgi çıktısı yazılmaz.
+        
+        Args:
+            user_ids: Kullanıcı ID'leri
+            top_n: Kullanıcı başına önerilecek otel sayısı
+            chunk_size: Tek seferde puanlanacak kullanıcı sayısı
+            
+        Yields:
+            (kullanıcı ID, öneri listesi) - kullanıcı bulunamazsa öneri listesi None
+        """
+        start_time = time.time()
+        self._prepare_inference()
+        
+        with stage_timer('catalog_load'):
+            snapshot = self.catalog.snapshot()
+        table = snapshot.room_table
+        hotel_indices = self._room_table_hotel_indices(table)
+        known_hotels = hotel_indices >= 0
+        known_hotel_indices = hotel_indices[known_hotels]
+        
+        user_ids = list(user_ids)
+        for chunk_start in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[chunk_start:chunk_start + chunk_size]
+            
+            # Toplu yolda özellik ve ileri geçiş süreleri kullanıcı başına değil parça başına ölçülür
+            with stage_timer('feature_lookup'):
+                users = []
+                user_indices = []
+                for user_id in chunk:
+                    user = snapshot.users_by_id.get(user_id)
+                    if user is not None:
+                        users.append(user)
+                        user_indices.append(self.dataset.user_id_to_index.get(user_id))
+                
+                if users:
+                    user_features = np.stack([
+                        self._user_feature_vector(user, user_idx) for user, user_idx in zip(users, user_indices)
+                    ])
+            
+            if users:
+                with stage_timer('model_forward'):
+                    block = self._predict_score_block(user_indices, user_features, known_hotel_indices)
+            
+            row = 0
+            for user_id in chunk:
+                user = snapshot.users_by_id.get(user_id)
+                if user is None:
+                    yield user_id, None
+                    continue
+                
+                base_scores = np.zeros(table.num_hotels, dtype=np.float64)
+                base_scores[known_hotels] = block[row]
+                row += 1
+                yield user_id, self._rank_for_user(table, known_hotels, base_scores, user, top_n, False)
+        
+        print(f"{len(user_ids)} kullanıcı için toplu öneri süresi: {time.time() - start_time:.2f} saniye")
+    
+    def explain_many(self, user_id: int, hotel_ids: Sequence[int], level: str = 'full') -> Dict[int, Dict[str, Any]]:
+        """
+        Bir kullanıcı için birden fazla oteli tek geçişte açıklar: tüm oteller tek bir
+        ileri geçişle puanlanır ve yalnızca aday odalar (kapasitesi yeterli ve müsait)
+        değerlendirilir.
+        
+        Args:
+            user_id: Kullanıcı ID'si
+            hotel_ids: Açıklanacak otel ID'leri
+            level: Açıklama düzeyi ('summary' veya 'full')
+            
+        Returns:
+            Otel ID -> öneri açıklaması sözlüğü (bulunamayan oteller için hata kaydı)
+        """
+        try:
+            self._prepare_inference()
+            with stage_timer('catalog_load'):
+                snapshot = self.catalog.snapshot()
+            
+            with stage_timer('feature_lookup'):
+                user = snapshot.users_by_id.get(user_id)
+                user_idx = self.dataset.user_id_to_index.get(user_id)
+                user_features = self._user_feature_vector(user, user_idx) if user else None
+            if not user:
+                return {hotel_id: {"error": "Kullanıcı veya otel verileri bulunamadı"} for hotel_id in hotel_ids}
+            
+            return self._explain_many_for_user(snapshot, user, user_idx, user_features, hotel_ids, level)
+            
+        except Exception as e:
+            return {hotel_id: {"error": str(e)} for hotel_id in hotel_ids}
+    
+    def explain_many_for_profile(self, profile: Dict[str, Any], hotel_ids: Sequence[int],
+                                 level: str = 'full') -> Dict[int, Dict[str, Any]]:
+        """
+        Kayıtlı olmayan bir kullanıcı profili için birden fazla oteli tek geçişte açıklar
+        
+        Args:
+            profile: recommend_for_profile ile aynı biçimde kullanıcı profili
+            hotel_ids: Açıklanacak otel ID'leri
+            level: Açıklama düzeyi ('summary' veya 'full')
+            
+        Returns:
+            Otel ID -> öneri açıklaması sözlüğü (bulunamayan oteller için hata kaydı)
+        """
+        try:
+            self._prepare_inference()
+            with stage_timer('catalog_load'):
+                snapshot = self.catalog.snapshot()
+            
+            with stage_timer('feature_lookup'):
+                user = self._profile_to_user(profile)
+                user_features = self.dataset.user_scaler.transform([user_feature_row(user)])[0]
+            return self._explain_many_for_user(snapshot, user, None, user_features, hotel_ids, level)
+            
+        except Exception as e:
+            return {hotel_id: {"error": str(e)} for hotel_id in hotel_ids}
+    
+    def _explain_many_for_user(self, snapshot: CatalogSnapshot, user: Dict[str, Any], user_idx: Optional[int],
+                               user_features: np.ndarray, hotel_ids: Sequence[int],
+                               level: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Kullanıcı kaydı ve özellik vektörü verilen bir kullanıcı için otelleri tek ileri geçişle açıklar
+        """
+        table = snapshot.room_table
+        hotel_indices = self._room_table_hotel_indices(table)
+        slot_by_id = {hotel_id: slot for slot, hotel_id in enumerate(table.hotel_ids)}
+        
+        # Modelde ve oda tablosunda bulunan oteller
+        slots = []
+        for hotel_id in hotel_ids:
+            slot = slot_by_id.get(hotel_id)
+            if slot is not None and hotel_indices[slot] >= 0:
+                slots.append(slot)
+        slots = sorted(set(slots))
+        
+        base_scores = np.zeros(table.num_hotels, dtype=np.float64)
+        if slots:
+            with stage_timer('model_forward'):
+                base_scores[slots] = self._predict_hotel_scores(user_idx, user_features, hotel_indices[slots])
+        with stage_timer('room_adjustment'):
+            _, candidates = score_rooms(table, base_scores, user)
+        with stage_timer('explanation'):
+            explanations = self._explain_slots(table, slots, base_scores, candidates, user, level)
+        
+        results = {}
+        for hotel_id in hotel_ids:
+            slot = slot_by_id.get(hotel_id)
+            if slot in explanations:
+                results[hotel_id] = explanations[slot]
+            else:
+                results[hotel_id] = {"error": "Kullanıcı veya otel bulunamadı"}
+        return results
+    
+    def _explain_slots(self, table: RoomTable, slots: Sequence[int], base_scores: np.ndarray,
+                       candidates: np.ndarray, user: Dict[str, Any], level: str = 'full') -> Dict[int, Dict[str, Any]]:
+        """
+        Oda tablosundaki oteller için, verilen temel puanlarla ve yalnızca aday odaları
+        değerlendirerek açıklama üretir (her otel bir kez açıklanır)
+        
+        Returns:
+            Tablodaki otel sırası -> öneri açıklaması sözlüğü
+        """
+        explanations = {}
+        for slot in slots:
+            if slot in explanations:
+                continue
+            start, end = table.room_offsets[slot], table.room_offsets[slot + 1]
+            rooms = [table.rooms[position] for position in range(start, end) if candidates[position]]
+            explanations[slot] = self._explain_rooms(
+                user, table.hotels[slot], rooms, float(base_scores[slot]), include_room_matches=(level == 'full')
+            )
+        return explanations
+    
+    def explain_recommendation(self, user_id: int, hotel_id: int) -> Dict[str, Any]:
+        """
+        Belirli bir otel önerisini ayrıntılı şekilde açıklar
+        
+        Args:
+            user_id: Kullanıcı ID'si
+            hotel_id: Otel ID'si
+            
+        Returns:
+            Öneri açıklaması
+        """
+        try:
+            self._prepare_inference()
+            
+            # Kullanıcı ve otel verileri (bellekteki katalog görüntüsü)
+            snapshot = self.catalog.snapshot()
+            
+            # Kullanıcı ve otel indekslerini ve özelliklerini al
+            user_idx = self.dataset.user_id_to_index.get(user_id)
+            hotel_idx = self.dataset.hotel_id_to_index.get(hotel_id)
+            
+            if hotel_idx is None:
+                return {"error": "Kullanıcı veya otel bulunamadı"}
+            
+            user = snapshot.users_by_id.get(user_id)
+            hotel = snapshot.hotels_by_id.get(hotel_id)
+            
+            if not user or not hotel:
+                return {"error": "Kullanıcı veya otel verileri bulunamadı"}
+            
+            return self._explain_hotel(user, user_idx, self._user_feature_vector(user, user_idx), hotel, hotel_idx)
+            
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def explain_for_profile(self, profile: Dict[str, Any], hotel_id: int) -> Dict[str, Any]:
+        """
+        Kayıtlı olmayan bir kullanıcı profili için otel önerisini açıklar
+        
+        Args:
+            profile: recommend_for_profile ile aynı biçimde kullanıcı profili
+            hotel_id: Otel ID'si
+            
+        Returns:
+            Öneri açıklaması
+        """
+        try:
+            self._prepare_inference()
+            
+            snapshot = self.catalog.snapshot()
+            hotel_idx = self.dataset.hotel_id_to_index.get(hotel_id)
+            hotel = snapshot.hotels_by_id.get(hotel_id)
+            
+            if hotel_idx is None or not hotel:
+                return {"error": "Otel bulunamadı"}
+            
+            user = self._profile_to_user(profile)
+            user_features = self.dataset.user_scaler.transform([user_feature_row(user)])[0]
+            
+            return self._explain_hotel(user, None, user_features, hotel, hotel_idx)
+            
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def _explain_hotel(self, user: Dict[str, Any], user_idx: Optional[int], user_features: np.ndarray,
+                       hotel: Dict[str, Any], hotel_idx: int) -> Dict[str, Any]:
+        """
+        Kullanıcı ve otel kayıtları verilen bir öneri için açıklama üretir
+        """
+        # Model kullanarak tahmini puanı al
+        predicted_score = float(self._predict_hotel_scores(user_idx, user_features, np.array([hotel_idx]))[0])
+        
+        return self._explain_rooms(user, hotel, hotel['rooms'], predicted_score)
+    
+    def _explain_rooms(self, user: Dict[str, Any], hotel: Dict[str, Any], rooms: Sequence[Dict[str, Any]],
+                       predicted_score: float, include_room_matches: bool = True) -> Dict[str, Any]:
+        """
+        Otelin verilen odalarını kullanıcının tercihleriyle karşılaştırarak açıklama üretir
+        
+        Args:
+            include_room_matches: Tüm odaların eşleşme listesinin ('room_matches') eklenip eklenmeyeceği
+        """
+        # Kullanıcı ve otel özelliklerinin karşılaştırmalı analizi
+        user_budget_min = user['preferredBudget']['min']
+        user_budget_max = user['preferredBudget']['max']
+        user_preferred_type = user['preferredRoomType']
+        user_required_capacity = user['requiredCapacity']
+        user_preferred_amenities = user['preferredAmenities']
+        
+        # En iyi eşleşen odayı bul
+        best_matching_room = None
+        best_room_score = 0
+        
+        room_matches = []
+        
+        for room in rooms:
+            score = 0
+            matches = []
+            mismatches = []
+            
+            # Bütçe uyumu
+            if user_budget_min <= room['pricePerNight'] <= user_budget_max:
+                score += 2
+                matches.append(f"Oda fiyatı ({room['pricePerNight']} TL) bütçenize ({user_budget_min}-{user_budget_max} TL) uygun")
+            elif room['pricePerNight'] < user_budget_min:
+                score += 1
+                matches.append(f"Oda fiyatı ({room['pricePerNight']} TL) bütçenizin altında")
+            else:
+                mismatches.append(f"Oda fiyatı ({room['pricePerNight']} TL) bütçenizin ({user_budget_max} TL) üstünde")
+            
+            # Oda tipi
+            if room['type'] == user_preferred_type:
+                score += 2
+                matches.append(f"Tercih ettiğiniz oda tipi: {user_preferred_type}")
+            else:
+                mismatches.append(f"Farklı oda tipi: {room['type']} (tercih: {user_preferred_type})")
+            
+            # Kapasite
+            if room['capacity'] >= user_required_capacity:
+                score += 1
+                matches.append(f"Yeterli kapasite: {room['capacity']} kişilik (ihtiyaç: {user_required_capacity})")
+            else:
+                score -= 3  # Kapasite çok önemli bir kriter
+                mismatches.append(f"Yetersiz kapasite: {room['capacity']} kişilik (ihtiyaç: {user_required_capacity})")
+            
+            # Özellikler
+            for amenity in user_preferred_amenities:
+                if amenity == 'WiFi' and room.get('hasWifi', False):
+                    score += 0.5
+                    matches.append("WiFi mevcut")
+                elif amenity == 'TV' and room.get('hasTV', False):
+                    score += 0.5
+                    matches.append("TV mevcut")
+                elif amenity == 'Balkon' and room.get('hasBalcony', False):
+                    score += 0.5
+                    matches.append("Balkon mevcut")
+                elif amenity == 'Minibar' and room.get('hasMinibar', False):
+                    score += 0.5
+                    matches.append("Minibar mevcut")
+                else:
+                    if amenity == 'WiFi':
+                        mismatches.append("WiFi mevcut değil")
+                    elif amenity == 'TV':
+                        mismatches.append("TV mevcut değil")
+                    elif amenity == 'Balkon':
+                        mismatches.append("Balkon mevcut değil")
+                    elif amenity == 'Minibar':
+                        mismatches.append("Minibar mevcut değil")
+            
+            room_matches.append({
+                "room_id": room['id'],
+                "room_name": room['name'],
+                "room_type": room['type'],
+                "capacity": room['capacity'],
+                "price": room['pricePerNight'],
+                "score": score,
+                "matches": matches,
+                "mismatches": mismatches
+            })
+            
+            if score > best_room_score:
+                best_room_score = score
+                best_matching_room = room
+        
+        # Açıklama metni oluştur
+        if best_matching_room:
+            best_room = next((r for r in room_matches if r["room_id"] == best_matching_room['id']), None)
+            
+            explanation_text = f"Bu otel sizin için {predicted_score:.1f}/5.0 puan ile değerlendirildi. "
+            
+            if best_room["matches"]:
+                explanation_text += f"En iyi eşleşen oda '{best_matching_room['name']}', çünkü: "
+                explanation_text += ", ".join(best_room["matches"]) + ". "
+            
+            if best_room["mismatches"]:
+                explanation_text += "Dikkat edilmesi gereken noktalar: "
+                explanation_text += ", ".join(best_room["mismatches"]) + "."
+        else:
+            explanation_text = "Bu otelde size uygun bir oda bulunamadı."
+        
+        explanation = {
+            "hotel_name": hotel['name'],
+            "predicted_score": round(predicted_score, 2),
+            "explanation": explanation_text,
+            "best_matching_room": best_matching_room['name'] if best_matching_room else None
+        }
+        if include_room_matches:
+            explanation["room_matches"] = sorted(room_matches, key=lambda x: x["score"], reverse=True)
+        return explanation
@@ -0,0 +1,245 @@
+"""
+Öneri sistemi ölçüm paketi: farklı katalog boyutlarında öneri sisteminin oluşturulma süresi,
+recommend_hotels ve explain_recommendation gecikmeleri (p50/p99), bir eğitim epoch'unun süresi
+ve en yüksek bellek kullanımı ölçülür.
+
+Paket verileri (20 otel x 38 kullanıcı) dışındaki boyutlar için katalog synthetic_catalog ile
+tohumlanmış olarak üretilir ve --data-dir altında saklanır (sonraki çalıştırmalarda yeniden
+kullanılır). Eğitilmiş model yalnızca paket verileri için vardır; diğer boyutlarda model
+rastgele başlatılmış ağırlıklarla ölçülür (gecikme ve bellek için yeterlidir). Her boyut ayrı
+(temiz) bir Python sürecinde ölçülür.
+
+Kullanım:
+    python benchmarks/recommender_benchmark.py --json baseline.json
+    python benchmarks/recommender_benchmark.py --sizes bundled 1k_10k --compare baseline.json
+    python benchmarks/recommender_benchmark.py --input current.json --compare baseline.json --threshold 0.1
+    python benchmarks/recommender_benchmark.py --sizes 10k_100k --spec heavy_catalog.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from synthetic_catalog import catalog_spec_hash, load_catalog_spec, write_catalog
+
+# Boyut adı (otel_kullanıcı) -> (otel sayısı, kullanıcı sayısı); None paket verileri demektir
+SIZES = {
+    'bundled': None,
+    '100_1k': (100, 1_000),
+    '1k_10k': (1_000, 10_000),
+    '10k_100k': (10_000, 100_000),
+    '100k_1m': (100_000, 1_000_000),
+}
+
+# Karşılaştırılan ölçümler (hepsinde düşük değer daha iyidir)
+METRICS = ('construct_s', 'recommend_p50_ms', 'recommend_p99_ms', 'explain_p50_ms', 'explain_p99_ms',
+           'training_data_s', 'epoch_s', 'max_rss_mb')
+
+# Alt süreçte çalışan ölçüm kodu; sonuç tek satır JSON olarak yazdırılır
+PROBE = r'''
+import contextlib, io, json, resource, sys, time
+import numpy as np
+users_file, hotels_file, model_path = sys.argv[1:4]
+options = json.loads(sys.argv[4])
+
+def max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def percentiles_ms(samples):
+    p50, p99 = np.percentile(np.asarray(samples) * 1000, [50, 99])
+    return float(p50), float(p99)
+
+result = {}
+with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    start = time.perf_counter()
+    import torch
+    from improved_recommendation import ImprovedLearningRecommender, TensorBatchIterator, BATCH_SIZE, LEARNING_RATE
+    recommender = ImprovedLearningRecommender(users_file, hotels_file, model_path, options['backend'])
+    result['construct_s'] = time.perf_counter() - start
+    result['construct_max_rss_mb'] = max_rss_mb()
+    recommender.warm_up()
+
+    snapshot = recommender.catalog.snapshot()
+    result['num_users'] = len(snapshot.users)
+    result['num_hotels'] = len(snapshot.hotels)
+    rng = np.random.default_rng(0)
+    user_ids = rng.choice([user['id'] for user in snapshot.users], size=options['requests'])
+    hotel_ids = rng.choice([hotel['id'] for hotel in snapshot.hotels], size=options['requests'])
+
+    latencies = []
+    for user_id in user_ids:
+        request_start = time.perf_counter()
+        recommender.recommend_hotels(int(user_id), top_n=5)
+        latencies.append(time.perf_counter() - request_start)
+    result['recommend_p50_ms'], result['recommend_p99_ms'] = percentiles_ms(latencies)
+
+    latencies = []
+    for user_id, hotel_id in zip(user_ids, hotel_ids):
+        request_start = time.perf_counter()
+        recommender.explain_recommendation(int(user_id), int(hotel_id))
+        latencies.append(time.perf_counter() - request_start)
+    result['explain_p50_ms'], result['explain_p99_ms'] = percentiles_ms(latencies)
+
+    # Sentetik etkileşimler kullanıcı x otel çiftleri kadar olduğundan büyük boyutlarda atlanır
+    if result['num_users'] * result['num_hotels'] <= options['max_train_pairs']:
+        torch.manual_seed(0)
+        stage_start = time.perf_counter()
+        recommender.dataset.ensure_training_data()
+        result['training_data_s'] = time.perf_counter() - stage_start
+
+        model = recommender.model
+        loader = TensorBatchIterator(recommender.dataset.training_tensors(recommender.dataset.device),
+                                     batch_size=BATCH_SIZE, shuffle=True)
+        optimizer = torch.optim.Adam(model.parameters(), lr=LEARNING_RATE, weight_decay=1e-5)
+        criterion = torch.nn.MSELoss()
+        model.train()
+        stage_start = time.perf_counter()
+        for batch in loader:
+            optimizer.zero_grad()
+            predictions = model(batch['user_idx'], batch['hotel_idx'], batch['user_features'], batch['hotel_features'])
+            loss = criterion(predictions, batch['rating'])
+            loss.backward()
+            torch.nn.utils.clip_grad_norm_(model.parameters(), max_norm=1.0)
+            optimizer.step()
+        result['epoch_s'] = time.perf_counter() - stage_start
+
+result['max_rss_mb'] = max_rss_mb()
+print(json.dumps(result))
+'''
+
+
+def catalog_files(size: str, args):
+    """Boyutun kullanıcı/otel dosyalarını ve model dosyasını döndürür (gerekirse kataloğu üretir)"""
+    dimensions = SIZES[size]
+    if dimensions is None:
+        return args.users, args.hotels, args.model
+
+    # Dosya adları tohum ve katalog tanımının özetini içerir; farklı tanımlar birbirini ezmez
+    num_hotels, num_users = dimensions
+    suffix = f'seed{args.seed}_{catalog_spec_hash(args.catalog_spec)}'
+    users_file = os.path.join(args.data_dir, f'users_{num_users}_{suffix}.json')
+    hotels_file = os.path.join(args.data_dir, f'hotels_{num_hotels}_{suffix}.json')
+    if not (os.path.exists(users_file) and os.path.exists(hotels_file)):
+        start = time.time()
+        print(f"{size}: sentetik katalog üretiliyor ({num_hotels} otel, {num_users} kullanıcı)...")
+        write_catalog(users_file, hotels_file, num_hotels, num_users, seed=args.seed, spec=args.catalog_spec)
+        print(f"{size}: katalog {time.time() - start:.1f} saniyede üretildi.")
+
+    # Eğitilmiş model yok; var olmayan bir yol verilerek rastgele başlatılmış model kullanılır
+    return users_file, hotels_file, os.path.join(args.data_dir, f'untrained_{size}.pth')
+
+
+def run_size(size: str, args) -> dict:
+    """Bir katalog boyutunu temiz bir süreçte ölçer"""
+    users_file, hotels_file, model_path = catalog_files(size, args)
+    options = {'backend': args.backend, 'requests': args.requests, 'max_train_pairs': args.max_train_pairs}
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE, users_file, hotels_file, model_path, json.dumps(options)],
+        cwd=BASE_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{size} ölçümü başarısız oldu:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Sonuçları temel ölçümle karşılaştırır ve tabloyu yazdırır
+
+    Returns:
+        Eşiği aşan gerilemeler: (boyut, ölçüm, temel değer, yeni değer)
+    """
+    regressions = []
+    print(f"\n{'Boyut':<11}{'Ölçüm':<20}{'Temel':>12}{'Yeni':>12}{'Değişim':>10}")
+    for size, result in current['results'].items():
+        base = baseline['results'].get(size)
+        if base is None:
+            continue
+        for metric in METRICS:
+            if metric not in result or metric not in base or not base[metric]:
+                continue
+            change = result[metric] / base[metric] - 1
+            flag = ''
+            if change > threshold:
+                flag = '  GERİLEME'
+                regressions.append((size, metric, base[metric], result[metric]))
+            print(f"{size:<11}{metric:<20}{base[metric]:>12.3f}{result[metric]:>12.3f}{change:>+9.1%}{flag}")
+    return regressions
+
+
+def print_results(results: dict):
+    print(f"{'Boyut':<11}{'Otel':>8}{'Kullanıcı':>11}{'Oluşturma':>11}{'Öneri p50/p99':>19}"
+          f"{'Açıklama p50/p99':>19}{'Epoch':>10}{'Maks. RSS':>11}")
+    for size, result in results.items():
+        epoch = f"{result['epoch_s']:.2f} s" if 'epoch_s' in result else '-'
+        print(f"{size:<11}{result['num_hotels']:>8}{result['num_users']:>11}{result['construct_s']:>9.2f} s"
+              f"{result['recommend_p50_ms']:>8.2f}/{result['recommend_p99_ms']:.2f} ms"
+              f"{result['explain_p50_ms']:>8.2f}/{result['explain_p99_ms']:.2f} ms"
+              f"{epoch:>10}{result['max_rss_mb']:>8.0f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Öneri sistemi ölçüm paketi")
+    parser.add_argument('--sizes', nargs='+', default=['bundled', '100_1k', '1k_10k'], choices=list(SIZES),
+                        help="Ölçülecek katalog boyutları")
+    parser.add_argument('--users', default='datas/expanded_users.json')
+    parser.add_argument('--hotels', default='datas/expanded_hotels.json')
+    parser.add_argument('--model', default='improved_hotel_recommender_model.pth')
+    parser.add_argument('--backend', default='eager', help="Çıkarım modeli (eager, folded, torchscript, int8)")
+    parser.add_argument('--data-dir', default='datas/synthetic', help="Sentetik katalogların saklandığı dizin")
+    parser.add_argument('--seed', type=int, default=0, help="Sentetik katalog tohumu")
+    parser.add_argument('--spec', help="Sentetik katalog dağılımlarını değiştiren JSON tanımı (synthetic_catalog)")
+    parser.add_argument('--requests', type=int, default=200, help="Gecikme ölçümündeki istek sayısı")
+    parser.add_argument('--max-train-pairs', type=int, default=500_000,
+                        help="Eğitim epoch'u ölçülecek en büyük kullanıcı x otel çifti sayısı")
+    parser.add_argument('--json', metavar='PATH', help="Sonuçları JSON olarak bu dosyaya yaz")
+    parser.add_argument('--input', metavar='PATH', help="Ölçüm yapmadan bu JSON sonuçlarını kullan")
+    parser.add_argument('--compare', metavar='BASELINE', help="Sonuçları bu temel ölçümle karşılaştır")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Gerileme sayılacak en küçük göreli artış (0.2 = %%20)")
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, encoding='utf-8') as f:
+            current = json.load(f)
+    else:
+        args.data_dir = os.path.join(BASE_DIR, args.data_dir)
+        args.catalog_spec = load_catalog_spec(args.spec)
+        results = {}
+        for size in args.sizes:
+            print(f"{size}: ölçülüyor...")
+            results[size] = run_size(size, args)
+        current = {
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'environment': {'python': platform.python_version(), 'machine': platform.machine(),
+                            'cpu_count': os.cpu_count()},
+            'options': {'backend': args.backend, 'requests': args.requests, 'seed': args.seed,
+                        'catalog_spec': catalog_spec_hash(args.catalog_spec)},
+            'results': results,
+        }
+
+    print_results(current['results'])
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f"Sonuçlar {args.json} dosyasına yazıldı.")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} ölçümde %{args.threshold * 100:.0f} üzerinde gerileme var.")
+            sys.exit(1)
+        print("\nGerileme yok.")
+
+
+if __name__ == '__main__':
+    main()
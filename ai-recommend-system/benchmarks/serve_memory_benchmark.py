@@ -0,0 +1,118 @@
+"""
+Ön-çatallı sunumun (serve.py) işçi sayısına göre bellek kullanımı ölçümü (yalnızca Linux).
+
+Her işçi sayısı için sunucu başlatılır, istekler gönderilerek işçiler ısıtılır ve ardından
+ana süreç ile işçilerin RSS, PSS (paylaşılan sayfalar süreçlere bölünerek) ve özel bellek
+(USS) toplamları /proc/<pid>/smaps_rollup üzerinden raporlanır.
+
+Kullanım:
+    python benchmarks/serve_memory_benchmark.py --workers 1 2 4 8
+    INFERENCE_BACKEND=numpy python benchmarks/serve_memory_benchmark.py --json serve_memory.json
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def memory_kb(pid: int) -> dict:
+    """Sürecin RSS, PSS ve özel bellek (USS) değerleri (kB)"""
+    values = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(':'):
+                values[parts[0][:-1]] = int(parts[1])
+    return {
+        'rss': values.get('Rss', 0),
+        'pss': values.get('Pss', 0),
+        'uss': values.get('Private_Clean', 0) + values.get('Private_Dirty', 0),
+    }
+
+
+def child_pids(pid: int) -> list:
+    with open(f'/proc/{pid}/task/{pid}/children') as f:
+        return [int(child) for child in f.read().split()]
+
+
+def post_json(url: str, payload: dict):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode('utf-8'),
+                                     headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        response.read()
+
+
+def wait_until_ready(url: str, process: subprocess.Popen, timeout: float = 120.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("Sunucu başlatılamadı")
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("Sunucu zamanında hazır olmadı")
+
+
+def measure(workers: int, args) -> dict:
+    """Verilen işçi sayısıyla sunucuyu başlatır, ısıtır ve bellek kullanımını ölçer"""
+    base_url = f'http://127.0.0.1:{args.port}'
+    env = dict(os.environ, MODEL_WATCH_INTERVAL='0')
+    process = subprocess.Popen(
+        [sys.executable, 'serve.py', '--host', '127.0.0.1', '--port', str(args.port),
+         '--workers', str(workers), '--torch-threads', str(args.torch_threads)],
+        cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_until_ready(f'{base_url}/api/users', process)
+        # İstekler çekirdek tarafından işçilere dağıtılır; her işçinin ısınması için yeterince gönder
+        for i in range(args.requests_per_worker * workers):
+            post_json(f'{base_url}/api/recommend', {'user_id': 1 + i % args.num_users, 'top_n': 5})
+
+        master = memory_kb(process.pid)
+        worker_memory = [memory_kb(pid) for pid in child_pids(process.pid)]
+        total = {key: master[key] + sum(worker[key] for worker in worker_memory) for key in master}
+        return {
+            'workers': workers,
+            'master_mb': {key: value / 1024 for key, value in master.items()},
+            'worker_uss_mb': [worker['uss'] / 1024 for worker in worker_memory],
+            'total_mb': {key: value / 1024 for key, value in total.items()},
+        }
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ön-çatallı sunumun işçi sayısına göre bellek kullanımı")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--port', type=int, default=5099)
+    parser.add_argument('--torch-threads', type=int, default=1)
+    parser.add_argument('--requests-per-worker', type=int, default=20)
+    parser.add_argument('--num-users', type=int, default=20, help="İsteklerde kullanılacak kullanıcı ID aralığı")
+    parser.add_argument('--json', metavar='PATH', help="Sonuçları JSON olarak bu dosyaya yaz")
+    args = parser.parse_args()
+
+    results = [measure(workers, args) for workers in args.workers]
+
+    print(f"{'İşçi':>5}{'Toplam RSS':>13}{'Toplam PSS':>13}{'Ana süreç PSS':>15}{'İşçi USS (ort.)':>17}")
+    for result in results:
+        worker_uss = result['worker_uss_mb']
+        print(f"{result['workers']:>5}{result['total_mb']['rss']:>10.0f} MB{result['total_mb']['pss']:>10.0f} MB"
+              f"{result['master_mb']['pss']:>12.0f} MB{sum(worker_uss) / max(len(worker_uss), 1):>14.1f} MB")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'results': results}, f, indent=2)
+        print(f"Sonuçlar {args.json} dosyasına yazıldı.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Soğuk başlangıç süresi ölçümü: her ölçüm ayrı (temiz) bir Python sürecinde yapılır ve
+modülün içe aktarılma süresi, öneri sisteminin oluşturulma süresi, ilk önerinin süresi
+(time-to-first-recommendation) ile yüklenen ağır kütüphaneler raporlanır.
+
+Kullanım:
+    python benchmarks/startup_benchmark.py --repeat 5
+    python benchmarks/startup_benchmark.py --backends eager numpy --json startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Sunum yolunda yüklenmemesi gereken (ya da ne kadar yüklendiği izlenen) kütüphaneler
+HEAVY_MODULES = ('torch', 'matplotlib', 'sklearn', 'pandas', 'tqdm')
+
+# Alt süreçte çalışan ölçüm kodu; sonuç tek satır JSON olarak yazdırılır
+PROBE = '''
+import contextlib, io, json, os, resource, sys, time
+backend, users_file, hotels_file, model_path, numpy_model_path, user_id = sys.argv[1:7]
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    if backend == 'numpy':
+        from numpy_inference import NumpyRecommender
+    else:
+        from improved_recommendation import ImprovedLearningRecommender
+    imported = time.perf_counter()
+    if backend == 'numpy':
+        recommender = NumpyRecommender(users_file, hotels_file, numpy_model_path)
+    else:
+        recommender = ImprovedLearningRecommender(users_file, hotels_file, model_path, backend)
+    constructed = time.perf_counter()
+    recommendations = recommender.recommend_hotels(int(user_id), top_n=5)
+    first = time.perf_counter()
+print(json.dumps({
+    'import_s': imported - start,
+    'construct_s': constructed - imported,
+    'first_recommendation_s': first - constructed,
+    'time_to_first_recommendation_s': first - start,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'recommendations': len(recommendations),
+    'loaded_modules': [name for name in %r if name in sys.modules],
+}))
+''' % (HEAVY_MODULES,)
+
+
+def run_probe(backend: str, args) -> dict:
+    """Ölçüm kodunu temiz bir süreçte çalıştırır ve sonucunu döndürür"""
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE, backend, args.users, args.hotels, args.model, args.numpy_model,
+         str(args.user_id)],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soğuk başlangıç ve ilk öneri süresi ölçümü")
+    parser.add_argument('--users', default='datas/expanded_users.json')
+    parser.add_argument('--hotels', default='datas/expanded_hotels.json')
+    parser.add_argument('--model', default='improved_hotel_recommender_model.pth')
+    parser.add_argument('--numpy-model', default='improved_hotel_recommender_model.npz')
+    parser.add_argument('--user-id', type=int, default=1)
+    parser.add_argument('--backends', nargs='+', default=['eager', 'numpy'],
+                        help="Ölçülecek çıkarım modelleri (eager, folded, torchscript, int8, numpy)")
+    parser.add_argument('--repeat', type=int, default=3, help="Her model için ölçüm sayısı (medyan raporlanır)")
+    parser.add_argument('--json', metavar='PATH', help="Sonuçları JSON olarak bu dosyaya yaz")
+    args = parser.parse_args()
+
+    results = {}
+    for backend in args.backends:
+        if backend == 'numpy' and not os.path.exists(os.path.join(BASE_DIR, args.numpy_model)):
+            print(f"{backend}: {args.numpy_model} bulunamadı, atlanıyor "
+                  "(python model_export.py --export-npz ile oluşturulur)")
+            continue
+        runs = [run_probe(backend, args) for _ in range(args.repeat)]
+        results[backend] = {
+            key: statistics.median(run[key] for run in runs)
+            for key in ('import_s', 'construct_s', 'first_recommendation_s',
+                        'time_to_first_recommendation_s', 'max_rss_mb')
+        }
+        results[backend]['loaded_modules'] = runs[-1]['loaded_modules']
+
+    print(f"{'Model':<13}{'İçe aktarma':>13}{'Oluşturma':>11}{'İlk öneri':>11}{'Toplam':>10}{'Maks. RSS':>12}  Yüklenen")
+    for backend, result in results.items():
+        print(f"{backend:<13}{result['import_s']:>11.2f} s{result['construct_s']:>9.2f} s"
+              f"{result['first_recommendation_s'] * 1000:>8.1f} ms{result['time_to_first_recommendation_s']:>8.2f} s"
+              f"{result['max_rss_mb']:>9.0f} MB  {', '.join(result['loaded_modules']) or '-'}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'repeat': args.repeat, 'results': results}, f, indent=2)
+        print(f"Sonuçlar {args.json} dosyasına yazıldı.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+import threading
+from types import MappingProxyType
+from typing import Dict, Tuple, Any, Optional
+
+from compiled_catalog import CompiledCatalog, default_cache_dir, load_or_build_compiled
+from scoring_engine import RoomTable
+
+
+def _index_by_id(records) -> Dict[Any, Dict[str, Any]]:
+    """ID -> kayıt indeksi oluşturur (aynı ID birden fazla kez geçerse ilk kayıt kullanılır)"""
+    index = {}
+    for record in records:
+        index.setdefault(record['id'], record)
+    return index
+
+
+class CatalogSnapshot:
+    """
+    Kullanıcı ve otel verilerinin değişmez (immutable) bellek içi görüntüsü.
+
+    Kayıt listeleri tuple, indeksler salt okunur sözlük olarak tutulur. Kayıtların
+    kendisi JSON'dan gelen sözlüklerdir ve paylaşıldıkları için değiştirilmemelidir.
+    Kayıtlardan derlenen diziler (özellik matrisleri, oda tablosu) compiled ve room_table
+    alanlarındadır.
+    """
+
+    __slots__ = ('version', 'users', 'hotels', 'users_by_id', 'hotels_by_id',
+                 'room_table', 'users_hash', 'hotels_hash', 'compiled')
+
+    def __init__(self, version: int, users, hotels, users_hash: str, hotels_hash: str,
+                 compiled: CompiledCatalog = None, room_table: RoomTable = None):
+        """
+        Args:
+            version: Görüntünün sürüm numarası (içerik her değiştiğinde artar)
+            users: Kullanıcı kayıtları
+            hotels: Otel kayıtları
+            users_hash: Kullanıcı dosyasının içerik özeti (sha256)
+            hotels_hash: Otel dosyasının içerik özeti (sha256)
+            compiled: Kayıtlardan derlenmiş diziler (verilmezse kayıtlardan hesaplanır)
+            room_table: Aynı kayıtların oda tablosu (verilmezse kayıtlardan oluşturulur)
+        """
+        object.__setattr__(self, 'version', version)
+        object.__setattr__(self, 'users', tuple(users))
+        object.__setattr__(self, 'hotels', tuple(hotels))
+        object.__setattr__(self, 'users_by_id', MappingProxyType(_index_by_id(self.users)))
+        object.__setattr__(self, 'hotels_by_id', MappingProxyType(_index_by_id(self.hotels)))
+        if room_table is None:
+            room_table = RoomTable(self.hotels, compiled.room_columns if compiled is not None else None)
+        if compiled is None:
+            compiled = CompiledCatalog.build(self.users, self.hotels, room_table)
+        object.__setattr__(self, 'room_table', room_table)
+        object.__setattr__(self, 'users_hash', users_hash)
+        object.__setattr__(self, 'hotels_hash', hotels_hash)
+        object.__setattr__(self, 'compiled', compiled)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CatalogSnapshot değiştirilemez")
+
+    def __delattr__(self, name):
+        raise AttributeError("CatalogSnapshot değiştirilemez")
+
+
+class CatalogStore:
+    """
+    Kullanıcı ve otel JSON dosyalarını bellekte tutan, yalnızca dosyalar
+    değiştiğinde yeniden yükleyen katalog deposu.
+
+    Her snapshot() çağrısında dosyaların mtime/boyut bilgisi kontrol edilir; bunlar
+    değiştiyse içerik özeti hesaplanır ve yalnızca içerik gerçekten değiştiyse
+    dosyalar yeniden ayrıştırılıp sürüm numarası artırılır.
+
+    Kayıtlardan derlenen diziler (compiled_catalog) içerik özetleriyle anahtarlanmış bir
+    .npz önbelleğinde tutulur; özellik çıkarımı ve oda tablosu yalnızca veri değiştiğinde
+    yeniden hesaplanır.
+    """
+
+    def __init__(self, users_file: str, hotels_file: str, cache_dir: Optional[str] = ''):
+        """
+        Args:
+            users_file: Kullanıcı verileri JSON dosyasının yolu
+            hotels_file: Otel verileri JSON dosyasının yolu
+            cache_dir: Derlenmiş katalog önbelleğinin dizini (None ise önbellek kullanılmaz,
+                verilmezse default_cache_dir())
+        """
+        self.users_file = users_file
+        self.hotels_file = hotels_file
+        self.cache_dir = default_cache_dir(users_file) if cache_dir == '' else cache_dir
+
+        self._lock = threading.Lock()
+        # (snapshot, (kullanıcı dosyası damgası, otel dosyası damgası))
+        self._state: Optional[Tuple[CatalogSnapshot, Tuple[Any, Any]]] = None
+
+    @staticmethod
+    def _stat_stamp(path: str) -> Tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _read(path: str) -> Tuple[bytes, str]:
+        with open(path, 'rb') as f:
+            content = f.read()
+        return content, hashlib.sha256(content).hexdigest()
+
+    def snapshot(self) -> CatalogSnapshot:
+        """
+        Güncel katalog görüntüsünü döndürür, dosyalar değiştiyse önce yeniden yükler
+
+        Returns:
+            Değişmez katalog görüntüsü
+        """
+        stamps = (self._stat_stamp(self.users_file), self._stat_stamp(self.hotels_file))
+        state = self._state
+        if state is not None and state[1] == stamps:
+            return state[0]
+
+        with self._lock:
+            # Başka bir iş parçacığı bu arada yüklemiş olabilir
+            state = self._state
+            if state is not None and state[1] == stamps:
+                return state[0]
+
+            users_content, users_hash = self._read(self.users_file)
+            hotels_content, hotels_hash = self._read(self.hotels_file)
+
+            current = state[0] if state is not None else None
+            if current is not None and (current.users_hash, current.hotels_hash) == (users_hash, hotels_hash):
+                # Yalnızca dosya damgası değişmiş, içerik aynı
+                snapshot = current
+            else:
+                version = current.version + 1 if current is not None else 1
+                users = json.loads(users_content.decode('utf-8'))
+                hotels = json.loads(hotels_content.decode('utf-8'))
+                compiled, room_table = load_or_build_compiled(
+                    self.cache_dir, self.users_file, self.hotels_file, users_hash, hotels_hash, users, hotels
+                )
+                snapshot = CatalogSnapshot(version, users, hotels, users_hash, hotels_hash, compiled, room_table)
+                if current is not None:
+                    print(f"Katalog verileri değişti, yeniden yüklendi (sürüm {version}).")
+
+            self._state = (snapshot, stamps)
+            return snapshot
+
+    @property
+    def version(self) -> int:
+        """Güncel katalog sürüm numarası"""
+        return self.snapshot().version
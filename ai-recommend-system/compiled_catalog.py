@@ -0,0 +1,247 @@
+import glob
+import hashlib
+import json
+import os
+import zipfile
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from features import (FeatureScaler, USER_FEATURE_NAMES, HOTEL_FEATURE_NAMES, feature_schema_hash,
+                      user_feature_row, hotel_feature_row)
+from scoring_engine import RoomTable
+
+# Önbellek dosyası biçim sürümü; dosyaya yazılan diziler değişirse artırılır
+COMPILED_FORMAT_VERSION = 1
+
+
+def compiled_cache_key(users_hash: str, hotels_hash: str) -> str:
+    """
+    Derlenmiş katalog önbelleğinin anahtarı: kaynak dosyaların içerik özetleri, özellik
+    şeması ve önbellek biçim sürümünün sha256 özeti
+    """
+    parts = [users_hash, hotels_hash, feature_schema_hash(), str(COMPILED_FORMAT_VERSION)]
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _feature_matrix(records, feature_row, num_features: int) -> np.ndarray:
+    """Kayıtların normalize edilmemiş özellik satırları (FeatureScaler ile aynı float32 dönüşümü)"""
+    return np.array([feature_row(record) for record in records], dtype=np.float32).reshape(-1, num_features)
+
+
+class CompiledCatalog:
+    """
+    Katalog kayıtlarından derlenen diziler: ID listeleri ve ID -> indeks eşlemeleri (katalog
+    sırasıyla), normalize edilmemiş ve veriden fit edilen ölçekle normalize edilmiş özellik
+    matrisleri ve sütunlu oda tablosu. Kaynak dosyalar değişmediği sürece .npz önbelleğinden
+    yüklenir; JSON kayıtlarından yeniden hesaplanmaz.
+    """
+
+    def __init__(self, user_ids: List[Any], hotel_ids: List[Any], user_raw: np.ndarray, hotel_raw: np.ndarray,
+                 user_scaler: Optional[FeatureScaler], hotel_scaler: Optional[FeatureScaler],
+                 room_columns: Dict[str, Any], user_features: np.ndarray = None, hotel_features: np.ndarray = None):
+        """
+        Args:
+            user_ids: Katalog sırasıyla kullanıcı ID'leri
+            hotel_ids: Katalog sırasıyla otel ID'leri
+            user_raw: Normalize edilmemiş kullanıcı özellikleri (kullanıcı sayısı x özellik sayısı)
+            hotel_raw: Normalize edilmemiş otel özellikleri (otel sayısı x özellik sayısı)
+            user_scaler: Kullanıcı özelliklerinden fit edilen ölçek (katalog boşsa None)
+            hotel_scaler: Otel özelliklerinden fit edilen ölçek (katalog boşsa None)
+            room_columns: RoomTable.columns() çıktısı
+            user_features: Ölçekle normalize edilmiş kullanıcı özellikleri (verilmezse hesaplanır)
+            hotel_features: Ölçekle normalize edilmiş otel özellikleri (verilmezse hesaplanır)
+        """
+        self.user_ids = user_ids
+        self.hotel_ids = hotel_ids
+        self.user_id_to_index = {user_id: idx for idx, user_id in enumerate(user_ids)}
+        self.hotel_id_to_index = {hotel_id: idx for idx, hotel_id in enumerate(hotel_ids)}
+        self.user_raw = user_raw
+        self.hotel_raw = hotel_raw
+        self.user_scaler = user_scaler
+        self.hotel_scaler = hotel_scaler
+        if user_features is None and user_scaler is not None:
+            user_features = user_scaler.transform(user_raw)
+        if hotel_features is None and hotel_scaler is not None:
+            hotel_features = hotel_scaler.transform(hotel_raw)
+        self.user_features = user_features
+        self.hotel_features = hotel_features
+        self.room_columns = room_columns
+
+    @classmethod
+    def build(cls, users: Sequence[Dict[str, Any]], hotels: Sequence[Dict[str, Any]],
+              room_table: RoomTable) -> 'CompiledCatalog':
+        """Dizileri katalog kayıtlarından hesaplar"""
+        user_raw = _feature_matrix(users, user_feature_row, len(USER_FEATURE_NAMES))
+        hotel_raw = _feature_matrix(hotels, hotel_feature_row, len(HOTEL_FEATURE_NAMES))
+        return cls(
+            [user['id'] for user in users],
+            [hotel['id'] for hotel in hotels],
+            user_raw,
+            hotel_raw,
+            FeatureScaler.fit(user_raw) if len(user_raw) else None,
+            FeatureScaler.fit(hotel_raw) if len(hotel_raw) else None,
+            room_table.columns()
+        )
+
+    def save(self, path: str, key: str):
+        """
+        Dizileri .npz dosyasına yazar (geçici dosya + yerine taşıma)
+
+        Args:
+            path: Önbellek dosyası
+            key: compiled_cache_key() ile hesaplanan anahtar
+        """
+        arrays = {
+            'key': np.array(key),
+            'format_version': np.array(COMPILED_FORMAT_VERSION),
+            # ID'ler tamsayı ya da metin olabileceği için JSON olarak saklanır
+            'user_ids': np.array(json.dumps(self.user_ids)),
+            'hotel_ids': np.array(json.dumps(self.hotel_ids)),
+            'user_raw': self.user_raw,
+            'hotel_raw': self.hotel_raw,
+            'room_type_codes': np.array(json.dumps(list(self.room_columns['type_codes'].items()))),
+        }
+        for prefix, scaler, features in (('user', self.user_scaler, self.user_features),
+                                         ('hotel', self.hotel_scaler, self.hotel_features)):
+            if scaler is not None:
+                arrays[f'{prefix}_scaler_min'] = scaler.min_
+                arrays[f'{prefix}_scaler_scale'] = scaler.scale_
+                arrays[f'{prefix}_features'] = features
+        for name in RoomTable.COLUMNS:
+            arrays[f'room_{name}'] = self.room_columns[name]
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, key: str) -> Optional['CompiledCatalog']:
+        """
+        Önbellek dosyasını okur
+
+        Returns:
+            Derlenmiş katalog; dosya yoksa, okunamıyorsa veya anahtarı uyuşmuyorsa None
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data['key']) != key or int(data['format_version']) != COMPILED_FORMAT_VERSION:
+                    return None
+                scalers = {}
+                features = {}
+                for prefix in ('user', 'hotel'):
+                    if f'{prefix}_scaler_min' in data:
+                        scalers[prefix] = FeatureScaler(data[f'{prefix}_scaler_min'], data[f'{prefix}_scaler_scale'])
+                        features[prefix] = data[f'{prefix}_features']
+                room_columns = {name: data[f'room_{name}'] for name in RoomTable.COLUMNS}
+                room_columns['type_codes'] = {name: code for name, code in json.loads(str(data['room_type_codes']))}
+                # Normalize matrisler yeniden hesaplanmaz, dosyadan alınır
+                return cls(
+                    json.loads(str(data['user_ids'])),
+                    json.loads(str(data['hotel_ids'])),
+                    data['user_raw'],
+                    data['hotel_raw'],
+                    scalers.get('user'),
+                    scalers.get('hotel'),
+                    room_columns,
+                    features.get('user'),
+                    features.get('hotel')
+                )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            print(f"Derlenmiş katalog önbelleği okunamadı ({path}): {e}")
+            return None
+
+    @staticmethod
+    def _scaled_matrix(ids: List[Any], raw: np.ndarray, num_rows: int, id_to_index: Dict[Any, int],
+                       scaler: FeatureScaler) -> np.ndarray:
+        """Eşlemede bulunan kayıtların özelliklerini ölçekle normalize edip eşlemenin indeks sırasına yerleştirir"""
+        matrix = np.zeros((num_rows, len(scaler.scale_)), dtype=np.float32)
+        rows = [row for row, record_id in enumerate(ids) if record_id in id_to_index]
+        if rows:
+            matrix[[id_to_index[ids[row]] for row in rows]] = scaler.transform(raw[rows])
+        return matrix
+
+    def user_matrix(self, num_rows: int, id_to_index: Dict[Any, int], scaler: FeatureScaler) -> np.ndarray:
+        """
+        Kullanıcı özelliklerini verilen (ör. model dosyasındaki donmuş) ölçek ve indeks sırasıyla döndürür
+
+        Args:
+            num_rows: Matrisin satır sayısı (modeldeki kullanıcı sayısı)
+            id_to_index: Kullanıcı ID -> satır eşlemesi; eşlemede olmayan kullanıcılar atlanır
+            scaler: Donmuş ölçek
+        """
+        return self._scaled_matrix(self.user_ids, self.user_raw, num_rows, id_to_index, scaler)
+
+    def hotel_matrix(self, num_rows: int, id_to_index: Dict[Any, int], scaler: FeatureScaler) -> np.ndarray:
+        """Otel özelliklerini verilen ölçek ve indeks sırasıyla döndürür (bkz. user_matrix)"""
+        return self._scaled_matrix(self.hotel_ids, self.hotel_raw, num_rows, id_to_index, scaler)
+
+
+def default_cache_dir(users_file: str) -> Optional[str]:
+    """
+    Derlenmiş katalog önbelleğinin dizini: CATALOG_CACHE_DIR ortam değişkeni (boş ise önbellek
+    kapalıdır), verilmezse kullanıcı dosyasının yanındaki .compiled dizini
+    """
+    cache_dir = os.environ.get('CATALOG_CACHE_DIR')
+    if cache_dir is None:
+        return os.path.join(os.path.dirname(os.path.abspath(users_file)), '.compiled')
+    return cache_dir or None
+
+
+def _cache_prefix(users_file: str, hotels_file: str) -> str:
+    """
+    Önbellek dosyası adının veri kümesine özgü ön eki: dosya adları ve mutlak yolların kısa
+    özeti (aynı adlı dosyalar farklı dizinlerde olsa da eski dosya temizliği birbirini silmez)
+    """
+    paths = [os.path.abspath(path) for path in (users_file, hotels_file)]
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+    paths_hash = hashlib.sha256('\n'.join(paths).encode('utf-8')).hexdigest()[:8]
+    return f"{'__'.join(stems)}.{paths_hash}"
+
+
+def load_or_build_compiled(cache_dir: Optional[str], users_file: str, hotels_file: str,
+                           users_hash: str, hotels_hash: str, users: Sequence[Dict[str, Any]],
+                           hotels: Sequence[Dict[str, Any]]) -> Tuple[CompiledCatalog, RoomTable]:
+    """
+    Derlenmiş katalogu önbellekten yükler; yoksa kayıtlardan hesaplayıp önbelleğe yazar.
+    Aynı dosya çiftine ait eski önbellek dosyaları silinir.
+
+    Args:
+        cache_dir: Önbellek dizini (None ise önbellek kullanılmaz)
+        users_file: Kullanıcı dosyasının yolu (önbellek dosyası adı için)
+        hotels_file: Otel dosyasının yolu (önbellek dosyası adı için)
+        users_hash: Kullanıcı dosyasının içerik özeti
+        hotels_hash: Otel dosyasının içerik özeti
+        users: Kullanıcı kayıtları
+        hotels: Otel kayıtları
+
+    Returns:
+        (derlenmiş katalog, oda tablosu)
+    """
+    if cache_dir is None:
+        room_table = RoomTable(hotels)
+        return CompiledCatalog.build(users, hotels, room_table), room_table
+
+    key = compiled_cache_key(users_hash, hotels_hash)
+    prefix = _cache_prefix(users_file, hotels_file)
+    path = os.path.join(cache_dir, f"{prefix}.{key[:16]}.npz")
+
+    compiled = CompiledCatalog.load(path, key)
+    if compiled is not None:
+        return compiled, RoomTable(hotels, compiled.room_columns)
+
+    room_table = RoomTable(hotels)
+    compiled = CompiledCatalog.build(users, hotels, room_table)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        compiled.save(path, key)
+        for stale in glob.glob(os.path.join(glob.escape(cache_dir), f"{glob.escape(prefix)}.*.npz")):
+            if stale != path:
+                os.remove(stale)
+    except OSError as e:
+        # Önbellek yazılamazsa (ör. salt okunur dizin) derlenmiş diziler yalnızca bellekte kullanılır
+        print(f"Derlenmiş katalog önbelleği yazılamadı ({path}): {e}")
+    return compiled, room_table
@@ -0,0 +1,212 @@
+import hashlib
+import json
+import numpy as np
+from typing import List, Dict, Any, Sequence
+
+# Kullanıcı özellik vektörünün sütunları (sıra modelin girdisiyle aynıdır)
+USER_FEATURE_NAMES = [
+    'min_budget',               # Minimum bütçe
+    'max_budget',               # Maksimum bütçe
+    'avg_budget',               # Ortalama bütçe
+    'budget_range',             # Bütçe aralığı
+    'is_deluxe',                # DELUXE oda tercihi
+    'is_standard',              # STANDARD oda tercihi
+    'required_capacity',        # Gerekli kapasite
+    'has_wifi',                 # WiFi tercihi
+    'has_tv',                   # TV tercihi
+    'has_balcony',              # Balkon tercihi
+    'has_minibar',              # Minibar tercihi
+    'preferred_amenity_count',  # Tercih edilen özellik sayısı
+]
+
+# Otel özellik vektörünün sütunları (sıra modelin girdisiyle aynıdır)
+HOTEL_FEATURE_NAMES = [
+    'avg_price',          # Ortalama oda fiyatı
+    'min_price',          # Minimum oda fiyatı
+    'max_price',          # Maksimum oda fiyatı
+    'price_range',        # Fiyat aralığı
+    'deluxe_ratio',       # Deluxe oda oranı
+    'standard_ratio',     # Standard oda oranı
+    'avg_capacity',       # Ortalama kapasite
+    'min_capacity',       # Minimum kapasite
+    'max_capacity',       # Maksimum kapasite
+    'wifi_ratio',         # WiFi oranı
+    'tv_ratio',           # TV oranı
+    'balcony_ratio',      # Balkon oranı
+    'minibar_ratio',      # Minibar oranı
+    'avg_amenity_count',  # Ortalama özellik sayısı
+]
+
+# Model dosyasına yazılan özellik şeması; sütun adı/sırası veya ölçekleme yöntemi
+# değişirse şema özeti de değişir ve eski model dosyaları reddedilir
+FEATURE_SCHEMA = {
+    'user_features': USER_FEATURE_NAMES,
+    'hotel_features': HOTEL_FEATURE_NAMES,
+    'scaler': 'minmax',
+}
+
+
+def feature_schema_hash(schema: Dict[str, Any] = None) -> str:
+    """Özellik şemasının sha256 özetini döndürür"""
+    schema = FEATURE_SCHEMA if schema is None else schema
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def user_feature_row(user: Dict[str, Any]) -> List[float]:
+    """
+    Bir kullanıcı kaydından (normalize edilmemiş) özellik vektörünü çıkarır
+    """
+    # Bütçe özellikleri
+    min_budget = user['preferredBudget']['min']
+    max_budget = user['preferredBudget']['max']
+    avg_budget = (min_budget + max_budget) / 2
+    budget_range = max_budget - min_budget
+
+    # Oda tipi tercihi - one-hot encoding
+    is_deluxe = 1 if user['preferredRoomType'] == 'DELUXE' else 0
+    is_standard = 1 if user['preferredRoomType'] == 'STANDARD' else 0
+
+    # Kapasite
+    required_capacity = user['requiredCapacity']
+
+    # Tercih edilen özellikler
+    has_wifi = 1 if 'WiFi' in user['preferredAmenities'] else 0
+    has_tv = 1 if 'TV' in user['preferredAmenities'] else 0
+    has_balcony = 1 if 'Balkon' in user['preferredAmenities'] else 0
+    has_minibar = 1 if 'Minibar' in user['preferredAmenities'] else 0
+
+    # Tercih edilen özellik sayısı
+    preferred_amenity_count = len(user['preferredAmenities'])
+
+    return [
+        min_budget,
+        max_budget,
+        avg_budget,
+        budget_range,
+        is_deluxe,
+        is_standard,
+        required_capacity,
+        has_wifi,
+        has_tv,
+        has_balcony,
+        has_minibar,
+        preferred_amenity_count
+    ]
+
+
+def hotel_feature_row(hotel: Dict[str, Any]) -> List[float]:
+    """
+    Bir otel kaydından ve odalarından (normalize edilmemiş) özellik vektörünü çıkarır
+    """
+    num_rooms = len(hotel['rooms'])
+
+    if num_rooms > 0:
+        # Fiyat istatistikleri
+        room_prices = [room['pricePerNight'] for room in hotel['rooms']]
+        avg_price = sum(room_prices) / num_rooms
+        min_price = min(room_prices)
+        max_price = max(room_prices)
+        price_range = max_price - min_price
+
+        # Oda tipi istatistikleri
+        deluxe_count = sum(1 for room in hotel['rooms'] if room['type'] == 'DELUXE')
+        standard_count = sum(1 for room in hotel['rooms'] if room['type'] == 'STANDARD')
+        deluxe_ratio = deluxe_count / num_rooms
+        standard_ratio = standard_count / num_rooms
+
+        # Kapasite istatistikleri
+        capacities = [room['capacity'] for room in hotel['rooms']]
+        avg_capacity = sum(capacities) / num_rooms
+        min_capacity = min(capacities)
+        max_capacity = max(capacities)
+
+        # Özellik istatistikleri
+        wifi_count = sum(1 for room in hotel['rooms'] if room.get('hasWifi', False))
+        tv_count = sum(1 for room in hotel['rooms'] if room.get('hasTV', False))
+        balcony_count = sum(1 for room in hotel['rooms'] if room.get('hasBalcony', False))
+        minibar_count = sum(1 for room in hotel['rooms'] if room.get('hasMinibar', False))
+
+        wifi_ratio = wifi_count / num_rooms
+        tv_ratio = tv_count / num_rooms
+        balcony_ratio = balcony_count / num_rooms
+        minibar_ratio = minibar_count / num_rooms
+
+        # Toplam özellik oranı
+        avg_amenity_count = (wifi_ratio + tv_ratio + balcony_ratio + minibar_ratio)
+    else:
+        # Default değerler
+        avg_price = min_price = max_price = price_range = 0
+        deluxe_ratio = standard_ratio = 0
+        avg_capacity = min_capacity = max_capacity = 0
+        wifi_ratio = tv_ratio = balcony_ratio = minibar_ratio = avg_amenity_count = 0
+
+    return [
+        avg_price,
+        min_price,
+        max_price,
+        price_range,
+        deluxe_ratio,
+        standard_ratio,
+        avg_capacity,
+        min_capacity,
+        max_capacity,
+        wifi_ratio,
+        tv_ratio,
+        balcony_ratio,
+        minibar_ratio,
+        avg_amenity_count
+    ]
+
+
+class FeatureScaler:
+    """
+    Eğitim verisinde fit edilmiş MinMaxScaler parametrelerinin donmuş hali.
+
+    Yeni kayıtlar (ör. sisteme kayıtlı olmayan kullanıcı profilleri) yeniden fit
+    etmeden, modelin eğitildiği ölçekle normalize edilir.
+    """
+
+    def __init__(self, min_: np.ndarray, scale_: np.ndarray):
+        """
+        Args:
+            min_: MinMaxScaler.min_ dizisi
+            scale_: MinMaxScaler.scale_ dizisi
+        """
+        self.min_ = np.asarray(min_, dtype=np.float32)
+        self.scale_ = np.asarray(scale_, dtype=np.float32)
+
+    @classmethod
+    def from_sklearn(cls, scaler) -> 'FeatureScaler':
+        """Fit edilmiş bir sklearn MinMaxScaler nesnesinden oluşturur"""
+        return cls(scaler.min_, scaler.scale_)
+
+    @classmethod
+    def fit(cls, rows: Sequence[Sequence[float]]) -> 'FeatureScaler':
+        """
+        Özellik satırlarından 0-1 aralığına ölçek hesaplar; sklearn MinMaxScaler.fit ile aynı
+        sonucu verir (sabit sütunların aralığı 1 kabul edilir), sklearn içe aktarmaz
+
+        Args:
+            rows: Normalize edilmemiş özellik satırları (satır sayısı x özellik sayısı)
+        """
+        features = np.array(rows, dtype=np.float32)
+        data_min = np.nanmin(features, axis=0)
+        data_range = np.nanmax(features, axis=0) - data_min
+        data_range[data_range < 10 * np.finfo(data_range.dtype).eps] = 1.0
+        scale = np.float32(1.0) / data_range
+        return cls(np.float32(0.0) - data_min * scale, scale)
+
+    def transform(self, rows: Sequence[Sequence[float]]) -> np.ndarray:
+        """
+        Özellik satırlarını normalize eder (MinMaxScaler.transform ile aynı işlem sırası)
+
+        Args:
+            rows: Normalize edilmemiş özellik satırları (satır sayısı x özellik sayısı)
+
+        Returns:
+            Normalize edilmiş float32 matris
+        """
+        features = np.array(rows, dtype=np.float32).reshape(-1, len(self.scale_))
+        features *= self.scale_
+        features += self.min_
+        return features
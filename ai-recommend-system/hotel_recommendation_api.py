@@ -1,10 +1,14 @@
 import os
+import hmac
 import json
-import torch
-import numpy as np
-from flask import Flask, request, jsonify
+import time
+from flask import Flask, request, jsonify, Response, g
 from flask_cors import CORS
-from improved_recommendation import ImprovedLearningRecommender
+from base_recommender import BaseRecommender, ModelArtifactError, EXPLAIN_LEVELS
+from result_cache import ResultCache
+from model_registry import ModelRegistry, ModelReloader
+from metrics import REGISTRY, stage_timer
+from micro_batching import MicroBatcher
 import traceback
 
 app = Flask(__name__)
@@ -14,6 +18,23 @@ CORS(app)  # Cross-Origin isteklerine izin ver
 users_file = 'datas/expanded_users.json'
 hotels_file = 'datas/expanded_hotels.json'
 model_path = "improved_hotel_recommender_model.pth"
+# NumPy motoru için dışa aktarılmış model dosyası (python model_export.py --export-npz)
+numpy_model_path = os.environ.get("NUMPY_MODEL_PATH", "improved_hotel_recommender_model.npz")
+
+# Toplu öneride bu sayıdan fazla kullanıcı istenirse yanıt NDJSON olarak akış halinde döner
+BATCH_STREAM_THRESHOLD = 100
+
+# Kayıtlı kullanıcı önerileri için sonuç önbelleği (kayıt sayısı ve saniye cinsinden geçerlilik süresi)
+RESULT_CACHE_SIZE = 4096
+RESULT_CACHE_TTL = 300
+# Öneri puanlamasında kullanılacak model: eager (eğitilen model), folded, torchscript, int8
+# (model_export.INFERENCE_BACKENDS) veya numpy (.npz dosyasıyla, torch içe aktarılmadan)
+INFERENCE_BACKEND = os.environ.get("INFERENCE_BACKEND", "eager")
+# Mikro toplu işlem: eşzamanlı /api/recommend isteklerinin ileri geçişleri en fazla
+# MICRO_BATCH_MAX_WAIT_MS milisaniye biriktirilip en fazla MICRO_BATCH_MAX_SIZE kullanıcılık
+# tek bir geçişte birleştirilir; 0 ile kapatılır (her istek kendi geçişini yapar)
+MICRO_BATCH_MAX_SIZE = int(os.environ.get("MICRO_BATCH_MAX_SIZE", "0"))
+MICRO_BATCH_MAX_WAIT_MS = float(os.environ.get("MICRO_BATCH_MAX_WAIT_MS", "2"))
 
 # Eğer genişletilmiş veri seti yoksa, orijinal veri setini kullan
 if not os.path.exists(users_file):
@@ -23,20 +44,54 @@ if not os.path.exists(hotels_file):
 
 print(f"Kullanılan veri setleri: {users_file}, {hotels_file}")
 
-try:
-    # İlk deneme - mevcut modeli yüklemeye çalış
-    recommender = ImprovedLearningRecommender(users_file, hotels_file, model_path)
-    print("Derin öğrenme modeli başarıyla yüklendi.")
-except Exception as e:
-    if "size mismatch" in str(e):
-        print(f"Model boyutu uyumsuzluğu tespit edildi: {e}")
+result_cache = ResultCache(max_entries=RESULT_CACHE_SIZE, ttl_seconds=RESULT_CACHE_TTL)
+
+# Tüm model nesilleri için ortak zamanlayıcı; istekler öneri sistemi ve oda tablosuna göre gruplanır
+score_batcher = None
+if MICRO_BATCH_MAX_SIZE > 0:
+    score_batcher = MicroBatcher(
+        BaseRecommender.score_micro_batch,
+        max_batch_size=MICRO_BATCH_MAX_SIZE,
+        max_wait=MICRO_BATCH_MAX_WAIT_MS / 1000
+    )
+
+if INFERENCE_BACKEND == "numpy":
+    # PyTorch'suz sunum; model eğitimi ve .npz dışa aktarımı ayrı süreçte (model_update.py) yapılır
+    from numpy_inference import NumpyRecommender
+    
+    serving_model_path = numpy_model_path
+    
+    def create_recommender():
+        recommender = NumpyRecommender(users_file, hotels_file, numpy_model_path)
+        recommender.score_batcher = score_batcher
+        return recommender
+    
+    initial_recommender = create_recommender()
+    print("NumPy modeli başarıyla yüklendi.")
+else:
+    from improved_recommendation import ImprovedLearningRecommender
+    
+    serving_model_path = model_path
+    
+    def create_recommender():
+        recommender = ImprovedLearningRecommender(users_file, hotels_file, model_path, INFERENCE_BACKEND)
+        recommender.score_batcher = score_batcher
+        return recommender
+    
+    try:
+        # İlk deneme - mevcut modeli yüklemeye çalış
+        initial_recommender = create_recommender()
+        print("Derin öğrenme modeli başarıyla yüklendi.")
+    except ModelArtifactError as e:
+        # Model dosyası okunamadı veya özellik şeması/boyutlar mevcut kodla uyumsuz
+        print(f"Model dosyası uyumsuz: {e}")
         print("Eski model dosyasını yedekliyorum ve yeni model eğitiyorum...")
         
         # Eski model dosyasını yedekle
         if os.path.exists(model_path):
             backup_path = f"{model_path}.backup"
             try:
-                os.rename(model_path, backup_path)
+                os.replace(model_path, backup_path)
                 print(f"Eski model {backup_path} olarak yedeklendi.")
             except Exception as rename_error:
                 print(f"Yedekleme hatası: {rename_error}")
@@ -44,15 +99,75 @@ except Exception as e:
         # Yeni model eğit
         try:
             print("Yeni derin öğrenme modeli eğitiliyor...")
-            recommender = ImprovedLearningRecommender(users_file, hotels_file)
-            recommender.train(evaluate=True)
+            initial_recommender = create_recommender()
+            initial_recommender.train(evaluate=True)
             print("Yeni model başarıyla eğitildi ve kaydedildi.")
         except Exception as train_error:
             print(f"Model eğitimi hatası: {train_error}")
             raise
-    else:
-        print(f"Beklenmeyen hata: {e}")
-        raise
+
+# Sunumdaki model; her istek başında tek bir referans alınır, yeni model atomik olarak devreye alınır
+registry = ModelRegistry(initial_recommender)
+
+# Model dosyası değişince (ör. model_update.py sonrası) yeni model kenarda yüklenip ısıtılır ve
+# devreye alınır; MODEL_WATCH_INTERVAL=0 ile dosya izleme kapatılır (yönetici uç noktası yine çalışır)
+reloader = ModelReloader(
+    registry,
+    serving_model_path,
+    factory=create_recommender,
+    warmup=lambda new_recommender: new_recommender.warm_up()
+)
+MODEL_WATCH_INTERVAL = float(os.environ.get("MODEL_WATCH_INTERVAL", "5"))
+if MODEL_WATCH_INTERVAL > 0:
+    reloader.start_watching(MODEL_WATCH_INTERVAL)
+
+# İstek ölçümleri; aşama süreleri (recommender_stage_duration_seconds) öneri sisteminde ölçülür
+# ve tümü /metrics uç noktasından Prometheus metin biçiminde okunur
+REQUEST_LATENCY = REGISTRY.histogram(
+    'recommender_http_request_duration_seconds', 'Uç noktaya göre HTTP istek süresi (saniye)', ('endpoint',)
+)
+REQUEST_COUNT = REGISTRY.counter(
+    'recommender_http_requests_total', 'Uç nokta ve durum koduna göre HTTP istek sayısı', ('endpoint', 'status')
+)
+for _stat in ('hits', 'misses', 'evictions', 'expirations'):
+    REGISTRY.callback(f'recommender_result_cache_{_stat}_total', f'Sonuç önbelleği sayacı: {_stat}', 'counter',
+                      lambda _stat=_stat: getattr(result_cache, _stat))
+REGISTRY.callback('recommender_result_cache_entries', 'Sonuç önbelleğindeki kayıt sayısı', 'gauge',
+                  lambda: result_cache.stats()['entries'])
+REGISTRY.callback('recommender_model_generation', 'Sunumdaki modelin nesil numarası', 'gauge',
+                  lambda: registry.generation)
+
+@app.before_request
+def _start_request_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def _record_request_metrics(response):
+    # Akış (NDJSON) yanıtlarında süre, gövde üretilmeden önce ölçülür
+    endpoint = request.endpoint or 'unmatched'
+    REQUEST_LATENCY.observe(time.perf_counter() - g.request_start, endpoint)
+    REQUEST_COUNT.inc(endpoint, str(response.status_code))
+    return response
+
+def _json_response(payload):
+    """Başarılı yanıtı JSON'a çevirir; süre 'serialization' aşaması olarak ölçülür"""
+    with stage_timer('serialization'):
+        return jsonify(payload)
+
+def _is_scalar_id(value) -> bool:
+    """Değer ID olarak kullanılabilir mi (JSON liste/nesne değil; önbellek ve indeks anahtarı olur)"""
+    return not isinstance(value, (list, dict))
+
+def _is_positive_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+# Yönetici uç noktaları için erişim anahtarı; tanımlı değilse bu uç noktalar kapalıdır
+ADMIN_TOKEN = os.environ.get("MODEL_ADMIN_TOKEN")
+
+def _is_admin_request() -> bool:
+    """İstek geçerli yönetici anahtarını (X-Admin-Token başlığı) taşıyor mu"""
+    token = request.headers.get("X-Admin-Token", "")
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(token.encode("utf-8"), ADMIN_TOKEN.encode("utf-8"))
 
 @app.route('/api/recommend', methods=['POST'])
 def recommend():
@@ -61,8 +176,9 @@ def recommend():
     
     Request body örneği:
     {
-        "user_id": 1,  // Varolan bir kullanıcı ID'si
-        "top_n": 5     // Kaç adet öneri isteniyor (opsiyonel, default 5)
+        "user_id": 1,       // Varolan bir kullanıcı ID'si
+        "top_n": 5,         // Kaç adet öneri isteniyor (opsiyonel, default 5)
+        "explain": "none"   // Açıklama düzeyi: none / summary / full (opsiyonel, default none)
     }
     
     veya yeni kullanıcı için:
@@ -78,10 +194,18 @@ def recommend():
     }
     """
     try:
+        # İstek boyunca aynı model/katalog/ölçek referansı kullanılır
+        recommender = registry.current()
+        
         data = request.json
         
         if not data:
             return jsonify({"error": "Geçersiz JSON verisi"}), 400
+        
+        # Açıklamalar yalnızca istenirse hesaplanır; summary oda eşleşme listesini içermez
+        explain = data.get("explain", "none")
+        if explain not in EXPLAIN_LEVELS:
+            return jsonify({"error": f"Geçersiz 'explain' değeri. Geçerli değerler: {', '.join(EXPLAIN_LEVELS)}"}), 400
             
         # Kullanıcı ID ile öneri alma (yapay zeka modeli ile)
         if "user_id" in data:
@@ -89,16 +213,27 @@ def recommend():
             top_n = data.get("top_n", 5)
             debug = data.get("debug", False)
             
-            # Derin öğrenme modeli ile öneriler al
-            recommendations = recommender.recommend_hotels(user_id, top_n=top_n, debug=debug)
+            # Değerler önbellek anahtarına girdiği için önce doğrulanır (liste/nesne anahtar olamaz)
+            if not _is_scalar_id(user_id):
+                return jsonify({"error": "Geçersiz 'user_id' değeri"}), 400
+            if not _is_positive_int(top_n):
+                return jsonify({"error": "'top_n' pozitif bir tamsayı olmalıdır"}), 400
+            
+            # Aynı istek aynı model ve katalog sürümüyle daha önce hesaplandıysa önbellekten döndür;
+            # model veya veri dosyaları değişince sürümler de değiştiği için eski kayıtlar eşleşmez
+            cache_key = (user_id, top_n, bool(debug), explain, recommender.model_version, recommender.catalog.version)
+            recommendations = result_cache.get(cache_key)
             
-            # Öneriler için detaylı açıklamalar ekle
-            for rec in recommendations:
-                explanation = recommender.explain_recommendation(user_id, rec['hotel_id'])
-                if explanation and "error" not in explanation:
-                    rec['detailed_explanation'] = explanation
+            if recommendations is None:
+                # Derin öğrenme modeli ile öneriler al - istenirse açıklamalar sıralamadaki
+                # tahminler yeniden kullanılarak aynı geçişte eklenir
+                recommendations = recommender.recommend_hotels(user_id, top_n=top_n, debug=debug, explain=explain)
+                
+                # Boş sonuçlar (bulunamayan kullanıcı veya hata) önbelleğe alınmaz
+                if recommendations:
+                    result_cache.put(cache_key, recommendations)
             
-            return jsonify({
+            return _json_response({
                 "user_id": user_id,
                 "ai_powered": True,
                 "recommendations": recommendations
@@ -109,33 +244,26 @@ def recommend():
             user_data = data.get("user")
             top_n = data.get("top_n", 5)
             
+            if not isinstance(user_data, dict):
+                return jsonify({"error": "'user' alanı bir nesne olmalıdır"}), 400
+            if not _is_positive_int(top_n):
+                return jsonify({"error": "'top_n' pozitif bir tamsayı olmalıdır"}), 400
+            
             # Kullanıcı verilerinin doğruluğunu kontrol et
             required_fields = ["preferredBudget", "preferredRoomType", "requiredCapacity", "preferredAmenities"]
             for field in required_fields:
                 if field not in user_data:
                     return jsonify({"error": f"Eksik alan: {field}"}), 400
             
-            # Geçici kullanıcı oluştur, önerileri al ve sonra kullanıcıyı sil
-            temp_user_id = create_temporary_user(user_data)
+            # Profil bellekte, eğitimdeki ölçekle puanlanır - kullanıcı dosyasına yazılmaz;
+            # istenirse açıklamalar sıralamayla aynı geçişte eklenir
+            recommendations = recommender.recommend_for_profile(user_data, top_n=top_n, explain=explain)
             
-            try:
-                # Yeni kullanıcı için öneriler al
-                recommendations = recommender.recommend_hotels(temp_user_id, top_n=top_n)
-                
-                # Öneriler için detaylı açıklamalar ekle
-                for rec in recommendations:
-                    explanation = recommender.explain_recommendation(temp_user_id, rec['hotel_id'])
-                    if explanation and "error" not in explanation:
-                        rec['detailed_explanation'] = explanation
-                
-                # Yanıt döndür
-                return jsonify({
-                    "ai_powered": True,
-                    "recommendations": recommendations
-                })
-            finally:
-                # Her durumda geçici kullanıcıyı sil
-                remove_temporary_user(temp_user_id)
+            # Yanıt döndür
+            return _json_response({
+                "ai_powered": True,
+                "recommendations": recommendations
+            })
         
         else:
             return jsonify({"error": "Geçersiz istek formatı. 'user_id' veya 'user' alanı gerekli"}), 400
@@ -144,74 +272,169 @@ def recommend():
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
 
-def create_temporary_user(user_data):
+@app.route('/api/explain', methods=['POST'])
+def explain():
     """
-    Yeni kullanıcı için geçici bir kullanıcı kaydı oluştur
+    Bir veya daha fazla otel önerisini ayrıntılı şekilde açıklayan API endpoint'i
+    
+    Request body örneği:
+    {
+        "user_id": 1,           // Varolan bir kullanıcı ID'si (veya /api/recommend'deki gibi "user" profili)
+        "hotel_ids": [3, 7],    // Açıklanacak oteller (tek otel için "hotel_id" de kullanılabilir)
+        "explain": "full"       // Açıklama düzeyi: summary / full (opsiyonel, default full)
+    }
     """
     try:
-        # Kullanıcı listesini yükle
-        with open(users_file, 'r', encoding='utf-8') as f:
-            users = json.load(f)
-        
-        # Yeni benzersiz ID oluştur (mevcut en büyük ID + 1000)
-        max_id = max(user.get('id', 0) for user in users)
-        new_user_id = max_id + 1000
-        
-        # Yeni kullanıcı verisi
-        new_user = {
-            "id": new_user_id,
-            "name": user_data.get("name", "Geçici Kullanıcı"),
-            "email": f"temp_{new_user_id}@example.com",
-            "age": user_data.get("age", 30),
-            "gender": user_data.get("gender", "UNSPECIFIED"),
-            "preferredBudget": user_data["preferredBudget"],
-            "preferredRoomType": user_data["preferredRoomType"],
-            "requiredCapacity": user_data["requiredCapacity"],
-            "preferredAmenities": user_data["preferredAmenities"],
-            "specialRequests": user_data.get("specialRequests", ""),
-            "travelDates": user_data.get("travelDates", {"start": "", "end": ""})
-        }
-        
-        # Yeni kullanıcıyı listeye ekle
-        users.append(new_user)
-        
-        # Dosyaya kaydet
-        with open(users_file, 'w', encoding='utf-8') as f:
-            json.dump(users, f, ensure_ascii=False, indent=2)
-        
-        # Öneri sistemini yeniden başlat (kullanıcı sayısı değişti)
-        global recommender
-        recommender = ImprovedLearningRecommender(users_file, hotels_file, model_path)
-        
-        return new_user_id
+        # İstek boyunca aynı model/katalog/ölçek referansı kullanılır
+        recommender = registry.current()
+        
+        data = request.json
+        
+        if not data:
+            return jsonify({"error": "Geçersiz JSON verisi"}), 400
+        
+        level = data.get("explain", "full")
+        if level not in EXPLAIN_LEVELS or level == "none":
+            return jsonify({"error": "Geçersiz 'explain' değeri. Geçerli değerler: summary, full"}), 400
+        
+        if "hotel_ids" in data and isinstance(data["hotel_ids"], list):
+            hotel_ids = data["hotel_ids"]
+        elif "hotel_id" in data:
+            hotel_ids = [data["hotel_id"]]
+        else:
+            return jsonify({"error": "Geçersiz istek formatı. 'hotel_id' veya 'hotel_ids' alanı gerekli"}), 400
+        
+        # ID'ler indeks ve sonuç anahtarı olarak kullanıldığı için liste/nesne olamaz
+        if not all(_is_scalar_id(hotel_id) for hotel_id in hotel_ids):
+            return jsonify({"error": "Geçersiz otel ID'si. 'hotel_ids' tekil değerlerden oluşan bir liste olmalıdır"}), 400
+        if "user_id" in data and not _is_scalar_id(data["user_id"]):
+            return jsonify({"error": "Geçersiz 'user_id' değeri"}), 400
+        
+        if "user_id" in data:
+            explanations = recommender.explain_many(data["user_id"], hotel_ids, level=level)
+        elif "user" in data:
+            user_data = data.get("user")
+            required_fields = ["preferredBudget", "preferredRoomType", "requiredCapacity", "preferredAmenities"]
+            for field in required_fields:
+                if field not in user_data:
+                    return jsonify({"error": f"Eksik alan: {field}"}), 400
+            explanations = recommender.explain_many_for_profile(user_data, hotel_ids, level=level)
+        else:
+            return jsonify({"error": "Geçersiz istek formatı. 'user_id' veya 'user' alanı gerekli"}), 400
+        
+        return _json_response({
+            "explanations": [
+                {"hotel_id": hotel_id, **explanations[hotel_id]} for hotel_id in hotel_ids
+            ]
+        })
+    
     except Exception as e:
-        print(f"Geçici kullanıcı oluşturma hatası: {e}")
         traceback.print_exc()
-        raise
+        return jsonify({"error": str(e)}), 500
 
-def remove_temporary_user(user_id):
+@app.route('/api/recommend/batch', methods=['POST'])
+def recommend_batch():
     """
-    Geçici kullanıcıyı sil
+    Birden fazla kullanıcı için tek istekte otel önerileri döndüren API endpoint'i
+    
+    Request body örneği:
+    {
+        "user_ids": [1, 2, 3],  // Varolan kullanıcı ID'leri
+        "top_n": 5,             // Kullanıcı başına öneri sayısı (opsiyonel, default 5)
+        "stream": false         // NDJSON akışı (opsiyonel; çok sayıda kullanıcıda otomatik açılır)
+    }
+    
+    Akış modunda her satır bir kullanıcının sonucudur:
+    {"user_id": 1, "recommendations": [...]}
     """
     try:
-        # Kullanıcı listesini yükle
-        with open(users_file, 'r', encoding='utf-8') as f:
-            users = json.load(f)
+        # İstek boyunca aynı model/katalog/ölçek referansı kullanılır
+        recommender = registry.current()
+        
+        data = request.json
         
-        # Kullanıcıyı filtrele
-        users = [user for user in users if user.get('id') != user_id]
+        if not data or not isinstance(data.get("user_ids"), list):
+            return jsonify({"error": "Geçersiz istek formatı. 'user_ids' listesi gerekli"}), 400
         
-        # Dosyaya kaydet
-        with open(users_file, 'w', encoding='utf-8') as f:
-            json.dump(users, f, ensure_ascii=False, indent=2)
+        user_ids = data["user_ids"]
+        top_n = data.get("top_n", 5)
+        stream = data.get("stream", len(user_ids) > BATCH_STREAM_THRESHOLD)
         
-        # Not: Öneri sistemini şu anda güncellemeye gerek yok 
-        # çünkü bu noktada öneriler zaten elde edildi
+        # Akış başladıktan sonra hata yanıtı verilemeyeceği için tüm değerler önceden doğrulanır
+        if not all(_is_scalar_id(user_id) for user_id in user_ids):
+            return jsonify({"error": "Geçersiz kullanıcı ID'si. 'user_ids' tekil değerlerden oluşan bir liste olmalıdır"}), 400
+        if not _is_positive_int(top_n):
+            return jsonify({"error": "'top_n' pozitif bir tamsayı olmalıdır"}), 400
+        if not isinstance(stream, bool):
+            return jsonify({"error": "'stream' true veya false olmalıdır"}), 400
         
-        return True
+        def result_entry(user_id, recommendations):
+            if recommendations is None:
+                return {"user_id": user_id, "error": "Kullanıcı bulunamadı"}
+            return {"user_id": user_id, "recommendations": recommendations}
+        
+        if stream:
+            def generate():
+                for user_id, recommendations in recommender.iter_recommendations_batch(user_ids, top_n=top_n):
+                    with stage_timer('serialization'):
+                        line = json.dumps(result_entry(user_id, recommendations), ensure_ascii=False) + "\n"
+                    yield line
+            
+            return Response(generate(), mimetype='application/x-ndjson')
+        
+        results = [
+            result_entry(user_id, recommendations)
+            for user_id, recommendations in recommender.iter_recommendations_batch(user_ids, top_n=top_n)
+        ]
+        return _json_response({
+            "ai_powered": True,
+            "results": results
+        })
+    
     except Exception as e:
-        print(f"Geçici kullanıcı silme hatası: {e}")
-        return False
+        traceback.print_exc()
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/cache/stats', methods=['GET'])
+def cache_stats():
+    """
+    Öneri sonuç önbelleğinin sayaçlarını döndürür (isabet, ıska, tahliye, süre aşımı)
+    """
+    return jsonify(result_cache.stats())
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Aşama ve istek gecikmeleri, önbellek sayaçları ve model nesli (Prometheus metin biçimi)
+    """
+    return Response(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/api/admin/reload', methods=['POST'])
+def admin_reload():
+    """
+    Model dosyasını yeniden yükler: yeni model doğrulanır ve ısıtılır, ardından
+    istekler kesilmeden devreye alınır. X-Admin-Token başlığı gerektirir.
+    """
+    if not ADMIN_TOKEN:
+        return jsonify({"error": "Yönetici uç noktaları devre dışı (MODEL_ADMIN_TOKEN tanımlı değil)"}), 403
+    if not _is_admin_request():
+        return jsonify({"error": "Yetkisiz istek"}), 401
+    
+    result = reloader.reload(reason="yönetici isteği")
+    status_codes = {"reloaded": 200, "unchanged": 200, "busy": 409, "failed": 500}
+    return jsonify(result), status_codes.get(result["status"], 200)
+
+@app.route('/api/admin/model', methods=['GET'])
+def admin_model():
+    """
+    Sunumdaki modelin sürümü ve son yeniden yükleme bilgileri. X-Admin-Token başlığı gerektirir.
+    """
+    if not ADMIN_TOKEN:
+        return jsonify({"error": "Yönetici uç noktaları devre dışı (MODEL_ADMIN_TOKEN tanımlı değil)"}), 403
+    if not _is_admin_request():
+        return jsonify({"error": "Yetkisiz istek"}), 401
+    
+    return jsonify(reloader.status())
 
 @app.route('/api/users', methods=['GET'])
 def get_users():
@@ -219,8 +442,9 @@ def get_users():
     Mevcut kullanıcıları listeler (sadece ID ve isim bilgileri)
     """
     try:
-        with open(users_file, 'r', encoding='utf-8') as f:
-            users = json.load(f)
+        recommender = registry.current()
+        
+        users = recommender.catalog.snapshot().users
         
         # Geçici kullanıcıları filtrele (ID > 1000)
         filtered_users = [user for user in users if user.get('id', 0) < 1000]
@@ -237,10 +461,9 @@ def get_user(user_id):
     Belirli bir kullanıcının detaylarını döndürür
     """
     try:
-        with open(users_file, 'r', encoding='utf-8') as f:
-            users = json.load(f)
+        recommender = registry.current()
         
-        user = next((user for user in users if user['id'] == user_id), None)
+        user = recommender.catalog.snapshot().users_by_id.get(user_id)
         
         if user:
             return jsonify(user)
@@ -1,22 +1,34 @@
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from torch.utils.data import Dataset, DataLoader
+from torch.utils.data import Dataset
 import numpy as np
-import json
-import pandas as pd
-import matplotlib.pyplot as plt
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import MinMaxScaler, OneHotEncoder
 import os
-import random
 import time
-from typing import List, Dict, Tuple, Any
-from tqdm import tqdm
+import datetime
+from typing import List, Dict, Tuple, Any, Optional, Iterator, Sequence
+from scoring_engine import RoomTable
+from synthetic_data import synthesize_interactions
+from catalog import CatalogStore, CatalogSnapshot
+from features import (FeatureScaler, FEATURE_SCHEMA, USER_FEATURE_NAMES, HOTEL_FEATURE_NAMES,
+                      feature_schema_hash)
+from model_export import INFERENCE_BACKENDS, build_inference_model
+from base_recommender import BaseRecommender, ModelArtifactError, EXPLAIN_LEVELS, map_shared_array
 
-# GPU kullanılabilirliğini kontrol et
-device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-print(f"Kullanılan cihaz: {device}")
+# Not: matplotlib, sklearn ve tqdm yalnızca eğitim/değerlendirme yollarında, ilgili metodların
+# içinde içe aktarılır; sunum (öneri) yolu ve modülün içe aktarılması bunları yüklemez.
+
+# Kullanılacak cihaz; CUDA kontrolü modül yüklenirken değil ilk kullanımda yapılır (get_device)
+_device = None
+
+
+def get_device() -> torch.device:
+    """Kullanılacak cihazı döndürür (ilk çağrıda seçilir: CUDA varsa GPU, yoksa CPU)"""
+    global _device
+    if _device is None:
+        _device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        print(f"Kullanılan cihaz: {_device}")
+    return _device
 
 # İyileştirilmiş derin öğrenme temelli öneri sistemi için sabit değerler
 EMBEDDING_DIM = 64  # Embedding vektörlerinin boyutu
@@ -25,11 +37,17 @@ LEARNING_RATE = 0.0005  # Öğrenme oranı
 BATCH_SIZE = 32  # Batch boyutu
 NUM_EPOCHS = 100  # Epoch sayısı
 EARLY_STOPPING_PATIENCE = 15  # Erken durdurma sabırsızlık sınırı
+ARTIFACT_FORMAT_VERSION = 1  # Model dosyası (artifact) biçim sürümü
+SYNTHETIC_DATA_SEED = 42  # Sentetik etkileşim üretecinin varsayılan tohumu
+PREDICT_BATCH_PAIRS = 65536  # Toplu tahminde tek ileri geçişteki en fazla kullanıcı-otel çifti
+EVAL_BATCH_SIZE = 8192  # Doğrulama/değerlendirme ileri geçişlerinin batch boyutu
 
 class ImprovedHotelDataset(Dataset):
     """Otel ve kullanıcı verilerini işleyen geliştirilmiş PyTorch Dataset sınıfı"""
     
-    def __init__(self, users_file: str, hotels_file: str, synthesize_ratings: bool = True):
+    def __init__(self, users_file: str, hotels_file: str, synthesize_ratings: bool = True,
+                 catalog: CatalogSnapshot = None, artifact: 'ModelArtifact' = None,
+                 seed: Optional[int] = SYNTHETIC_DATA_SEED):
         """
         Veri kümesini başlatır ve önişleme yapar.
         
@@ -37,31 +55,46 @@ class ImprovedHotelDataset(Dataset):
             users_file: Kullanıcı verileri JSON dosyasının yolu
             hotels_file: Otel verileri JSON dosyasının yolu
             synthesize_ratings: Eğitim için sentetik puanlama üretilip üretilmeyeceği
+            catalog: Önceden yüklenmiş katalog görüntüsü (verilmezse dosyalardan yüklenir)
+            artifact: Eğitilmiş model dosyası; verilirse ID eşlemeleri ve ölçekler
+                yeniden hesaplanmaz, dosyadaki donmuş değerler kullanılır
+            seed: Sentetik etkileşim üretecinin tohumu (None ise her çalıştırmada farklı veri)
         """
         print(f"Veri dosyaları yükleniyor: {users_file}, {hotels_file}")
         start_time = time.time()
         
         # Veriyi yükle
-        with open(users_file, 'r', encoding='utf-8') as f:
-            self.users = json.load(f)
-            
-        with open(hotels_file, 'r', encoding='utf-8') as f:
-            self.hotels = json.load(f)
+        if catalog is None:
+            catalog = CatalogStore(users_file, hotels_file).snapshot()
+        self.users = list(catalog.users)
+        self.hotels = list(catalog.hotels)
             
         # Dosya yollarını sakla (diğer metodlar için)
         self.users_file = users_file
         self.hotels_file = hotels_file
+        self.seed = seed
+            
+        # Katalogdan derlenmiş ID listeleri ve özellik matrisleri (içerik değişmediyse önbellekten gelir)
+        self.compiled = catalog.compiled
             
         # ID'den indekse eşleme sözlükleri - Önce bunları oluştur
-        self.user_ids = [user['id'] for user in self.users]
-        self.hotel_ids = [hotel['id'] for hotel in self.hotels]
-        
-        self.user_id_to_index = {user_id: idx for idx, user_id in enumerate(self.user_ids)}
-        self.hotel_id_to_index = {hotel_id: idx for idx, hotel_id in enumerate(self.hotel_ids)}
+        if artifact is not None:
+            # Embedding satırları modelin eğitildiği sıraya göre; modelde olmayan kayıtlar veri kümesine alınmaz
+            self.user_ids = list(artifact.user_ids)
+            self.hotel_ids = list(artifact.hotel_ids)
+            self.user_id_to_index = {user_id: idx for idx, user_id in enumerate(self.user_ids)}
+            self.hotel_id_to_index = {hotel_id: idx for idx, hotel_id in enumerate(self.hotel_ids)}
+            self.users = [user for user in self.users if user['id'] in self.user_id_to_index]
+            self.hotels = [hotel for hotel in self.hotels if hotel['id'] in self.hotel_id_to_index]
+        else:
+            self.user_ids = list(self.compiled.user_ids)
+            self.hotel_ids = list(self.compiled.hotel_ids)
+            self.user_id_to_index = dict(self.compiled.user_id_to_index)
+            self.hotel_id_to_index = dict(self.compiled.hotel_id_to_index)
             
         # Kullanıcı ve otel özelliklerini çıkar
-        self.user_features, _ = self._extract_user_features()
-        self.hotel_features, _ = self._extract_hotel_features()
+        self.user_features, _ = self._extract_user_features(artifact.user_scaler if artifact else None)
+        self.hotel_features, _ = self._extract_hotel_features(artifact.hotel_scaler if artifact else None)
         
         # Özellik boyutları
         self.num_user_features = self.user_features.shape[1]
@@ -72,265 +105,100 @@ class ImprovedHotelDataset(Dataset):
         print(f"Veri yükleme tamamlandı. Kullanıcı sayısı: {self.num_users}, Otel sayısı: {self.num_hotels}")
         print(f"Kullanıcı özellik boyutu: {self.num_user_features}, Otel özellik boyutu: {self.num_hotel_features}")
         
+        # Eğitim verileri yalnızca gerektiğinde (eğitim/değerlendirme) oluşturulur
+        self.interactions = None
+        self.X_train = self.X_test = self.y_train = self.y_test = None
+        self._training_tensors = None
+        
         # Sentetik etkileşim/puanlama verileri oluştur
         if synthesize_ratings:
-            self.interactions = self._synthesize_interactions()
-            self.X_train, self.X_test, self.y_train, self.y_test = self._prepare_training_data()
+            self.ensure_training_data()
         
         # GPU kullanılabilirse onu seç
-        self.device = device
+        self.device = get_device()
         print(f"Veri hazırlama süresi: {time.time() - start_time:.2f} saniye")
         
-    def _extract_user_features(self) -> Tuple[np.ndarray, List[int]]:
+    def _extract_user_features(self, scaler: FeatureScaler = None) -> Tuple[np.ndarray, List[int]]:
         """
         Kullanıcı özelliklerini çıkarır ve normalize eder - geliştirilmiş özellik çıkarma
+        
+        Args:
+            scaler: Donmuş ölçek (verilmezse veriden yeniden fit edilir)
         """
         print("Kullanıcı özellikleri çıkarılıyor...")
-        user_data = []
-        user_ids = []
         
-        for user in self.users:
-            user_id = user['id']
-            user_ids.append(user_id)
-            
-            # Bütçe özellikleri
-            min_budget = user['preferredBudget']['min']
-            max_budget = user['preferredBudget']['max']
-            avg_budget = (min_budget + max_budget) / 2
-            budget_range = max_budget - min_budget
-            
-            # Oda tipi tercihi - one-hot encoding
-            is_deluxe = 1 if user['preferredRoomType'] == 'DELUXE' else 0
-            is_standard = 1 if user['preferredRoomType'] == 'STANDARD' else 0
-            
-            # Kapasite
-            required_capacity = user['requiredCapacity']
-            
-            # Tercih edilen özellikler
-            has_wifi = 1 if 'WiFi' in user['preferredAmenities'] else 0
-            has_tv = 1 if 'TV' in user['preferredAmenities'] else 0
-            has_balcony = 1 if 'Balkon' in user['preferredAmenities'] else 0
-            has_minibar = 1 if 'Minibar' in user['preferredAmenities'] else 0
-            
-            # Tercih edilen özellik sayısı
-            preferred_amenity_count = len(user['preferredAmenities'])
-            
-            # Kullanıcı özellik vektörü - daha detaylı
-            features = [
-                min_budget,        # Minimum bütçe
-                max_budget,        # Maksimum bütçe
-                avg_budget,        # Ortalama bütçe
-                budget_range,      # Bütçe aralığı
-                is_deluxe,         # DELUXE oda tercihi
-                is_standard,       # STANDARD oda tercihi
-                required_capacity, # Gerekli kapasite
-                has_wifi,          # WiFi tercihi
-                has_tv,            # TV tercihi
-                has_balcony,       # Balkon tercihi
-                has_minibar,       # Minibar tercihi
-                preferred_amenity_count  # Tercih edilen özellik sayısı
-            ]
-            user_data.append(features)
+        if scaler is not None:
+            # Donmuş ölçekle normalize et, satırları modelin indeks sırasına yerleştir
+            self.user_scaler = scaler
+            return self.compiled.user_matrix(len(self.user_ids), self.user_id_to_index, scaler), self.user_ids
         
-        # Normalize et
-        user_features = np.array(user_data, dtype=np.float32)
-        scaler = MinMaxScaler()
-        user_features = scaler.fit_transform(user_features)
+        # Normalize et - fit edilen ölçek, yeni profiller için donmuş olarak saklanır
+        # (katalog boşsa fit hata verir)
+        self.user_scaler = self.compiled.user_scaler or FeatureScaler.fit(self.compiled.user_raw)
         
-        return user_features, user_ids
+        return self.compiled.user_features, self.user_ids
     
-    def _extract_hotel_features(self) -> Tuple[np.ndarray, List[int]]:
+    def _extract_hotel_features(self, scaler: FeatureScaler = None) -> Tuple[np.ndarray, List[int]]:
         """
         Otel ve oda özelliklerini çıkarır ve normalize eder - geliştirilmiş özellik çıkarma
+        
+        Args:
+            scaler: Donmuş ölçek (verilmezse veriden yeniden fit edilir)
         """
         print("Otel özellikleri çıkarılıyor...")
-        hotel_data = []
-        hotel_ids = []
         
-        for hotel in self.hotels:
-            hotel_id = hotel['id']
-            hotel_ids.append(hotel_id)
-            
-            # Her otel için detaylı özellikler hesapla
-            num_rooms = len(hotel['rooms'])
-            
-            if num_rooms > 0:
-                # Fiyat istatistikleri
-                room_prices = [room['pricePerNight'] for room in hotel['rooms']]
-                avg_price = sum(room_prices) / num_rooms
-                min_price = min(room_prices)
-                max_price = max(room_prices)
-                price_range = max_price - min_price
-                
-                # Oda tipi istatistikleri
-                deluxe_count = sum(1 for room in hotel['rooms'] if room['type'] == 'DELUXE')
-                standard_count = sum(1 for room in hotel['rooms'] if room['type'] == 'STANDARD')
-                deluxe_ratio = deluxe_count / num_rooms
-                standard_ratio = standard_count / num_rooms
-                
-                # Kapasite istatistikleri
-                capacities = [room['capacity'] for room in hotel['rooms']]
-                avg_capacity = sum(capacities) / num_rooms
-                min_capacity = min(capacities)
-                max_capacity = max(capacities)
-                
-                # Özellik istatistikleri
-                wifi_count = sum(1 for room in hotel['rooms'] if room.get('hasWifi', False))
-                tv_count = sum(1 for room in hotel['rooms'] if room.get('hasTV', False))
-                balcony_count = sum(1 for room in hotel['rooms'] if room.get('hasBalcony', False))
-                minibar_count = sum(1 for room in hotel['rooms'] if room.get('hasMinibar', False))
-                
-                wifi_ratio = wifi_count / num_rooms
-                tv_ratio = tv_count / num_rooms
-                balcony_ratio = balcony_count / num_rooms
-                minibar_ratio = minibar_count / num_rooms
-                
-                # Toplam özellik oranı
-                avg_amenity_count = (wifi_ratio + tv_ratio + balcony_ratio + minibar_ratio)
-            else:
-                # Default değerler
-                avg_price = min_price = max_price = price_range = 0
-                deluxe_ratio = standard_ratio = 0
-                avg_capacity = min_capacity = max_capacity = 0
-                wifi_ratio = tv_ratio = balcony_ratio = minibar_ratio = avg_amenity_count = 0
-            
-            # Otel özellik vektörü - daha detaylı
-            features = [
-                avg_price,        # Ortalama oda fiyatı
-                min_price,        # Minimum oda fiyatı
-                max_price,        # Maksimum oda fiyatı
-                price_range,      # Fiyat aralığı
-                deluxe_ratio,     # Deluxe oda oranı
-                standard_ratio,   # Standard oda oranı
-                avg_capacity,     # Ortalama kapasite
-                min_capacity,     # Minimum kapasite
-                max_capacity,     # Maksimum kapasite
-                wifi_ratio,       # WiFi oranı
-                tv_ratio,         # TV oranı
-                balcony_ratio,    # Balkon oranı
-                minibar_ratio,    # Minibar oranı
-                avg_amenity_count # Ortalama özellik sayısı
-            ]
-            hotel_data.append(features)
+        if scaler is not None:
+            # Donmuş ölçekle normalize et, satırları modelin indeks sırasına yerleştir
+            self.hotel_scaler = scaler
+            return self.compiled.hotel_matrix(len(self.hotel_ids), self.hotel_id_to_index, scaler), self.hotel_ids
         
         # Normalize et
-        hotel_features = np.array(hotel_data, dtype=np.float32)
-        scaler = MinMaxScaler()
-        hotel_features = scaler.fit_transform(hotel_features)
+        self.hotel_scaler = self.compiled.hotel_scaler or FeatureScaler.fit(self.compiled.hotel_raw)
+        
+        return self.compiled.hotel_features, self.hotel_ids
+    
+    def ensure_training_data(self):
+        """
+        Sentetik etkileşimleri ve eğitim/test kümelerini henüz oluşturulmadıysa hazırlar.
+        Sadece öneri sunan (serving) kullanımda bu adım hiç çalışmaz.
+        """
+        if self.X_train is not None:
+            return
         
-        return hotel_features, hotel_ids
+        self.interactions = self._synthesize_interactions()
+        self.X_train, self.X_test, self.y_train, self.y_test = self._prepare_training_data()
     
-    def _synthesize_interactions(self) -> pd.DataFrame:
+    def _synthesize_interactions(self) -> Dict[str, np.ndarray]:
         """
         Model eğitimi için geliştirilmiş sentetik kullanıcı-otel etkileşimleri oluşturur
+        
+        Returns:
+            Sütunlu etkileşim dizileri (user_idx, hotel_idx, room_idx, rating)
         """
-        print("Sentetik etkileşimler oluşturuluyor...")
-        interactions = []
+        from tqdm import tqdm
         
-        # Her kullanıcı için
-        for user in tqdm(self.users, desc="Kullanıcı İşleniyor"):
-            user_id = user['id']
-            user_idx = self.user_id_to_index[user_id]
-            
-            # Kullanıcı tercihleri
-            user_budget_min = user['preferredBudget']['min']
-            user_budget_max = user['preferredBudget']['max']
-            user_room_type = user['preferredRoomType']
-            user_required_capacity = user['requiredCapacity']
-            user_amenities = user['preferredAmenities']
-            
-            # Her otel için kontrol et
-            for hotel in self.hotels:
-                hotel_id = hotel['id']
-                
-                if not hotel.get('rooms'):
-                    continue
-                
-                # Uygun odaları bul (kullanıcı bütçesine ve kapasitesine göre)
-                suitable_rooms = []
-                for room in hotel['rooms']:
-                    price_match = user_budget_min <= room['pricePerNight'] <= user_budget_max
-                    capacity_match = room['capacity'] >= user_required_capacity
-                    
-                    if price_match and capacity_match:
-                        suitable_rooms.append(room)
-                
-                # Eğer uygun oda yoksa, bu otel için düşük puan ver
-                if not suitable_rooms:
-                    rating = random.uniform(1.0, 2.0)  # Düşük puan
-                    interactions.append({
-                        'user_id': user_id,
-                        'hotel_id': hotel_id,
-                        'rating': rating
-                    })
-                    continue
-                
-                # En uygun odayı seç (tercihen kullanıcının istediği oda tipinde)
-                preferred_rooms = [room for room in suitable_rooms if room['type'] == user_room_type]
-                selected_room = preferred_rooms[0] if preferred_rooms else suitable_rooms[0]
-                
-                # Oda özellikleri kontrolü
-                amenity_match_count = 0
-                if 'WiFi' in user_amenities and selected_room.get('hasWifi', False):
-                    amenity_match_count += 1
-                if 'TV' in user_amenities and selected_room.get('hasTV', False):
-                    amenity_match_count += 1
-                if 'Balkon' in user_amenities and selected_room.get('hasBalcony', False):
-                    amenity_match_count += 1
-                if 'Minibar' in user_amenities and selected_room.get('hasMinibar', False):
-                    amenity_match_count += 1
-                
-                # Özellik uyumu skoru (0-1 arası)
-                amenity_score = amenity_match_count / max(1, len(user_amenities))
-                
-                # Oda tipi uyum skoru
-                room_type_score = 1.0 if selected_room['type'] == user_room_type else 0.3
-                
-                # Fiyat uyum skoru - tercihen orta bütçeye yakın olsun
-                user_budget_avg = (user_budget_min + user_budget_max) / 2
-                budget_distance = abs(selected_room['pricePerNight'] - user_budget_avg) / user_budget_avg
-                price_score = max(0, 1 - budget_distance)
-                
-                # Toplam puanlamayı hesapla (1-5 arası)
-                # Ağırlıklandırılmış skor
-                base_rating = 1.0 + 4.0 * (0.4 * price_score + 0.3 * room_type_score + 0.3 * amenity_score)
-                
-                # Rasgeleleştirme ekle (gerçek verilere benzemesi için)
-                noise = np.random.normal(0, 0.2)  # Az gürültü ekle
-                rating = min(5, max(1, base_rating + noise))
-                
-                interactions.append({
-                    'user_id': user_id,
-                    'hotel_id': hotel_id,
-                    'room_id': selected_room['id'],  # Oda ID'sini de ekleyelim
-                    'rating': rating
-                })
-        
-        return pd.DataFrame(interactions)
+        print("Sentetik etkileşimler oluşturuluyor...")
+        table = RoomTable(self.hotels)
+        user_indices = [self.user_id_to_index[user['id']] for user in self.users]
+        hotel_indices = [self.hotel_id_to_index[hotel_id] for hotel_id in table.hotel_ids]
+        
+        with tqdm(total=len(self.users), desc="Kullanıcı İşleniyor") as pbar:
+            return synthesize_interactions(
+                self.users, table, user_indices, hotel_indices,
+                np.random.default_rng(self.seed), progress=pbar.update
+            )
     
     def _prepare_training_data(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
         Modeli eğitmek için eğitim ve test veri kümelerini hazırlar
         """
+        from sklearn.model_selection import train_test_split
+        
         print("Eğitim verileri hazırlanıyor...")
         # Etkileşim verisinden özellik matrisi oluştur
-        X = []
-        y = []
-        
-        for _, row in self.interactions.iterrows():
-            user_id = row['user_id']
-            hotel_id = row['hotel_id']
-            rating = row['rating']
-            
-            user_idx = self.user_id_to_index[user_id]
-            hotel_idx = self.hotel_id_to_index[hotel_id]
-            
-            # Kullanıcı ID'si ve otel ID'si
-            X.append([user_idx, hotel_idx])
-            y.append(rating)
-        
-        X = np.array(X)
-        y = np.array(y, dtype=np.float32)
+        # Kullanıcı indeksi ve otel indeksi
+        X = np.column_stack([self.interactions['user_idx'], self.interactions['hotel_idx']])
+        y = self.interactions['rating'].astype(np.float32)
         
         print(f"Toplam etkileşim sayısı: {len(X)}")
         
@@ -346,8 +214,35 @@ class ImprovedHotelDataset(Dataset):
         
         return X_train, X_test, y_train, y_test
     
+    def training_tensors(self, device) -> Dict[str, torch.Tensor]:
+        """
+        Eğitim kümesini ve özellik matrislerini cihazda bitişik tensörler olarak döndürür.
+        Batch'ler bu tensörlerden indeksleme ile alınır; örnek başına tensör oluşturulmaz.
+        
+        Args:
+            device: Tensörlerin tutulacağı cihaz
+            
+        Returns:
+            user_idx, hotel_idx, rating, user_features ve hotel_features tensörleri
+        """
+        self.ensure_training_data()
+        cached = self._training_tensors
+        if cached is not None and cached[0] is self.X_train and cached[1] == torch.device(device):
+            return cached[2]
+        
+        tensors = {
+            'user_idx': torch.as_tensor(np.ascontiguousarray(self.X_train[:, 0]), dtype=torch.long).to(device),
+            'hotel_idx': torch.as_tensor(np.ascontiguousarray(self.X_train[:, 1]), dtype=torch.long).to(device),
+            'rating': torch.as_tensor(self.y_train, dtype=torch.float).to(device),
+            'user_features': torch.as_tensor(self.user_features, dtype=torch.float).contiguous().to(device),
+            'hotel_features': torch.as_tensor(self.hotel_features, dtype=torch.float).contiguous().to(device),
+        }
+        self._training_tensors = (self.X_train, torch.device(device), tensors)
+        return tensors
+    
     def __len__(self):
         """DataLoader için veri kümesi boyutu"""
+        self.ensure_training_data()
         return len(self.X_train)
     
     def __getitem__(self, idx):
@@ -364,25 +259,70 @@ class ImprovedHotelDataset(Dataset):
             'hotel_features': torch.tensor(self.hotel_features[hotel_idx], dtype=torch.float),
             'rating': torch.tensor(rating, dtype=torch.float)
         }
+
+def regression_metrics(predictions: np.ndarray, targets: np.ndarray,
+                       tolerances: Sequence[float] = (0.5,)) -> Dict[str, Any]:
+    """
+    Tahminler ve gerçek puanlar için hata metriklerini vektörel olarak hesaplar
     
-    def get_test_data(self):
-        """Test verilerini döndürür"""
-        test_data = []
-        
-        for i in range(len(self.X_test)):
-            user_idx = self.X_test[i][0]
-            hotel_idx = self.X_test[i][1]
-            rating = self.y_test[i]
-            
-            test_data.append({
-                'user_idx': torch.tensor(user_idx, dtype=torch.long),
-                'hotel_idx': torch.tensor(hotel_idx, dtype=torch.long),
-                'user_features': torch.tensor(self.user_features[user_idx], dtype=torch.float),
-                'hotel_features': torch.tensor(self.hotel_features[hotel_idx], dtype=torch.float),
-                'rating': torch.tensor(rating, dtype=torch.float)
-            })
-        
-        return test_data 
+    Returns:
+        mse, rmse, mae ve within_tolerance (tolerans -> tolerans içindeki tahmin oranı)
+    """
+    errors = np.asarray(predictions, dtype=np.float64) - np.asarray(targets, dtype=np.float64)
+    abs_errors = np.abs(errors)
+    mse = float(np.mean(errors ** 2)) if len(errors) else 0.0
+    return {
+        'mse': mse,
+        'rmse': float(np.sqrt(mse)),
+        'mae': float(np.mean(abs_errors)) if len(errors) else 0.0,
+        'within_tolerance': {tol: float(np.mean(abs_errors <= tol)) if len(errors) else 0.0 for tol in tolerances}
+    }
+
+
+class TensorBatchIterator:
+    """
+    Cihazda tutulan eğitim tensörlerinden karıştırılmış indeks batch'leri üreten yineleyici
+    (DataLoader'ın shuffle=True davranışına karşılık gelir, örnek başına Python işi yapılmaz)
+    """
+    
+    def __init__(self, tensors: Dict[str, torch.Tensor], batch_size: int, shuffle: bool = True,
+                 generator: torch.Generator = None):
+        """
+        Args:
+            tensors: ImprovedHotelDataset.training_tensors() çıktısı
+            batch_size: Batch boyutu
+            shuffle: Her epoch'ta sıranın karıştırılıp karıştırılmayacağı
+            generator: Karıştırma için rastgele sayı üreteci (opsiyonel)
+        """
+        self.tensors = tensors
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.generator = generator
+        self.num_samples = len(tensors['rating'])
+    
+    def __len__(self):
+        return (self.num_samples + self.batch_size - 1) // self.batch_size
+    
+    def __iter__(self) -> Iterator[Dict[str, torch.Tensor]]:
+        tensors = self.tensors
+        device = tensors['rating'].device
+        if self.shuffle:
+            order = torch.randperm(self.num_samples, generator=self.generator).to(device)
+        else:
+            order = torch.arange(self.num_samples, device=device)
+        
+        for start in range(0, self.num_samples, self.batch_size):
+            index = order[start:start + self.batch_size]
+            user_idx = tensors['user_idx'][index]
+            hotel_idx = tensors['hotel_idx'][index]
+            yield {
+                'user_idx': user_idx,
+                'hotel_idx': hotel_idx,
+                'user_features': tensors['user_features'][user_idx],
+                'hotel_features': tensors['hotel_features'][hotel_idx],
+                'rating': tensors['rating'][index]
+            }
+
 
 class ImprovedRecommenderNet(nn.Module):
     """
@@ -458,12 +398,16 @@ class ImprovedRecommenderNet(nn.Module):
         # Son çıktı katmanı
         self.output_layer = nn.Linear(prev_dim, 1)
         
-        # Çıktıyı 1-5 aralığına sınırlamak için sigmoid aktivasyonu ve ölçekleme
-        self.rating_activation = lambda x: 1 + 4 * torch.sigmoid(x)
+        # Kullanıcı/otel vektörlerini ayırmak için embedding boyutu
+        self.embedding_dim = EMBEDDING_DIM
         
         # Ağırlık başlatma
         self._init_weights()
     
+    def rating_activation(self, x):
+        """Çıktıyı 1-5 aralığına sınırlamak için sigmoid aktivasyonu ve ölçekleme"""
+        return 1 + 4 * torch.sigmoid(x)
+    
     def _init_weights(self):
         """Model ağırlıklarını başlat"""
         # Embedding katmanları için normal dağılım
@@ -489,6 +433,20 @@ class ImprovedRecommenderNet(nn.Module):
         """
         # Embedding vektörlerini çıkar
         user_emb = self.user_embedding(user_idx)
+        return self.forward_with_user_embedding(user_emb, hotel_idx, user_features, hotel_features)
+    
+    @torch.jit.export
+    def cold_start_user_embedding(self):
+        """
+        Sisteme kayıtlı olmayan (embedding'i öğrenilmemiş) kullanıcılar için
+        temsil vektörü: eğitilmiş kullanıcı embedding'lerinin ortalaması
+        """
+        return self.user_embedding.weight.mean(dim=0)
+    
+    def forward_with_user_embedding(self, user_emb, hotel_idx, user_features, hotel_features):
+        """
+        Kullanıcı embedding'i doğrudan verilerek yapılan ileri geçiş (soğuk başlangıç için)
+        """
         hotel_emb = self.hotel_embedding(hotel_idx)
         
         # Özellikleri dönüştür
@@ -498,6 +456,10 @@ class ImprovedRecommenderNet(nn.Module):
         # Vektörleri birleştir
         combined = torch.cat([user_emb, hotel_emb, user_feat, hotel_feat], dim=1)
         
+        return self._rating_head(combined)
+    
+    def _rating_head(self, combined):
+        """Birleştirilmiş vektörlerden puanı üretir (gizli katmanlar + çıktı katmanı)"""
         # Gizli katmanlardan geçir
         x = self.hidden_layers(combined)
         
@@ -506,13 +468,136 @@ class ImprovedRecommenderNet(nn.Module):
         rating = self.rating_activation(rating)
         
         return rating.squeeze()
+    
+    @torch.jit.export
+    def hotel_vectors(self, hotel_idx, hotel_features):
+        """
+        Yalnızca otele bağlı taraf: [otel embedding'i, otel özellik dönüşümü] (otel sayısı x 2*EMBEDDING_DIM).
+        Model ağırlıkları değişmedikçe sabittir; sunumda bir kez hesaplanıp önbelleklenir.
+        """
+        return torch.cat([self.hotel_embedding(hotel_idx), self.hotel_features_network(hotel_features)], dim=1)
+    
+    @torch.jit.export
+    def user_vectors(self, user_emb, user_features):
+        """Yalnızca kullanıcıya bağlı taraf: [kullanıcı embedding'i, kullanıcı özellik dönüşümü]"""
+        return torch.cat([user_emb, self.user_features_network(user_features)], dim=1)
+    
+    @torch.jit.export
+    def forward_from_vectors(self, user_vecs, hotel_vecs):
+        """
+        Önceden hesaplanmış kullanıcı ve otel vektörlerinden (eşleşen satırlar) ileri geçiş;
+        yalnızca gizli katmanlar ve çıktı katmanı çalışır. Sonuç forward() ile aynıdır.
+        """
+        embedding_dim = self.embedding_dim
+        combined = torch.cat([
+            user_vecs[:, :embedding_dim], hotel_vecs[:, :embedding_dim],
+            user_vecs[:, embedding_dim:], hotel_vecs[:, embedding_dim:]
+        ], dim=1)
+        return self._rating_head(combined)
+
+class ModelArtifact:
+    """
+    Kendi kendini tanımlayan model dosyası: ağırlıklar, ölçek parametreleri,
+    kullanıcı/otel ID -> indeks eşlemeleri, özellik şeması (ve özeti) ile eğitim bilgileri.
+    
+    Sunum sırasında ID eşlemeleri ve ölçekler ham veriden yeniden hesaplanmaz;
+    uyumsuzluk yükleme anında ModelArtifactError ile bildirilir.
+    """
+    
+    def __init__(self, state_dict: Dict[str, torch.Tensor], user_ids: List[Any], hotel_ids: List[Any],
+                 user_scaler: FeatureScaler, hotel_scaler: FeatureScaler, metadata: Dict[str, Any] = None):
+        self.state_dict = state_dict
+        self.user_ids = list(user_ids)
+        self.hotel_ids = list(hotel_ids)
+        self.user_scaler = user_scaler
+        self.hotel_scaler = hotel_scaler
+        self.metadata = dict(metadata or {})
+    
+    def save(self, path: str):
+        """
+        Model dosyasını yazar. Önce geçici dosyaya yazılır ve ardından yerine taşınır,
+        böylece dosyayı okuyan başka bir süreç yarım yazılmış bir dosya görmez.
+        """
+        bundle = {
+            'format_version': ARTIFACT_FORMAT_VERSION,
+            'state_dict': self.state_dict,
+            'feature_schema': FEATURE_SCHEMA,
+            'schema_hash': feature_schema_hash(),
+            'scalers': {
+                'user': {'min': self.user_scaler.min_.tolist(), 'scale': self.user_scaler.scale_.tolist()},
+                'hotel': {'min': self.hotel_scaler.min_.tolist(), 'scale': self.hotel_scaler.scale_.tolist()},
+            },
+            'user_ids': self.user_ids,
+            'hotel_ids': self.hotel_ids,
+            'metadata': self.metadata,
+        }
+        
+        tmp_path = f"{path}.tmp"
+        torch.save(bundle, tmp_path)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: str, map_location=None) -> Optional['ModelArtifact']:
+        """
+        Model dosyasını okur ve doğrular
+        
+        Returns:
+            ModelArtifact; dosya yalnızca state_dict içeren eski biçimdeyse None
+        
+        Raises:
+            ModelArtifactError: Dosya okunamazsa veya şema/boyutlar uyumsuzsa
+        """
+        try:
+            bundle = torch.load(path, map_location=map_location, weights_only=True)
+        except Exception as e:
+            raise ModelArtifactError(f"Model dosyası okunamadı ({path}): {e}") from e
+        
+        if not isinstance(bundle, dict):
+            raise ModelArtifactError(f"Model dosyası tanınmayan biçimde: {path}")
+        
+        # Eski biçim: yalnızca state_dict
+        if 'format_version' not in bundle:
+            return None
+        
+        if bundle['format_version'] != ARTIFACT_FORMAT_VERSION:
+            raise ModelArtifactError(
+                f"Desteklenmeyen model dosyası sürümü: {bundle['format_version']} (beklenen: {ARTIFACT_FORMAT_VERSION})"
+            )
+        
+        missing = [key for key in ('state_dict', 'schema_hash', 'scalers', 'user_ids', 'hotel_ids') if key not in bundle]
+        if missing:
+            raise ModelArtifactError(f"Model dosyasında eksik alanlar: {', '.join(missing)}")
+        
+        if bundle['schema_hash'] != feature_schema_hash():
+            raise ModelArtifactError(
+                "Model dosyasının özellik şeması mevcut kodla uyumsuz "
+                f"(dosya: {bundle['schema_hash'][:12]}, kod: {feature_schema_hash()[:12]})"
+            )
+        
+        state_dict = bundle['state_dict']
+        scalers = bundle['scalers']
+        user_scaler = FeatureScaler(scalers['user']['min'], scalers['user']['scale'])
+        hotel_scaler = FeatureScaler(scalers['hotel']['min'], scalers['hotel']['scale'])
+        
+        if len(user_scaler.scale_) != len(USER_FEATURE_NAMES) or len(hotel_scaler.scale_) != len(HOTEL_FEATURE_NAMES):
+            raise ModelArtifactError("Model dosyasındaki ölçek parametreleri özellik şemasıyla uyumsuz")
+        
+        for key, ids in (('user_embedding.weight', bundle['user_ids']), ('hotel_embedding.weight', bundle['hotel_ids'])):
+            if key not in state_dict or state_dict[key].shape[0] != len(ids):
+                raise ModelArtifactError(f"Model dosyasındaki '{key}' boyutu ID eşlemesiyle uyumsuz")
+        
+        return cls(state_dict, bundle['user_ids'], bundle['hotel_ids'], user_scaler, hotel_scaler,
+                   bundle.get('metadata'))
 
-class ImprovedLearningRecommender:
+
+class ImprovedLearningRecommender(BaseRecommender):
     """
     Otel önerilerinde kullanılmak üzere geliştirilmiş derin öğrenme tabanlı öneri sistemi
+    (PyTorch modeli; eğitim, değerlendirme ve puanlama - sıralama/açıklama BaseRecommender'da)
     """
     
-    def __init__(self, users_file: str, hotels_file: str, model_path: str = "improved_hotel_recommender_model.pth"):
+    def __init__(self, users_file: str, hotels_file: str, model_path: str = "improved_hotel_recommender_model.pth",
+                 inference_backend: str = 'eager'):
         """
         Geliştirilmiş derin öğrenme tabanlı öneri sistemini başlatır
         
@@ -520,16 +605,55 @@ class ImprovedLearningRecommender:
             users_file: Kullanıcı verileri JSON dosyasının yolu
             hotels_file: Otel verileri JSON dosyasının yolu
             model_path: Eğitilmiş modelin kaydedileceği/yükleneceği dosya yolu
+            inference_backend: Öneri puanlamasında kullanılacak model (INFERENCE_BACKENDS)
         """
+        if inference_backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"Geçersiz çıkarım modeli: {inference_backend} (geçerli: {', '.join(INFERENCE_BACKENDS)})")
+        device = get_device()
+        if inference_backend == 'int8' and device.type != 'cpu':
+            raise ValueError("int8 çıkarım modeli yalnızca CPU'da çalışır")
+        self.inference_backend = inference_backend
+        
         start_time = time.time()
         print("İyileştirilmiş öneri sistemi başlatılıyor...")
         
-        # Veri kümesini başlat
-        self.dataset = ImprovedHotelDataset(users_file, hotels_file)
+        # Katalog verilerini bellekte tut - dosyalar yalnızca değiştiğinde yeniden okunur
+        self.catalog = CatalogStore(users_file, hotels_file)
+        
+        # Kaydedilmiş model dosyasını oku ve doğrula; yeni biçimde ise ID eşlemeleri ve
+        # ölçekler dosyadan gelir, eski biçimde (yalnızca state_dict) veriden hesaplanır
+        artifact = None
+        legacy_state_dict = None
+        if os.path.exists(model_path):
+            artifact = ModelArtifact.load(model_path, map_location=device)
+            if artifact is None:
+                legacy_state_dict = torch.load(model_path, map_location=device, weights_only=True)
+        
+        # Veri kümesini başlat - sadece ID eşlemeleri ve özellik matrisleri;
+        # sentetik eğitim verileri train()/evaluate() çağrılınca hazırlanır
+        self.dataset = ImprovedHotelDataset(
+            users_file, hotels_file, synthesize_ratings=False, catalog=self.catalog.snapshot(), artifact=artifact
+        )
+        
+        # Model dosyasındaki eğitim bilgileri ve yüklü modelin sürümü (dosya içerik özeti)
+        self.model_metadata = artifact.metadata if artifact is not None else {}
+        self.model_version = None
         
         # Model dosya yolu
         self.model_path = model_path
         
+        # Oda tablosundaki otellerin model indeksleri (tablo nesnesine göre önbelleklenir)
+        self._room_table_indices = None
+        
+        # Kayıtlı olmayan profiller için soğuk başlangıç kullanıcı temsili (ilk kullanımda hesaplanır)
+        self._cold_start_user_embedding = None
+        
+        # Tüm otellerin otel tarafı vektörleri (ilk kullanımda hesaplanır, model ağırlıkları değişene kadar geçerli)
+        self._hotel_vector_cache = None
+        
+        # Öneri puanlamasında kullanılan model (ilk kullanımda hazırlanır, model ağırlıkları değişene kadar geçerli)
+        self._serving_model_cache = None
+        
         # Model oluştur
         self.model = ImprovedRecommenderNet(
             num_users=self.dataset.num_users,
@@ -539,11 +663,17 @@ class ImprovedLearningRecommender:
         ).to(self.dataset.device)
         
         # Eğer daha önce kaydedilmiş bir model varsa yükle
-        if os.path.exists(model_path):
-            self.model.load_state_dict(torch.load(model_path, map_location=self.dataset.device))
+        if artifact is not None or legacy_state_dict is not None:
+            state_dict = artifact.state_dict if artifact is not None else legacy_state_dict
+            try:
+                self.model.load_state_dict(state_dict)
+            except RuntimeError as e:
+                raise ModelArtifactError(f"Model ağırlıkları mevcut model yapısıyla uyumsuz: {e}") from e
             self.model.eval()
+            self.model_version = self._checkpoint_version(model_path)
             print(f"Kaydedilmiş model '{model_path}' başarıyla yüklendi.")
         else:
+            self.model_version = "untrained"
             print("Kaydedilmiş model bulunamadı. Eğitim gerekiyor.")
             
         print(f"Öneri sistemi başlatma süresi: {time.time() - start_time:.2f} saniye")
@@ -555,21 +685,26 @@ class ImprovedLearningRecommender:
         Args:
             evaluate: Eğitim sonrası değerlendirme yapılıp yapılmayacağı
         """
-        # DataLoader oluştur
-        train_loader = DataLoader(
-            self.dataset, 
-            batch_size=BATCH_SIZE, 
-            shuffle=True,
-            num_workers=0,  # Windows'ta sorun çıkabiliyor, ihtiyaca göre artırılabilir
-            pin_memory=True if torch.cuda.is_available() else False
+        import matplotlib.pyplot as plt
+        from tqdm import tqdm
+        
+        # Sentetik eğitim verilerini hazırla (henüz yoksa)
+        self.dataset.ensure_training_data()
+        
+        # Eğitim verileri cihazda tensör olarak tutulur, batch'ler indeksleme ile alınır
+        train_loader = TensorBatchIterator(
+            self.dataset.training_tensors(self.dataset.device),
+            batch_size=BATCH_SIZE,
+            shuffle=True
         )
         
         # Optimizasyon ve kayıp fonksiyonunu tanımla
         optimizer = optim.Adam(self.model.parameters(), lr=LEARNING_RATE, weight_decay=1e-5)
         
-        # Öğrenme oranı zamanlayıcısı ekle
+        # Öğrenme oranı zamanlayıcısı ekle (yeni PyTorch sürümlerinde 'verbose' parametresi yok,
+        # öğrenme oranı değişimi aşağıda elle yazdırılır)
         scheduler = optim.lr_scheduler.ReduceLROnPlateau(
-            optimizer, mode='min', factor=0.5, patience=5, verbose=True, min_lr=1e-6
+            optimizer, mode='min', factor=0.5, patience=5, min_lr=1e-6
         )
         
         # MSE kaybını kullan
@@ -585,6 +720,9 @@ class ImprovedLearningRecommender:
         indices = list(range(len(self.dataset.X_train)))
         np.random.shuffle(indices)
         train_indices, val_indices = indices[:train_size], indices[train_size:]
+        val_user_idx = self.dataset.X_train[val_indices, 0]
+        val_hotel_idx = self.dataset.X_train[val_indices, 1]
+        val_ratings = self.dataset.y_train[val_indices]
         
         print(f"Model eğitimi başlatılıyor... Toplam {NUM_EPOCHS} epoch")
         print(f"GPU kullanımı: {self.dataset.device}")
@@ -602,12 +740,12 @@ class ImprovedLearningRecommender:
             
             with tqdm(train_loader, desc=f"Epoch {epoch+1}/{NUM_EPOCHS}") as pbar:
                 for batch in pbar:
-                    # Batch'i cihaza taşı
-                    user_idx = batch['user_idx'].to(self.dataset.device)
-                    hotel_idx = batch['hotel_idx'].to(self.dataset.device)
-                    user_features = batch['user_features'].to(self.dataset.device)
-                    hotel_features = batch['hotel_features'].to(self.dataset.device)
-                    ratings = batch['rating'].to(self.dataset.device)
+                    # Batch zaten cihazda
+                    user_idx = batch['user_idx']
+                    hotel_idx = batch['hotel_idx']
+                    user_features = batch['user_features']
+                    hotel_features = batch['hotel_features']
+                    ratings = batch['rating']
                     
                     # Gradyanları sıfırla
                     optimizer.zero_grad()
@@ -628,39 +766,28 @@ class ImprovedLearningRecommender:
                     optimizer.step()
                     
                     # Kaybı topla
-                    epoch_loss += loss.item()
+                    loss_value = loss.item()
+                    epoch_loss += loss_value
                     batch_count += 1
                     
                     # Progress bar güncelle
-                    pbar.set_postfix({"loss": f"{loss.item():.4f}"})
+                    pbar.set_postfix({"loss": f"{loss_value:.4f}"})
             
             # Epoch sonunda kaybı göster
             avg_loss = epoch_loss / max(1, batch_count)
             loss_history.append(avg_loss)
             
-            # Doğrulama aşaması
+            # Doğrulama aşaması - büyük batch'lerle, örnek başına ortalama kare hata
             self.model.eval()
-            val_loss = 0
-            val_samples = 0
-            
-            with torch.no_grad():
-                for idx in val_indices:
-                    sample = self.dataset[idx]
-                    user_idx = sample['user_idx'].unsqueeze(0).to(self.dataset.device)
-                    hotel_idx = sample['hotel_idx'].unsqueeze(0).to(self.dataset.device)
-                    user_features = sample['user_features'].unsqueeze(0).to(self.dataset.device)
-                    hotel_features = sample['hotel_features'].unsqueeze(0).to(self.dataset.device)
-                    rating = sample['rating'].unsqueeze(0).to(self.dataset.device)
-                    
-                    prediction = self.model(user_idx, hotel_idx, user_features, hotel_features)
-                    val_loss += criterion(prediction, rating).item()
-                    val_samples += 1
-            
-            avg_val_loss = val_loss / max(1, val_samples)
+            val_predictions = self.predict_pairs(val_user_idx, val_hotel_idx)
+            avg_val_loss = regression_metrics(val_predictions, val_ratings)['mse']
             val_loss_history.append(avg_val_loss)
             
             # Öğrenme oranı zamanlayıcısını güncelle
+            previous_lr = optimizer.param_groups[0]['lr']
             scheduler.step(avg_val_loss)
+            if optimizer.param_groups[0]['lr'] < previous_lr:
+                print(f"Öğrenme oranı düşürüldü: {previous_lr:.2e} -> {optimizer.param_groups[0]['lr']:.2e}")
             
             # Epoch süresini hesapla
             epoch_time = time.time() - epoch_start_time
@@ -670,7 +797,7 @@ class ImprovedLearningRecommender:
                 best_val_loss = avg_val_loss
                 patience_counter = 0
                 # En iyi model olarak kaydet
-                torch.save(self.model.state_dict(), self.model_path)
+                self.save_artifact(metadata={'best_val_loss': best_val_loss, 'best_epoch': epoch + 1})
                 print(f"Epoch {epoch+1}/{NUM_EPOCHS}, Eğitim Kaybı: {avg_loss:.4f}, Doğrulama Kaybı: {avg_val_loss:.4f}, Süre: {epoch_time:.1f}s - Model kaydedildi!")
             else:
                 patience_counter += 1
@@ -682,7 +809,13 @@ class ImprovedLearningRecommender:
                     break
         
         # En iyi modeli yükle
-        self.model.load_state_dict(torch.load(self.model_path))
+        artifact = ModelArtifact.load(self.model_path, map_location=self.dataset.device)
+        self.model.load_state_dict(artifact.state_dict)
+        self.model_metadata = artifact.metadata
+        self.model_version = self._checkpoint_version(self.model_path)
+        self._cold_start_user_embedding = None
+        self._hotel_vector_cache = None
+        self._serving_model_cache = None
         print(f"En iyi model '{self.model_path}' başarıyla yüklendi.")
         
         # Eğitim sonrası değerlendirme
@@ -701,52 +834,86 @@ class ImprovedLearningRecommender:
         plt.savefig('improved_training_loss.png')
         print("Eğitim kaybı grafiği 'improved_training_loss.png' olarak kaydedildi.")
         
+    def save_artifact(self, path: str = None, metadata: Dict[str, Any] = None):
+        """
+        Modeli; ölçek parametreleri, ID eşlemeleri, özellik şeması ve eğitim bilgileriyle
+        birlikte tek bir dosyaya kaydeder
+        
+        Args:
+            path: Kayıt yolu (verilmezse model_path kullanılır)
+            metadata: Eğitim bilgilerine eklenecek ek alanlar
+        """
+        snapshot = self.catalog.snapshot()
+        info = {
+            'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+            'num_users': self.dataset.num_users,
+            'num_hotels': self.dataset.num_hotels,
+            'embedding_dim': EMBEDDING_DIM,
+            'hidden_layers': list(HIDDEN_LAYERS),
+            'users_hash': snapshot.users_hash,
+            'hotels_hash': snapshot.hotels_hash,
+        }
+        info.update(metadata or {})
+        
+        state_dict = {key: value.detach().cpu() for key, value in self.model.state_dict().items()}
+        artifact = ModelArtifact(
+            state_dict, self.dataset.user_ids, self.dataset.hotel_ids,
+            self.dataset.user_scaler, self.dataset.hotel_scaler, info
+        )
+        artifact.save(path or self.model_path)
+    
+    def predict_pairs(self, user_idx: np.ndarray, hotel_idx: np.ndarray,
+                      batch_size: int = EVAL_BATCH_SIZE, model: nn.Module = None) -> np.ndarray:
+        """
+        Kullanıcı-otel indeks çiftleri için model tahminlerini büyük batch'lerle hesaplar
+        
+        Args:
+            user_idx: Kullanıcıların model indeksleri
+            hotel_idx: Otellerin model indeksleri
+            batch_size: Tek ileri geçişteki çift sayısı
+            model: Tahminde kullanılacak model (verilmezse eğitilen model; ör. çıkarım modelleri karşılaştırması için)
+            
+        Returns:
+            Her çift için tahmin edilen puan (float32)
+        """
+        device = self.dataset.device
+        tensors = self.dataset.training_tensors(device)
+        user_idx = torch.as_tensor(np.asarray(user_idx), dtype=torch.long, device=device)
+        hotel_idx = torch.as_tensor(np.asarray(hotel_idx), dtype=torch.long, device=device)
+        
+        model = model if model is not None else self.model
+        predictions = np.empty(len(user_idx), dtype=np.float32)
+        with torch.inference_mode():
+            for start in range(0, len(user_idx), batch_size):
+                users = user_idx[start:start + batch_size]
+                hotels = hotel_idx[start:start + batch_size]
+                output = model(users, hotels, tensors['user_features'][users], tensors['hotel_features'][hotels])
+                predictions[start:start + len(users)] = output.reshape(-1).cpu().numpy()
+        
+        return predictions
+    
     def evaluate(self):
         """
         Modeli test verileri üzerinde değerlendirir ve detaylı metrikler üretir
+        
+        Returns:
+            regression_metrics() çıktısı (mse, rmse, mae, within_tolerance)
         """
+        import matplotlib.pyplot as plt
+        
         print("\nModel değerlendiriliyor...")
         self.model.eval()
-        test_data = self.dataset.get_test_data()
-        criterion = nn.MSELoss()
+        self.dataset.ensure_training_data()
         
-        total_loss = 0
-        all_predictions = []
-        all_targets = []
-        
-        with torch.no_grad():
-            for sample in tqdm(test_data, desc="Test örnekleri işleniyor"):
-                user_idx = sample['user_idx'].to(self.dataset.device)
-                hotel_idx = sample['hotel_idx'].to(self.dataset.device)
-                user_features = sample['user_features'].to(self.dataset.device)
-                hotel_features = sample['hotel_features'].to(self.dataset.device)
-                rating = sample['rating'].to(self.dataset.device)
-                
-                # Tahmin yap
-                prediction = self.model(
-                    user_idx.unsqueeze(0), 
-                    hotel_idx.unsqueeze(0), 
-                    user_features.unsqueeze(0), 
-                    hotel_features.unsqueeze(0)
-                )
-                
-                # Kaybı hesapla
-                loss = criterion(prediction, rating)
-                total_loss += loss.item()
-                
-                all_predictions.append(prediction.item())
-                all_targets.append(rating.item())
-        
-        # Ortalama karesel hata
-        mse = total_loss / len(test_data)
-        rmse = np.sqrt(mse)
-        
-        # Ortalama mutlak hata
-        mae = np.mean(np.abs(np.array(all_predictions) - np.array(all_targets)))
+        # Test kümesi tahminleri - büyük batch'lerle
+        all_targets = self.dataset.y_test
+        all_predictions = self.predict_pairs(self.dataset.X_test[:, 0], self.dataset.X_test[:, 1])
         
         # 0.5 puanlık tolerans içindeki tahminlerin oranı
         tolerance = 0.5
-        within_tolerance = np.mean(np.abs(np.array(all_predictions) - np.array(all_targets)) <= tolerance)
+        metrics = regression_metrics(all_predictions, all_targets, tolerances=(tolerance,))
+        mse, rmse, mae = metrics['mse'], metrics['rmse'], metrics['mae']
+        within_tolerance = metrics['within_tolerance'][tolerance]
         
         print(f"Test MSE: {mse:.4f}")
         print(f"Test RMSE: {rmse:.4f}")
@@ -771,361 +938,134 @@ class ImprovedLearningRecommender:
         plt.savefig('improved_predictions_vs_targets.png')
         print("Tahmin değerlendirme grafiği 'improved_predictions_vs_targets.png' olarak kaydedildi.")
         
-    def recommend_hotels(self, user_id: int, top_n: int = 5, debug: bool = False) -> List[Dict[str, Any]]:
+        return metrics
+        
+    def _prepare_inference(self):
+        """Modeli değerlendirme (eval) moduna alır"""
+        self.model.eval()
+    
+    def warm_up(self, num_users: int = 8):
+        """
+        Modeli sunuma almadan önce ısıtır: çıkarım modeli, soğuk başlangıç temsili ve otel
+        vektörleri hazırlanır, ardından deneme önerileri hesaplanır
+        
+        Args:
+            num_users: Deneme önerisi hazırlanacak kullanıcı sayısı
+        """
+        self._prepare_inference()
+        self._serving_model()
+        self._cold_start_embedding()
+        self._hotel_vectors()
+        super().warm_up(num_users)
+    
+    def _predict_score_block(self, user_indices: Sequence[Optional[int]], user_features: np.ndarray,
+                             hotel_indices: np.ndarray) -> np.ndarray:
         """
-        Bir kullanıcı için en uygun otelleri önerir
-        Bütçe, oda tipi tercihi ve kapasite gibi kısıtları dikkate alır
+        Kullanıcılar x oteller puan bloğunu batch ileri geçişlerle hesaplar
         
         Args:
-            user_id: Kullanıcı ID'si
-            top_n: Önerilecek otel sayısı
-            debug: Ayrıntılı bilgi gösterme modu
+            user_indices: Kullanıcıların model indeksleri (kayıtlı olmayanlar için None)
+            user_features: Kullanıcıların normalize edilmiş özellik matrisi (kullanıcı sayısı x özellik sayısı)
+            hotel_indices: Otellerin model indeksleri
             
         Returns:
-            Önerilen otellerin listesi
+            (kullanıcı sayısı x otel sayısı) boyutunda tahmin matrisi (float32)
         """
-        print(f"\n{user_id} ID'li kullanıcı için otel önerileri hazırlanıyor...")
-        start_time = time.time()
-        self.model.eval()
+        device = self.dataset.device
+        num_users = len(user_indices)
+        num_hotels = len(hotel_indices)
+        scores = np.empty((num_users, num_hotels), dtype=np.float32)
+        if num_users == 0 or num_hotels == 0:
+            return scores
         
-        # Kullanıcı verileri
-        with open(self.dataset.users_file, 'r', encoding='utf-8') as f:
-            users = json.load(f)
+        hotel_tensor = torch.as_tensor(hotel_indices, dtype=torch.long, device=device)
+        user_features = torch.as_tensor(user_features, dtype=torch.float, device=device)
         
-        # Otel verileri
-        with open(self.dataset.hotels_file, 'r', encoding='utf-8') as f:
-            hotels = json.load(f)
+        # Otel tarafı önbellekten gelir; kullanıcı tarafı her kullanıcı için bir kez hesaplanır
+        # ve yalnızca gizli katmanlar kullanıcı x otel çiftleri üzerinde çalışır
+        hotel_vecs = self._hotel_vectors()[hotel_tensor]
         
-        try:
-            user_idx = self.dataset.user_id_to_index.get(user_id)
-            if user_idx is None:
-                print(f"Uyarı: {user_id} ID'li kullanıcı bulunamadı.")
-                return []
-                
-            user = next(u for u in users if u['id'] == user_id)
-            user_features = torch.tensor(self.dataset.user_features[user_idx], dtype=torch.float).to(self.dataset.device)
-            
-            print(f"Kullanıcı Bilgileri:")
-            print(f"- İsim: {user['name']}")
-            print(f"- Bütçe: {user['preferredBudget']['min']}-{user['preferredBudget']['max']} TL")
-            print(f"- Tercih edilen oda tipi: {user['preferredRoomType']}")
-            print(f"- Gerekli kapasite: {user['requiredCapacity']}")
-            print(f"- Tercih edilen özellikler: {', '.join(user['preferredAmenities'])}")
-            
-            # Tüm otel-oda kombinasyonları için tahminler yap
-            all_predictions = []
-            
-            for hotel in tqdm(hotels, desc="Oteller değerlendiriliyor"):
-                hotel_id = hotel['id']
-                hotel_idx = self.dataset.hotel_id_to_index.get(hotel_id)
-                
-                if hotel_idx is None or not hotel.get('rooms'):
-                    continue
-                    
-                hotel_features = torch.tensor(self.dataset.hotel_features[hotel_idx], dtype=torch.float).to(self.dataset.device)
-                
-                # Modelin tahminini al - genel otel puanı
-                with torch.no_grad():
-                    base_prediction = self.model(
-                        torch.tensor(user_idx, dtype=torch.long).unsqueeze(0).to(self.dataset.device),
-                        torch.tensor(hotel_idx, dtype=torch.long).unsqueeze(0).to(self.dataset.device),
-                        user_features.unsqueeze(0),
-                        hotel_features.unsqueeze(0)
-                    ).item()
-                
-                # Oteldeki her oda için uygunluğu değerlendir
-                for room in hotel['rooms']:
-                    # Kapasite kontrolü - Kritik bir kısıt olarak kullan
-                    if room['capacity'] < user['requiredCapacity']:
-                        if debug:
-                            print(f"Oda {room['id']} kapasitesi yetersiz. Gerekli: {user['requiredCapacity']}, Mevcut: {room['capacity']}")
-                        continue
-                    
-                    room_score = base_prediction
-                    adjustment_factors = []
-                    
-                    # Bütçe uyumu kontrolü
-                    min_budget = user['preferredBudget']['min']
-                    max_budget = user['preferredBudget']['max']
-                    room_price = room['pricePerNight']
-                    budget_factor = 1.0
-                    
-                    # Bütçe dışındaysa puanını düşür
-                    if room_price < min_budget * 0.8:
-                        budget_factor = 0.9  # Çok ucuz
-                        adjustment_factors.append(f"Bütçe altı ({room_price} < {min_budget}): x0.9")
-                    elif room_price > max_budget * 1.2:
-                        budget_factor = 0.5  # Çok pahalı
-                        adjustment_factors.append(f"Bütçe üstü ({room_price} > {max_budget}): x0.5")
-                    elif room_price < min_budget:
-                        budget_factor = 0.95  # Biraz ucuz
-                        adjustment_factors.append(f"Biraz bütçe altı: x0.95")
-                    elif room_price > max_budget:
-                        budget_factor = 0.7  # Biraz pahalı
-                        adjustment_factors.append(f"Biraz bütçe üstü: x0.7")
-                    else:
-                        budget_factor = 1.1  # Bütçeye tam uygun, bonus puan
-                        adjustment_factors.append(f"Bütçeye uygun: x1.1")
-                    
-                    room_score *= budget_factor
-                    
-                    # Oda tipi kontrolü
-                    type_factor = 1.0
-                    if room['type'] == user['preferredRoomType']:
-                        type_factor = 1.2  # Tercih edilen oda tipi, bonus puan
-                        adjustment_factors.append(f"Tercih edilen oda tipi: x1.2")
-                    else:
-                        type_factor = 0.8  # Farklı oda tipi
-                        adjustment_factors.append(f"Farklı oda tipi: x0.8")
-                    
-                    room_score *= type_factor
-                    
-                    # Özellik eşleşmesi
-                    amenity_match_count = 0
-                    amenity_count = len(user['preferredAmenities'])
-                    
-                    if amenity_count > 0:
-                        if 'WiFi' in user['preferredAmenities'] and room.get('hasWifi', False):
-                            amenity_match_count += 1
-                        if 'TV' in user['preferredAmenities'] and room.get('hasTV', False):
-                            amenity_match_count += 1
-                        if 'Balkon' in user['preferredAmenities'] and room.get('hasBalcony', False):
-                            amenity_match_count += 1
-                        if 'Minibar' in user['preferredAmenities'] and room.get('hasMinibar', False):
-                            amenity_match_count += 1
-                        
-                        amenity_match_ratio = amenity_match_count / amenity_count
-                        
-                        # Özellik eşleşmesi puanı etkileyecek
-                        amenity_factor = 0.8 + 0.4 * amenity_match_ratio
-                        adjustment_factors.append(f"Özellik eşleşmesi ({amenity_match_count}/{amenity_count}): x{amenity_factor:.2f}")
-                        room_score *= amenity_factor
-                    
-                    # Son puan için maks ve min değerler arasında sınırla
-                    room_score = min(5.0, max(1.0, room_score))
-                    
-                    # Oda durumu kontrolü
-                    if room.get('status') != 'AVAILABLE':
-                        continue  # Müsait olmayan odaları öneri listesine alma
-                    
-                    recommendation_info = {
-                        'hotel_id': hotel_id,
-                        'hotel_name': hotel['name'],
-                        'room_id': room['id'],
-                        'room_name': room['name'],
-                        'room_type': room['type'],
-                        'price': room['pricePerNight'],
-                        'city': hotel['city'],
-                        'address': hotel['address'],
-                        'capacity': room['capacity'],
-                        'predicted_rating': round(room_score, 2),
-                        'base_score': round(base_prediction, 2),
-                        'score_details': adjustment_factors if debug else None,
-                        'amenities': {
-                            'wifi': room.get('hasWifi', False),
-                            'tv': room.get('hasTV', False),
-                            'balcony': room.get('hasBalcony', False),
-                            'minibar': room.get('hasMinibar', False)
-                        }
-                    }
-                    
-                    all_predictions.append(recommendation_info)
-            
-            # En yüksek puanlı oda önerilerini seç
-            top_recommendations = sorted(all_predictions, key=lambda x: x['predicted_rating'], reverse=True)[:top_n]
-            
-            # Daha açıklayıcı öneri türü ekle
-            for rec in top_recommendations:
-                match_reasons = []
-                if rec['price'] <= user['preferredBudget']['max'] and rec['price'] >= user['preferredBudget']['min']:
-                    match_reasons.append("bütçeye uygun")
-                
-                if rec['room_type'] == user['preferredRoomType']:
-                    match_reasons.append("tercih edilen oda tipi")
-                
-                amenities_user_wanted = []
-                for amenity in user['preferredAmenities']:
-                    if amenity == 'WiFi' and rec['amenities']['wifi']:
-                        amenities_user_wanted.append("WiFi")
-                    elif amenity == 'TV' and rec['amenities']['tv']:
-                        amenities_user_wanted.append("TV")
-                    elif amenity == 'Balkon' and rec['amenities']['balcony']:
-                        amenities_user_wanted.append("Balkon")
-                    elif amenity == 'Minibar' and rec['amenities']['minibar']:
-                        amenities_user_wanted.append("Minibar")
-                
-                if amenities_user_wanted:
-                    match_reasons.append(f"istenen özellikler: {', '.join(amenities_user_wanted)}")
-                
-                if match_reasons:
-                    rec['recommendation_type'] = f"Bu oda şu açılardan size uygun: {', '.join(match_reasons)}"
-                else:
-                    rec['recommendation_type'] = "Alternatif Öneri"
-            
-            print(f"Öneri süresi: {time.time() - start_time:.2f} saniye")
-            return top_recommendations
+        model = self._serving_model()
+        
+        # Kullanıcı embedding'leri; kayıtlı olmayanlar için soğuk başlangıç temsili
+        with torch.no_grad():
+            known = [i for i, user_idx in enumerate(user_indices) if user_idx is not None]
+            if len(known) == num_users:
+                user_emb = model.user_embedding(
+                    torch.as_tensor(list(user_indices), dtype=torch.long, device=device)
+                )
+            else:
+                user_emb = self._cold_start_embedding().unsqueeze(0).repeat(num_users, 1)
+                if known:
+                    user_emb[known] = model.user_embedding(
+                        torch.as_tensor([user_indices[i] for i in known], dtype=torch.long, device=device)
+                    )
+            user_vecs = model.user_vectors(user_emb, user_features)
             
-        except Exception as e:
-            print(f"Öneri oluşturulurken hata: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return []
+            # Bellek kullanımını sınırlamak için kullanıcıları parçalar halinde işle
+            users_per_pass = max(1, PREDICT_BATCH_PAIRS // num_hotels)
+            for start in range(0, num_users, users_per_pass):
+                end = min(start + users_per_pass, num_users)
+                count = end - start
+                predictions = model.forward_from_vectors(
+                    user_vecs[start:end].repeat_interleave(num_hotels, dim=0),
+                    hotel_vecs.repeat(count, 1)
+                )
+                scores[start:end] = predictions.reshape(count, num_hotels).cpu().numpy()
+        
+        return scores
     
-    def explain_recommendation(self, user_id: int, hotel_id: int) -> Dict[str, Any]:
+    def _share_model_arrays(self, directory: str):
         """
-        Belirli bir otel önerisini ayrıntılı şekilde açıklar
+        Model parametrelerini ve arabelleklerini bellek eşlemeli dosyalara taşır; çıkarım modeli ve
+        otel vektörleri paylaşılan ağırlıklardan yeniden oluşturulur (otel vektörleri de paylaşılır).
+        Yalnızca CPU'da çalışır.
+        """
+        if self.dataset.device.type != 'cpu':
+            print(f"Model dizileri {self.dataset.device} üzerinde olduğu için paylaşılmadı.")
+            return
         
-        Args:
-            user_id: Kullanıcı ID'si
-            hotel_id: Otel ID'si
-            
-        Returns:
-            Öneri açıklaması
+        with torch.no_grad():
+            for name, tensor in list(self.model.named_parameters()) + list(self.model.named_buffers()):
+                tensor.data = torch.from_numpy(map_shared_array(directory, f"model.{name}", tensor.detach().numpy()))
+        
+        self._cold_start_user_embedding = None
+        self._hotel_vector_cache = None
+        self._serving_model_cache = None
+        self._hotel_vector_cache = torch.from_numpy(
+            map_shared_array(directory, 'hotel_vectors', self._hotel_vectors().numpy())
+        )
+    
+    def _hotel_vectors(self):
         """
-        try:
-            self.model.eval()
-            
-            # Kullanıcı ve otel verileri
-            with open(self.dataset.users_file, 'r', encoding='utf-8') as f:
-                users = json.load(f)
-            
-            with open(self.dataset.hotels_file, 'r', encoding='utf-8') as f:
-                hotels = json.load(f)
-            
-            # Kullanıcı ve otel indekslerini ve özelliklerini al
-            user_idx = self.dataset.user_id_to_index.get(user_id)
-            hotel_idx = self.dataset.hotel_id_to_index.get(hotel_id)
-            
-            if user_idx is None or hotel_idx is None:
-                return {"error": "Kullanıcı veya otel bulunamadı"}
-            
-            user = next((u for u in users if u['id'] == user_id), None)
-            hotel = next((h for h in hotels if h['id'] == hotel_id), None)
-            
-            if not user or not hotel:
-                return {"error": "Kullanıcı veya otel verileri bulunamadı"}
-            
-            user_features = self.dataset.user_features[user_idx]
-            hotel_features = self.dataset.hotel_features[hotel_idx]
-            
-            # Model kullanarak tahmini puanı al
-            user_tensor = torch.tensor(user_idx, dtype=torch.long).unsqueeze(0).to(self.dataset.device)
-            hotel_tensor = torch.tensor(hotel_idx, dtype=torch.long).unsqueeze(0).to(self.dataset.device)
-            user_feat_tensor = torch.tensor(user_features, dtype=torch.float).unsqueeze(0).to(self.dataset.device)
-            hotel_feat_tensor = torch.tensor(hotel_features, dtype=torch.float).unsqueeze(0).to(self.dataset.device)
-            
+        Tüm otellerin otel tarafı vektör matrisini döndürür (otel sayısı x 2*EMBEDDING_DIM);
+        model ağırlıkları değişene kadar önbelleklenir
+        """
+        if self._hotel_vector_cache is None:
+            device = self.dataset.device
             with torch.no_grad():
-                predicted_score = self.model(user_tensor, hotel_tensor, user_feat_tensor, hotel_feat_tensor).item()
-            
-            # Kullanıcı ve otel özelliklerinin karşılaştırmalı analizi
-            user_budget_min = user['preferredBudget']['min']
-            user_budget_max = user['preferredBudget']['max']
-            user_preferred_type = user['preferredRoomType']
-            user_required_capacity = user['requiredCapacity']
-            user_preferred_amenities = user['preferredAmenities']
-            
-            # En iyi eşleşen odayı bul
-            best_matching_room = None
-            best_room_score = 0
-            
-            room_matches = []
-            
-            for room in hotel['rooms']:
-                score = 0
-                matches = []
-                mismatches = []
-                
-                # Bütçe uyumu
-                if user_budget_min <= room['pricePerNight'] <= user_budget_max:
-                    score += 2
-                    matches.append(f"Oda fiyatı ({room['pricePerNight']} TL) bütçenize ({user_budget_min}-{user_budget_max} TL) uygun")
-                elif room['pricePerNight'] < user_budget_min:
-                    score += 1
-                    matches.append(f"Oda fiyatı ({room['pricePerNight']} TL) bütçenizin altında")
-                else:
-                    mismatches.append(f"Oda fiyatı ({room['pricePerNight']} TL) bütçenizin ({user_budget_max} TL) üstünde")
-                
-                # Oda tipi
-                if room['type'] == user_preferred_type:
-                    score += 2
-                    matches.append(f"Tercih ettiğiniz oda tipi: {user_preferred_type}")
-                else:
-                    mismatches.append(f"Farklı oda tipi: {room['type']} (tercih: {user_preferred_type})")
-                
-                # Kapasite
-                if room['capacity'] >= user_required_capacity:
-                    score += 1
-                    matches.append(f"Yeterli kapasite: {room['capacity']} kişilik (ihtiyaç: {user_required_capacity})")
-                else:
-                    score -= 3  # Kapasite çok önemli bir kriter
-                    mismatches.append(f"Yetersiz kapasite: {room['capacity']} kişilik (ihtiyaç: {user_required_capacity})")
-                
-                # Özellikler
-                for amenity in user_preferred_amenities:
-                    if amenity == 'WiFi' and room.get('hasWifi', False):
-                        score += 0.5
-                        matches.append("WiFi mevcut")
-                    elif amenity == 'TV' and room.get('hasTV', False):
-                        score += 0.5
-                        matches.append("TV mevcut")
-                    elif amenity == 'Balkon' and room.get('hasBalcony', False):
-                        score += 0.5
-                        matches.append("Balkon mevcut")
-                    elif amenity == 'Minibar' and room.get('hasMinibar', False):
-                        score += 0.5
-                        matches.append("Minibar mevcut")
-                    else:
-                        if amenity == 'WiFi':
-                            mismatches.append("WiFi mevcut değil")
-                        elif amenity == 'TV':
-                            mismatches.append("TV mevcut değil")
-                        elif amenity == 'Balkon':
-                            mismatches.append("Balkon mevcut değil")
-                        elif amenity == 'Minibar':
-                            mismatches.append("Minibar mevcut değil")
-                
-                room_matches.append({
-                    "room_id": room['id'],
-                    "room_name": room['name'],
-                    "room_type": room['type'],
-                    "capacity": room['capacity'],
-                    "price": room['pricePerNight'],
-                    "score": score,
-                    "matches": matches,
-                    "mismatches": mismatches
-                })
-                
-                if score > best_room_score:
-                    best_room_score = score
-                    best_matching_room = room
-            
-            # Açıklama metni oluştur
-            if best_matching_room:
-                best_room = next((r for r in room_matches if r["room_id"] == best_matching_room['id']), None)
-                
-                explanation_text = f"Bu otel sizin için {predicted_score:.1f}/5.0 puan ile değerlendirildi. "
-                
-                if best_room["matches"]:
-                    explanation_text += f"En iyi eşleşen oda '{best_matching_room['name']}', çünkü: "
-                    explanation_text += ", ".join(best_room["matches"]) + ". "
-                
-                if best_room["mismatches"]:
-                    explanation_text += "Dikkat edilmesi gereken noktalar: "
-                    explanation_text += ", ".join(best_room["mismatches"]) + "."
-            else:
-                explanation_text = "Bu otelde size uygun bir oda bulunamadı."
-            
-            return {
-                "hotel_name": hotel['name'],
-                "predicted_score": round(predicted_score, 2),
-                "explanation": explanation_text,
-                "best_matching_room": best_matching_room['name'] if best_matching_room else None,
-                "room_matches": sorted(room_matches, key=lambda x: x["score"], reverse=True)
-            }
-            
-        except Exception as e:
-            return {"error": str(e)}
-
+                self._hotel_vector_cache = self._serving_model().hotel_vectors(
+                    torch.arange(self.dataset.num_hotels, device=device),
+                    torch.as_tensor(self.dataset.hotel_features, dtype=torch.float, device=device)
+                )
+        return self._hotel_vector_cache
+    
+    def _cold_start_embedding(self):
+        """Soğuk başlangıç kullanıcı temsilini döndürür (model ağırlıkları değişene kadar önbelleklenir)"""
+        if self._cold_start_user_embedding is None:
+            with torch.no_grad():
+                self._cold_start_user_embedding = self.model.cold_start_user_embedding()
+        return self._cold_start_user_embedding
+    
+    def _serving_model(self) -> nn.Module:
+        """
+        Öneri puanlamasında kullanılan modeli döndürür: 'eager' için eğitilen modelin kendisi,
+        diğerleri için model_export ile üretilen çıkarım modeli (INFERENCE_BACKENDS)
+        """
+        if self._serving_model_cache is None:
+            self._serving_model_cache = build_inference_model(self.model, self.inference_backend)
+        return self._serving_model_cache
+    
 # Örnek kullanım
 if __name__ == "__main__":
     # Genişletilmiş veri setini kullan
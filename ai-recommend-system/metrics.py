@@ -0,0 +1,192 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Gecikme histogramlarının üst sınırları (saniye); öneri aşamaları mikro saniyelerden
+# yüzlerce milisaniyeye kadar sürebildiği için alt uç sık tutulmuştur
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape_label_value(str(value))}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """
+    Yalnızca artan, etiketli sayaç (Prometheus 'counter' türü)
+    """
+
+    metric_type = 'counter'
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0):
+        """Verilen etiket değerleri için sayacı artırır"""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f'{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}'
+                for labels, value in values]
+
+
+class Histogram:
+    """
+    Etiketli, sabit kovalı histogram (Prometheus 'histogram' türü)
+
+    Kova sayaçları gözlem anında yalnızca ilgili kovada artırılır; birikimli değerler
+    dışa aktarımda hesaplanır, böylece observe() ucuz kalır.
+    """
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+
+        self._lock = threading.Lock()
+        # etiket değerleri -> [kova sayaçları (+Inf dahil), toplam, gözlem sayısı]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *label_values: str):
+        """Verilen etiket değerleri için bir gözlem ekler"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, *label_values: str):
+        """Bloğun süresini (saniye) gözlem olarak ekler"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *label_values)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            series = sorted((labels, (list(counts), total, count))
+                            for labels, (counts, total, count) in self._series.items())
+
+        lines = []
+        for labels, (counts, total, count) in series:
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(upper_bound)}"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(self.label_names, labels)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_format_labels(self.label_names, labels)} {count}')
+        return lines
+
+
+class CallbackMetric:
+    """
+    Değeri dışa aktarım anında bir fonksiyondan okunan ölçüm (ör. önbellek sayaçları)
+    """
+
+    def __init__(self, name: str, documentation: str, metric_type: str,
+                 callback: Callable[[], float]):
+        self.name = name
+        self.documentation = documentation
+        self.metric_type = metric_type
+        self.callback = callback
+
+    def samples(self) -> List[str]:
+        return [f'{self.name} {_format_value(self.callback())}']
+
+
+class MetricsRegistry:
+    """
+    Ölçümleri tutan ve Prometheus metin biçiminde (0.0.4) dışa aktaran kayıt
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, object] = {}
+
+    def register(self, metric):
+        """Ölçümü kaydeder; aynı isimde bir ölçüm varsa onu döndürür"""
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, label_names, buckets))
+
+    def callback(self, name: str, documentation: str, metric_type: str,
+                 callback: Callable[[], float]) -> CallbackMetric:
+        """Değeri her dışa aktarımda callback() ile okunan ölçüm kaydeder ('gauge' veya 'counter')"""
+        with self._lock:
+            metric = self._metrics[name] = CallbackMetric(name, documentation, metric_type, callback)
+        return metric
+
+    def metrics(self) -> Iterable[object]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def render(self) -> str:
+        """Tüm ölçümleri Prometheus metin biçiminde döndürür"""
+        lines = []
+        for metric in self.metrics():
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.metric_type}')
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+# Süreç genelindeki varsayılan kayıt ve öneri aşaması gecikme histogramı; aşamalar:
+# catalog_load, feature_lookup, model_forward, room_adjustment, sort, explanation, serialization
+REGISTRY = MetricsRegistry()
+
+STAGE_LATENCY = REGISTRY.histogram(
+    'recommender_stage_duration_seconds',
+    'Öneri isteğinin aşamalarına göre süresi (saniye)',
+    ('stage',)
+)
+
+
+def stage_timer(stage: str):
+    """
+    Öneri aşamasının süresini ölçen bağlam yöneticisi
+
+    Kullanım:
+        with stage_timer('model_forward'):
+            scores = ...
+    """
+    return STAGE_LATENCY.time(stage)
@@ -0,0 +1,118 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Sequence
+
+from metrics import REGISTRY
+
+# Toplu işlem büyüklüğü ve doluluk oranı histogramlarının kova sınırları
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+FILL_RATIO_BUCKETS = (0.125, 0.25, 0.375, 0.5, 0.625, 0.75, 0.875, 1.0)
+
+BATCH_SIZE = REGISTRY.histogram(
+    'recommender_microbatch_size', 'Mikro toplu işlemlerdeki istek sayısı', buckets=BATCH_SIZE_BUCKETS
+)
+BATCH_FILL = REGISTRY.histogram(
+    'recommender_microbatch_fill_ratio', 'Mikro toplu işlemlerin doluluk oranı (istek sayısı / en büyük boyut)',
+    buckets=FILL_RATIO_BUCKETS
+)
+QUEUE_DELAY = REGISTRY.histogram(
+    'recommender_microbatch_queue_delay_seconds', 'İsteğin toplu işleme alınana kadar kuyrukta beklediği süre (saniye)'
+)
+
+
+class MicroBatcher:
+    """
+    Eşzamanlı istekleri kısa bir süre kuyrukta biriktirip tek bir toplu işlemle çalıştıran ve
+    sonuçları her çağırana geri dağıtan zamanlayıcı.
+
+    Bir toplu işlem, kuyruktaki ilk istek max_wait saniye beklediğinde ya da max_batch_size
+    isteğe ulaşıldığında çalıştırılır. Toplu işlemler tek bir arka plan iş parçacığında sırayla
+    yürütülür; toplu işlem hata verirse o işlemdeki tüm çağıranlara aynı hata iletilir.
+    İş parçacığı ilk istekte başlatılır; çatallanan (fork) her süreç kendi iş parçacığını açar.
+    """
+
+    def __init__(self, process_batch: Callable[[List[Any]], Sequence[Any]], max_batch_size: int = 32,
+                 max_wait: float = 0.002, name: str = "micro-batcher"):
+        """
+        Args:
+            process_batch: İstek listesini alıp aynı sırada sonuç listesi döndüren fonksiyon
+            max_batch_size: Tek toplu işlemdeki en fazla istek sayısı
+            max_wait: İlk isteğin toplu işlem için en fazla bekleyeceği süre (saniye)
+            name: Arka plan iş parçacığının adı
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size en az 1 olmalıdır")
+
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.name = name
+
+        # (istek, kuyruğa giriş zamanı, sonuç) üçlüleri; kuyruk ve iş parçacığı süreç başınadır
+        self._queue: "queue.Queue[tuple]" = None
+        self._thread = None
+        self._worker_pid = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_worker(self):
+        """Bu süreçte arka plan iş parçacığı yoksa kuyruğu ve iş parçacığını oluşturur"""
+        if self._worker_pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._worker_pid != os.getpid():
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._run, args=(self._queue,), name=self.name, daemon=True)
+                self._thread.start()
+                self._worker_pid = os.getpid()
+
+    def submit(self, item: Any) -> Any:
+        """
+        İsteği kuyruğa ekler ve içinde bulunduğu toplu işlem tamamlanınca sonucunu döndürür
+
+        Raises:
+            Toplu işlemin fırlattığı hata
+        """
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((item, time.perf_counter(), future))
+        return future.result()
+
+    def _collect(self, requests: "queue.Queue[tuple]") -> List[tuple]:
+        """İlk isteği bekler, ardından süre dolana ya da toplu işlem dolana kadar istek toplar"""
+        batch = [requests.get()]
+        deadline = batch[0][1] + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                # Süre dolduysa yalnızca kuyrukta hazır bekleyen istekler alınır
+                if remaining > 0:
+                    batch.append(requests.get(timeout=remaining))
+                else:
+                    batch.append(requests.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self, requests: "queue.Queue[tuple]"):
+        while True:
+            batch = self._collect(requests)
+
+            started = time.perf_counter()
+            for _, enqueued_at, _ in batch:
+                QUEUE_DELAY.observe(started - enqueued_at)
+            BATCH_SIZE.observe(len(batch))
+            BATCH_FILL.observe(len(batch) / self.max_batch_size)
+
+            futures = [future for _, _, future in batch]
+            try:
+                results = self.process_batch([item for item, _, _ in batch])
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+
+            for future, result in zip(futures, results):
+                future.set_result(result)
@@ -47,42 +47,17 @@ def evaluate_model_detailed(recommender):
     
     # Model değerlendirme moduna al
     recommender.model.eval()
-    test_data = recommender.dataset.get_test_data()
-    
-    # Tahminler ve gerçek değerleri topla
-    all_predictions = []
-    all_targets = []
-    all_users = []
-    all_hotels = []
-    
-    print(f"Test veri kümesi büyüklüğü: {len(test_data)} örnek")
-    
-    with torch.no_grad():
-        for sample in test_data:
-            user_idx = sample['user_idx'].to(recommender.dataset.device)
-            hotel_idx = sample['hotel_idx'].to(recommender.dataset.device)
-            user_features = sample['user_features'].to(recommender.dataset.device)
-            hotel_features = sample['hotel_features'].to(recommender.dataset.device)
-            rating = sample['rating'].to(recommender.dataset.device)
-            
-            # Tahmin yap
-            prediction = recommender.model(
-                user_idx.unsqueeze(0), 
-                hotel_idx.unsqueeze(0), 
-                user_features.unsqueeze(0), 
-                hotel_features.unsqueeze(0)
-            )
-            
-            all_predictions.append(prediction.item())
-            all_targets.append(rating.item())
-            all_users.append(user_idx.item())
-            all_hotels.append(hotel_idx.item())
+    recommender.dataset.ensure_training_data()
+    
+    # Test kümesi indeks çiftleri ve gerçek değerler
+    users = recommender.dataset.X_test[:, 0]
+    hotels = recommender.dataset.X_test[:, 1]
+    targets = recommender.dataset.y_test.astype(np.float64)
+    
+    print(f"Test veri kümesi büyüklüğü: {len(targets)} örnek")
     
-    # NumPy dizileri oluştur
-    predictions = np.array(all_predictions)
-    targets = np.array(all_targets)
-    users = np.array(all_users)
-    hotels = np.array(all_hotels)
+    # Tahminleri büyük batch'lerle hesapla
+    predictions = recommender.predict_pairs(users, hotels).astype(np.float64)
     
     # Temel metrikler
     mse = mean_squared_error(targets, predictions)
@@ -318,8 +293,7 @@ def generate_sample_recommendations(recommender, num_users=3):
     
     # Test edilecek kullanıcıları belirle
     # Burada varsayılan ilk n kullanıcıyı kullanabiliriz ya da rastgele seçebiliriz
-    with open(recommender.dataset.users_file, 'r', encoding='utf-8') as f:
-        users = json.load(f)
+    users = list(recommender.catalog.snapshot().users)
     
     if len(users) > num_users:
         # İlk num_users kadar kullanıcıyı seç
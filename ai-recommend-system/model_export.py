@@ -0,0 +1,380 @@
+"""
+Eğitilmiş ImprovedRecommenderNet modelinin sunum için sadeleştirilmiş kopyalarını üretir.
+
+Değerlendirme (eval) modunda BatchNorm katmanları sabit bir ölçekleme + kaydırmadır ve
+Dropout katmanları hiçbir şey yapmaz. Bu modülde her BatchNorm bitişiğindeki Linear
+katmanın ağırlıklarına katlanır, Dropout'lar çıkarılır ve çıkarımda kullanılmayan dikkat
+katmanı atılır. Sonuç, aynı ileri geçiş arayüzüne sahip daha küçük bir modeldir; bu model
+ayrıca TorchScript'e derlenebilir ve Linear katmanları dinamik int8 nicemlenebilir (CPU).
+
+Kullanım (eşitlik/doğruluk kontrolü, gecikme ve boyut karşılaştırması):
+    python model_export.py --repeat 200
+
+NumPy motoru için .npz dosyası yazmak (ve karşılaştırmaya eklemek) için:
+    python model_export.py --export-npz improved_hotel_recommender_model.npz
+"""
+import argparse
+import contextlib
+import copy
+import io
+import json
+import os
+import time
+import warnings
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+# Sunumda seçilebilecek çıkarım modelleri:
+#   eager:       eğitilen modelin kendisi
+#   folded:      BatchNorm katlanmış, Dropout'suz kopya
+#   torchscript: folded modelin TorchScript'e derlenmiş hali
+#   int8:        folded modelin Linear katmanları dinamik int8 nicemlenmiş, TorchScript'e derlenmiş hali (CPU)
+INFERENCE_BACKENDS = ('eager', 'folded', 'torchscript', 'int8')
+
+
+def _batchnorm_affine(bn: nn.BatchNorm1d) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Değerlendirme modundaki BatchNorm'u y = x * scale + shift biçiminde ifade eder
+    """
+    scale = torch.rsqrt(bn.running_var + bn.eps)
+    if bn.weight is not None:
+        scale = scale * bn.weight
+    shift = -bn.running_mean * scale
+    if bn.bias is not None:
+        shift = shift + bn.bias
+    return scale.detach(), shift.detach()
+
+
+def _new_linear(weight: torch.Tensor, bias: torch.Tensor) -> nn.Linear:
+    linear = nn.Linear(weight.shape[1], weight.shape[0]).to(device=weight.device, dtype=weight.dtype)
+    with torch.no_grad():
+        linear.weight.copy_(weight)
+        linear.bias.copy_(bias)
+    return linear
+
+
+def _fold_into_previous(linear: nn.Linear, scale: torch.Tensor, shift: torch.Tensor) -> nn.Linear:
+    """BN(Linear(x)) -> Linear'(x): çıkış satırları ölçeklenir"""
+    bias = linear.bias if linear.bias is not None else torch.zeros_like(scale)
+    return _new_linear(linear.weight * scale[:, None], bias * scale + shift)
+
+
+def _fold_into_next(linear: nn.Linear, scale: torch.Tensor, shift: torch.Tensor) -> nn.Linear:
+    """Linear(BN(x)) -> Linear'(x): giriş sütunları ölçeklenir"""
+    bias = linear.bias if linear.bias is not None else torch.zeros(linear.out_features, device=scale.device)
+    return _new_linear(linear.weight * scale[None, :], bias + linear.weight @ shift)
+
+
+def fold_sequential(layers: nn.Sequential,
+                    following: Optional[nn.Linear] = None) -> Tuple[nn.Sequential, Optional[nn.Linear]]:
+    """
+    Bir Sequential içindeki BatchNorm1d katmanlarını bitişik Linear katmanlara katlar ve Dropout'ları çıkarır.
+
+    BatchNorm doğrudan bir Linear'dan sonra geliyorsa o Linear'a, aradaki doğrusal olmayan
+    aktivasyon (ör. Linear -> ReLU -> BatchNorm) nedeniyle geriye katlanamıyorsa bir sonraki
+    Linear'a katlanır. Sequential BatchNorm ile bitiyorsa `following` katmanına katlanır.
+
+    Args:
+        layers: Değerlendirme modundaki katmanlar
+        following: Sequential'dan hemen sonra uygulanan Linear katman (opsiyonel)
+
+    Returns:
+        (sadeleştirilmiş Sequential, güncellenmiş following katmanı)
+    """
+    folded = []
+    pending = None  # (BatchNorm modülü, scale, shift) - bir sonraki Linear'a katlanmayı bekliyor
+
+    for module in layers:
+        if isinstance(module, nn.Dropout):
+            continue
+
+        if isinstance(module, nn.BatchNorm1d):
+            scale, shift = _batchnorm_affine(module)
+            if pending is None and folded and isinstance(folded[-1], nn.Linear):
+                folded[-1] = _fold_into_previous(folded[-1], scale, shift)
+            elif pending is None:
+                pending = (module, scale, shift)
+            else:
+                # Art arda iki BatchNorm: tek bir ölçekleme + kaydırmada birleştir
+                _, prev_scale, prev_shift = pending
+                pending = (module, prev_scale * scale, prev_shift * scale + shift)
+            continue
+
+        if pending is not None:
+            if isinstance(module, nn.Linear):
+                module = _fold_into_next(module, pending[1], pending[2])
+                pending = None
+            else:
+                # Katlanamıyor (arada başka bir işlem var) - BatchNorm olduğu gibi kalır
+                folded.append(pending[0])
+                pending = None
+
+        folded.append(module)
+
+    if pending is not None:
+        if following is not None:
+            following = _fold_into_next(following, pending[1], pending[2])
+        else:
+            folded.append(pending[0])
+
+    return nn.Sequential(*folded), following
+
+
+def fold_for_inference(model: nn.Module) -> nn.Module:
+    """
+    ImprovedRecommenderNet modelinin BatchNorm'ları katlanmış, Dropout'suz ve yalnızca
+    çıkarım için kullanılacak kopyasını döndürür (orijinal model değiştirilmez).
+
+    Kopya aynı ileri geçiş yöntemlerine (forward, forward_with_user_embedding, hotel_vectors,
+    user_vectors, forward_from_vectors) sahiptir; state_dict anahtarları orijinalden farklıdır.
+    """
+    folded = copy.deepcopy(model).eval()
+
+    folded.user_features_network, _ = fold_sequential(folded.user_features_network)
+    folded.hotel_features_network, _ = fold_sequential(folded.hotel_features_network)
+    folded.hidden_layers, folded.output_layer = fold_sequential(folded.hidden_layers, folded.output_layer)
+
+    # Dikkat katmanı ileri geçişte kullanılmıyor
+    if hasattr(folded, 'attention'):
+        del folded.attention
+
+    for parameter in folded.parameters():
+        parameter.requires_grad_(False)
+    return folded.eval()
+
+
+def script_for_inference(model: nn.Module, quantize: bool = False) -> torch.jit.ScriptModule:
+    """
+    Modelin BatchNorm'ları katlanmış kopyasını TorchScript'e derler; quantize=True ise önce
+    Linear katmanları dinamik int8 nicemlenir (ağırlıklar int8, aktivasyonlar çalışma anında).
+    Nicemlenmiş model yalnızca CPU'da çalışır.
+
+    Derlenen model forward() dışında hotel_vectors, user_vectors, forward_from_vectors ve
+    cold_start_user_embedding yöntemlerini de sunar.
+    """
+    folded = fold_for_inference(model)
+    # Derleme/nicemleme API'lerinin kullanımdan kaldırma uyarıları sunum günlüklerini kirletmesin
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', (FutureWarning, DeprecationWarning, UserWarning))
+        if quantize:
+            folded = torch.ao.quantization.quantize_dynamic(folded.cpu(), {nn.Linear}, dtype=torch.qint8)
+        return torch.jit.script(folded).eval()
+
+
+def build_inference_model(model: nn.Module, backend: str) -> nn.Module:
+    """
+    Eğitilmiş modelden istenen çıkarım modelini oluşturur (INFERENCE_BACKENDS)
+
+    Raises:
+        ValueError: Geçersiz model adı verilirse
+    """
+    model.eval()
+    if backend == 'eager':
+        return model
+    if backend == 'folded':
+        return fold_for_inference(model)
+    if backend == 'torchscript':
+        return script_for_inference(model)
+    if backend == 'int8':
+        return script_for_inference(model, quantize=True)
+    raise ValueError(f"Geçersiz çıkarım modeli: {backend} (geçerli: {', '.join(INFERENCE_BACKENDS)})")
+
+
+def _numpy_network(prefix: str, modules, arrays: Dict[str, np.ndarray]):
+    """Katlanmış bir ağın katmanlarını .npz dizilerine ekler (numpy_inference işlem biçiminde)"""
+    ops = []
+    for module in modules:
+        i = len(ops)
+        if isinstance(module, nn.Linear):
+            ops.append('linear')
+            arrays[f'{prefix}.{i}.weight'] = module.weight.detach().cpu().numpy().astype(np.float32)
+            arrays[f'{prefix}.{i}.bias'] = module.bias.detach().cpu().numpy().astype(np.float32)
+        elif isinstance(module, nn.ReLU):
+            ops.append('relu')
+        elif isinstance(module, nn.BatchNorm1d):
+            scale, shift = _batchnorm_affine(module)
+            ops.append('affine')
+            arrays[f'{prefix}.{i}.scale'] = scale.cpu().numpy().astype(np.float32)
+            arrays[f'{prefix}.{i}.shift'] = shift.cpu().numpy().astype(np.float32)
+        else:
+            raise ValueError(f"NumPy motorunda desteklenmeyen katman: {type(module).__name__}")
+    arrays[f'{prefix}.ops'] = np.array(ops)
+
+
+def export_npz(recommender, path: str):
+    """
+    Eğitilmiş öneri sisteminin modelini (BatchNorm'lar katlanmış, Dropout'lar çıkarılmış)
+    ID eşlemeleri, ölçekler ve eğitim bilgileriyle birlikte numpy_inference için .npz dosyasına yazar.
+    Önce geçici dosyaya yazılır ve ardından yerine taşınır.
+
+    Args:
+        recommender: Eğitilmiş ImprovedLearningRecommender
+        path: Yazılacak .npz dosyası
+    """
+    from numpy_inference import NUMPY_FORMAT_VERSION
+    from features import feature_schema_hash
+
+    folded = fold_for_inference(recommender.model)
+    dataset = recommender.dataset
+    metadata = dict(recommender.model_metadata)
+    metadata['source_model_version'] = recommender.model_version
+
+    arrays = {
+        'format_version': np.array(NUMPY_FORMAT_VERSION),
+        'schema_hash': np.array(feature_schema_hash()),
+        'user_ids': np.array(json.dumps(list(dataset.user_ids))),
+        'hotel_ids': np.array(json.dumps(list(dataset.hotel_ids))),
+        'metadata': np.array(json.dumps(metadata, default=str)),
+        'user_scaler.min': dataset.user_scaler.min_,
+        'user_scaler.scale': dataset.user_scaler.scale_,
+        'hotel_scaler.min': dataset.hotel_scaler.min_,
+        'hotel_scaler.scale': dataset.hotel_scaler.scale_,
+        'user_embedding': folded.user_embedding.weight.detach().cpu().numpy(),
+        'hotel_embedding': folded.hotel_embedding.weight.detach().cpu().numpy(),
+    }
+    _numpy_network('user_features_network', folded.user_features_network, arrays)
+    _numpy_network('hotel_features_network', folded.hotel_features_network, arrays)
+    _numpy_network('head', list(folded.hidden_layers) + [folded.output_layer], arrays)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def serialized_size(model: nn.Module) -> int:
+    """Modelin ağırlıklarıyla birlikte diske yazıldığındaki boyutu (bayt)"""
+    buffer = io.BytesIO()
+    if isinstance(model, torch.jit.ScriptModule):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)
+            torch.jit.save(model, buffer)
+    else:
+        torch.save(model.state_dict(), buffer)
+    return buffer.tell()
+
+
+def count_modules(model: nn.Module) -> Dict[str, int]:
+    """Modeldeki yaprak modül sayılarını türlerine göre döndürür"""
+    counts: Dict[str, int] = {}
+    for module in model.modules():
+        if not list(module.children()):
+            name = type(module).__name__
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def max_abs_difference(reference: Callable[[], torch.Tensor], candidate: Callable[[], torch.Tensor]) -> float:
+    """İki ileri geçişin çıktıları arasındaki en büyük mutlak farkı döndürür"""
+    with torch.inference_mode():
+        return (reference() - candidate()).abs().max().item()
+
+
+def measure_latency(fn: Callable[[], object], repeat: int = 100, warmup: int = 10) -> float:
+    """Bir çağrının ortalama süresini milisaniye cinsinden ölçer"""
+    with torch.inference_mode():
+        for _ in range(warmup):
+            fn()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    from improved_recommendation import ImprovedLearningRecommender, regression_metrics
+
+    parser = argparse.ArgumentParser(
+        description="Çıkarım modelleri: eşitlik ve doğruluk kontrolü, gecikme ve boyut karşılaştırması"
+    )
+    parser.add_argument('--users', default='datas/expanded_users.json')
+    parser.add_argument('--hotels', default='datas/expanded_hotels.json')
+    parser.add_argument('--model', default='improved_hotel_recommender_model.pth')
+    parser.add_argument('--backends', nargs='+', default=list(INFERENCE_BACKENDS), choices=INFERENCE_BACKENDS)
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--tolerance', type=float, default=1e-4,
+                        help="Kayıpsız modellerde (folded, torchscript, numpy) kabul edilen en büyük mutlak puan farkı")
+    parser.add_argument('--export-npz', metavar='PATH',
+                        help="Modeli NumPy motoru için .npz dosyasına yazar ve karşılaştırmaya onu da ekler")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        recommender = ImprovedLearningRecommender(args.users, args.hotels, args.model)
+        recommender.dataset.ensure_training_data()
+    if args.export_npz:
+        export_npz(recommender, args.export_npz)
+        print(f"NumPy model dosyası yazıldı: {args.export_npz} ({os.path.getsize(args.export_npz) / 1024:.1f} KB)")
+    model = recommender.model.eval()
+    dataset = recommender.dataset
+
+    # Tüm kullanıcı x otel çiftleri
+    device = dataset.device
+    users = torch.arange(dataset.num_users, device=device).repeat_interleave(dataset.num_hotels)
+    hotels = torch.arange(dataset.num_hotels, device=device).repeat(dataset.num_users)
+    user_features = torch.as_tensor(dataset.user_features, device=device)[users]
+    hotel_features = torch.as_tensor(dataset.hotel_features, device=device)[hotels]
+
+    # Tek kullanıcı isteği: bir kullanıcı x tüm oteller
+    single = slice(0, dataset.num_hotels)
+
+    def run(net, part=slice(None)):
+        return lambda: net(users[part], hotels[part], user_features[part], hotel_features[part])
+
+    print(f"Modüller (orijinal): {count_modules(model)}")
+    print(f"Modüller (katlanmış): {count_modules(fold_for_inference(model))}")
+    print(f"Test kümesi: {len(dataset.y_test)} çift, tek kullanıcı isteği: {dataset.num_hotels} otel, "
+          f"tüm çiftler: {len(users)}")
+
+    baseline_rmse = None
+    failures = []
+
+    def report(backend, difference, test_predictions, size, single_ms, all_ms):
+        nonlocal baseline_rmse
+        rmse = regression_metrics(test_predictions, dataset.y_test)['rmse']
+        if baseline_rmse is None:
+            baseline_rmse = rmse
+        print(f"{backend:<13}{difference:>11.2e}{rmse:>11.4f}{rmse - baseline_rmse:>+12.5f}"
+              f"{size / 1024:>7.1f} KB{single_ms:>9.3f} ms{all_ms:>10.3f} ms")
+        if backend in ('folded', 'torchscript', 'numpy') and difference > args.tolerance:
+            failures.append(f"{backend}: {difference:.2e} > {args.tolerance:.0e}")
+
+    print(f"{'Model':<13}{'Maks. fark':>11}{'Test RMSE':>11}{'RMSE farkı':>12}{'Boyut':>10}"
+          f"{'Tek istek':>12}{'Tüm çiftler':>13}")
+    for backend in ['eager'] + [name for name in args.backends if name != 'eager']:
+        net = build_inference_model(model, backend)
+        report(backend, max_abs_difference(run(model), run(net)),
+               recommender.predict_pairs(dataset.X_test[:, 0], dataset.X_test[:, 1], model=net),
+               serialized_size(net), measure_latency(run(net, single), args.repeat),
+               measure_latency(run(net), args.repeat))
+
+    if args.export_npz:
+        from numpy_inference import NumpyModelArtifact
+
+        numpy_net = NumpyModelArtifact.load(args.export_npz).net
+        np_users, np_hotels = users.cpu().numpy(), hotels.cpu().numpy()
+        np_user_features, np_hotel_features = user_features.cpu().numpy(), hotel_features.cpu().numpy()
+
+        def run_numpy(part=slice(None)):
+            return lambda: numpy_net.forward(np_users[part], np_hotels[part],
+                                             np_user_features[part], np_hotel_features[part])
+
+        with torch.inference_mode():
+            reference = run(model)().cpu().numpy()
+        test_users = dataset.X_test[:, 0].astype(np.int64)
+        test_hotels = dataset.X_test[:, 1].astype(np.int64)
+        report('numpy', float(np.abs(reference - run_numpy()()).max()),
+               numpy_net.forward(test_users, test_hotels, dataset.user_features[test_users],
+                                 dataset.hotel_features[test_hotels]),
+               os.path.getsize(args.export_npz), measure_latency(run_numpy(single), args.repeat),
+               measure_latency(run_numpy(), args.repeat))
+
+    if failures:
+        raise SystemExit("Eşitlik kontrolü başarısız: " + ", ".join(failures))
+    print("Eşitlik kontrolü başarılı (int8 kayıplıdır; doğruluk farkı RMSE sütunundadır).")
+
+
+if __name__ == '__main__':
+    main()
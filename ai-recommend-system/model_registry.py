@@ -0,0 +1,205 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class ModelRegistry:
+    """
+    Sunumdaki öneri sistemini (model, katalog ve ölçekler) tutan, iş parçacığı güvenli kayıt.
+
+    Her istek başında current() ile tek bir referans alınır ve istek boyunca o referans
+    kullanılır. Yeni model kenarda tamamen oluşturulduktan sonra swap() ile tek bir atama
+    halinde devreye alınır; okuma tarafında kilit yoktur, devam eden istekler eski nesneyle
+    tamamlanır. Kayıtlı nesne sunum sırasında yerinde değiştirilmemelidir (ör. train()).
+    """
+
+    def __init__(self, recommender: Any = None):
+        """
+        Args:
+            recommender: Başlangıçta sunulacak öneri sistemi (opsiyonel)
+        """
+        # Yalnızca yazma tarafını (swap) sıraya sokar; okumalar kilitsizdir
+        self._swap_lock = threading.Lock()
+        # (nesil numarası, öneri sistemi, devreye alınma zamanı) - tek referans olarak değiştirilir
+        self._state = (1 if recommender is not None else 0, recommender, time.time())
+
+    def current(self) -> Any:
+        """
+        Sunumdaki öneri sistemini döndürür
+
+        Raises:
+            RuntimeError: Henüz bir model kaydedilmediyse
+        """
+        recommender = self._state[1]
+        if recommender is None:
+            raise RuntimeError("Sunulacak model henüz yüklenmedi")
+        return recommender
+
+    @property
+    def generation(self) -> int:
+        """Her swap() ile artan nesil numarası"""
+        return self._state[0]
+
+    def swap(self, recommender: Any) -> Optional[Any]:
+        """
+        Yeni öneri sistemini atomik olarak devreye alır
+
+        Args:
+            recommender: Tamamen oluşturulmuş ve kullanıma hazır öneri sistemi
+
+        Returns:
+            Önceki öneri sistemi (yoksa None)
+        """
+        with self._swap_lock:
+            generation, previous, _ = self._state
+            self._state = (generation + 1, recommender, time.time())
+        return previous
+
+    def build_and_swap(self, factory: Callable[[], Any]) -> Any:
+        """
+        factory() ile yeni öneri sistemini kenarda oluşturur ve hatasız tamamlanırsa devreye alır.
+        Oluşturma sırasında hata olursa mevcut model sunulmaya devam eder.
+
+        Returns:
+            Devreye alınan öneri sistemi
+        """
+        recommender = factory()
+        self.swap(recommender)
+        return recommender
+
+    def info(self) -> Dict[str, Any]:
+        """Sunumdaki modelin nesil, sürüm ve devreye alınma bilgileri"""
+        generation, recommender, loaded_at = self._state
+        return {
+            'generation': generation,
+            'model_version': getattr(recommender, 'model_version', None),
+            'loaded_at': loaded_at,
+        }
+
+
+class ModelReloader:
+    """
+    Model dosyası değiştiğinde (veya yönetici isteğiyle) yeni modeli kenarda yükleyip doğrulayan,
+    ısıtan ve ardından kayda atomik olarak devreye alan yardımcı.
+
+    Yükleme veya ısıtma başarısız olursa mevcut model sunulmaya devam eder. Aynı anda
+    yalnızca bir yeniden yükleme çalışır.
+    """
+
+    def __init__(self, registry: ModelRegistry, model_path: str, factory: Callable[[], Any],
+                 warmup: Callable[[Any], None] = None):
+        """
+        Args:
+            registry: Yeni modelin devreye alınacağı kayıt
+            model_path: İzlenecek model dosyası
+            factory: Model dosyasından yeni öneri sistemi oluşturan fonksiyon (doğrulama burada yapılır)
+            warmup: Devreye almadan önce yeni nesneyle çalıştırılacak ısıtma fonksiyonu (opsiyonel)
+        """
+        self.registry = registry
+        self.model_path = model_path
+        self.factory = factory
+        self.warmup = warmup
+
+        self._reload_lock = threading.Lock()
+        self._loaded_stamp = self._file_stamp()
+        self._pending_stamp = None
+        self._watch_thread = None
+        self.last_result: Dict[str, Any] = {'status': 'idle'}
+
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.model_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self, reason: str = "manual") -> Dict[str, Any]:
+        """
+        Model dosyasını yeniden yükler, doğrular, ısıtır ve devreye alır
+
+        Returns:
+            Sonuç bilgisi; status: reloaded / unchanged / busy / failed
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            return {'status': 'busy'}
+
+        try:
+            start_time = time.time()
+            stamp = self._file_stamp()
+            print(f"Model yeniden yükleniyor ({reason})...")
+
+            try:
+                if stamp is None:
+                    raise FileNotFoundError(f"Model dosyası bulunamadı: {self.model_path}")
+                recommender = self.factory()
+                if self.warmup is not None:
+                    self.warmup(recommender)
+            except Exception as e:
+                # Aynı dosya tekrar tekrar denenmez; bir sonraki değişiklik beklenir
+                self._loaded_stamp = stamp
+                print(f"Model yeniden yüklenemedi, mevcut model kullanılmaya devam ediyor: {e}")
+                self.last_result = {'status': 'failed', 'reason': reason, 'error': str(e), 'time': time.time()}
+                return self.last_result
+
+            self._loaded_stamp = stamp
+            current_version = getattr(self.registry.current(), 'model_version', None)
+            if current_version is not None and current_version == getattr(recommender, 'model_version', None):
+                # Dosya damgası değişmiş ama içerik aynı - modeli değiştirmeye gerek yok
+                self.last_result = {'status': 'unchanged', 'reason': reason, 'model_version': current_version,
+                                    'time': time.time()}
+                return self.last_result
+
+            self.registry.swap(recommender)
+            duration = time.time() - start_time
+            print(f"Yeni model devreye alındı (nesil {self.registry.generation}, {duration:.2f} saniye).")
+            self.last_result = {'status': 'reloaded', 'reason': reason, 'duration': duration,
+                                'time': time.time(), **self.registry.info()}
+            return self.last_result
+        finally:
+            self._reload_lock.release()
+
+    def check(self) -> Optional[Dict[str, Any]]:
+        """
+        Model dosyası değiştiyse ve yazma tamamlanmış görünüyorsa (iki kontrol arasında
+        damga aynı kaldıysa) yeniden yükler
+
+        Returns:
+            Yeniden yükleme yapıldıysa sonucu, yapılmadıysa None
+        """
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._loaded_stamp:
+            self._pending_stamp = None
+            return None
+
+        if stamp != self._pending_stamp:
+            # Dosya hâlâ yazılıyor olabilir, bir sonraki kontrolde tekrar bak
+            self._pending_stamp = stamp
+            return None
+
+        self._pending_stamp = None
+        return self.reload(reason="model dosyası değişti")
+
+    def start_watching(self, interval: float = 5.0):
+        """Model dosyasını arka planda belirtilen aralıkla izlemeye başlar"""
+        if self._watch_thread is not None:
+            return
+
+        def watch():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.check()
+                except Exception as e:
+                    print(f"Model dosyası izlenirken hata: {e}")
+
+        self._watch_thread = threading.Thread(target=watch, name="model-watcher", daemon=True)
+        self._watch_thread.start()
+
+    def status(self) -> Dict[str, Any]:
+        """Sunumdaki model ve son yeniden yükleme bilgileri"""
+        return {
+            'model': self.registry.info(),
+            'watching': self._watch_thread is not None,
+            'last_reload': self.last_result,
+        }
@@ -2,17 +2,24 @@ import os
 import torch
 import shutil
 from improved_recommendation import ImprovedLearningRecommender
+from model_export import export_npz
 
 def main():
     print("Öneri Sistemi Model Güncelleme Aracı")
     print("="*60)
     
     model_path = "improved_hotel_recommender_model.pth"
+    numpy_model_path = "improved_hotel_recommender_model.npz"
     backup_path = f"{model_path}.backup"
     users_file = 'datas/expanded_users.json'
     hotels_file = 'datas/expanded_hotels.json'
     
-    # Önce mevcut modeli silmeye çalış
+    # Yeni model önce ayrı bir dosyaya eğitilir; çalışan API, eğitim sırasında ara
+    # kayıtları görmesin ve eğitim bitince tek bir atomik değişiklik algılasın diye
+    # model dosyası en sonda yerine taşınır
+    training_path = f"{model_path}.training"
+    
+    # Mevcut modeli yedekle
     if os.path.exists(model_path):
         try:
             # Yedek dosyası varsa önce onu silmeye çalış
@@ -23,27 +30,35 @@ def main():
             # Şimdi mevcut modeli yedekleyelim
             shutil.copy2(model_path, backup_path)
             print(f"Mevcut model yedeklendi: {backup_path}")
-            
-            # Ana model dosyasını sil
-            os.remove(model_path)
-            print(f"Mevcut model dosyası silindi: {model_path}")
         except Exception as e:
             print(f"Dosya işlemleri sırasında hata: {e}")
     else:
         print("Mevcut model dosyası bulunamadı. Yeni model eğitilecek.")
     
+    # Yarım kalmış eski bir eğitim dosyası varsa sil (yoksa yeni model onu yükler)
+    if os.path.exists(training_path):
+        os.remove(training_path)
+    
     # Yeni model eğit
     print("\nYeni model eğitiliyor...")
     try:
-        # ImprovedLearningRecommender nesnesi model_path olmadan oluşturulur
-        # böylece model yüklemeye çalışılmaz
-        recommender = ImprovedLearningRecommender(users_file, hotels_file)
+        # ImprovedLearningRecommender nesnesi henüz var olmayan eğitim dosyası yoluyla
+        # oluşturulur, böylece model yüklemeye çalışılmaz
+        recommender = ImprovedLearningRecommender(users_file, hotels_file, training_path)
         
         # Modeli eğit
         recommender.train(evaluate=True)
         
+        # Eğitilen modeli tek adımda yerine taşı (çalışan API bu değişikliği algılayıp yeni modeli yükler)
+        os.replace(training_path, model_path)
+        recommender.model_path = model_path
+        
+        # NumPy motoruyla (INFERENCE_BACKEND=numpy) sunum yapan API'ler için .npz kopyası
+        export_npz(recommender, numpy_model_path)
+        
         print("\nModel eğitimi tamamlandı.")
         print(f"Yeni model {model_path} olarak kaydedildi.")
+        print(f"NumPy motoru için model {numpy_model_path} olarak dışa aktarıldı.")
         
         # Örnekleme yap
         print("\nÖrnek öneriler oluşturuluyor...")
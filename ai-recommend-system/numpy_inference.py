@@ -0,0 +1,279 @@
+"""
+PyTorch gerektirmeyen, yalnızca NumPy ile çalışan çıkarım motoru.
+
+Eğitilmiş ImprovedRecommenderNet ağırlıkları model_export.export_npz() ile (BatchNorm'lar
+katlanmış, Dropout'lar çıkarılmış olarak) .npz dosyasına yazılır; bu modül aynı ileri geçişi
+(embedding'ler, özellik ağları, gizli katmanlar ve 1 + 4*sigmoid çıktısı) NumPy ile hesaplar.
+API, INFERENCE_BACKEND=numpy ile torch içe aktarmadan bu motorla sunum yapabilir.
+"""
+import json
+import os
+import time
+import numpy as np
+from typing import List, Dict, Tuple, Any, Optional, Sequence
+
+from base_recommender import BaseRecommender, FeatureIndex, ModelArtifactError, map_shared_array
+from catalog import CatalogStore
+from features import FeatureScaler, USER_FEATURE_NAMES, HOTEL_FEATURE_NAMES, feature_schema_hash
+
+NUMPY_FORMAT_VERSION = 1  # .npz model dosyası biçim sürümü
+NUMPY_PREDICT_BATCH_PAIRS = 65536  # Tek geçişte puanlanacak en fazla kullanıcı-otel çifti
+
+# .npz dosyasındaki katman dizileri: her ağ için işlem listesi ve işlem başına ağırlıklar
+NETWORK_NAMES = ('user_features_network', 'hotel_features_network', 'head')
+
+
+class NumpyRecommenderNet:
+    """
+    ImprovedRecommenderNet ileri geçişinin NumPy karşılığı (yalnızca çıkarım, float32).
+
+    Her ağ sıralı işlemlerden oluşur: 'linear' (x @ W.T + b), 'relu' ve katlanamayan
+    BatchNorm'lar için 'affine' (x * scale + shift). 'head' ağı gizli katmanlar ile çıktı
+    katmanını kapsar; sonucuna 1 + 4*sigmoid uygulanır.
+    """
+
+    def __init__(self, user_embedding: np.ndarray, hotel_embedding: np.ndarray,
+                 networks: Dict[str, List[Tuple[str, Tuple[np.ndarray, ...]]]]):
+        """
+        Args:
+            user_embedding: Kullanıcı embedding matrisi (kullanıcı sayısı x EMBEDDING_DIM)
+            hotel_embedding: Otel embedding matrisi (otel sayısı x EMBEDDING_DIM)
+            networks: Ağ adı -> [(işlem, parametreler)] (NETWORK_NAMES)
+        """
+        self.user_embedding = np.ascontiguousarray(user_embedding, dtype=np.float32)
+        self.hotel_embedding = np.ascontiguousarray(hotel_embedding, dtype=np.float32)
+        self.embedding_dim = self.user_embedding.shape[1]
+
+        # Linear ağırlıkları matris çarpımı için önceden transpoze edilir
+        self.networks = {}
+        for name in NETWORK_NAMES:
+            ops = []
+            for op, params in networks[name]:
+                if op == 'linear':
+                    weight, bias = params
+                    params = (np.ascontiguousarray(weight.T, dtype=np.float32), bias.astype(np.float32))
+                elif op == 'affine':
+                    params = tuple(param.astype(np.float32) for param in params)
+                elif op != 'relu':
+                    raise ModelArtifactError(f"Desteklenmeyen katman işlemi: {op}")
+                ops.append((op, params))
+            self.networks[name] = ops
+
+    @staticmethod
+    def _run(ops, x: np.ndarray) -> np.ndarray:
+        for op, params in ops:
+            if op == 'linear':
+                x = x @ params[0]
+                x += params[1]
+            elif op == 'relu':
+                np.maximum(x, 0, out=x)
+            else:
+                x = x * params[0] + params[1]
+        return x
+
+    def cold_start_user_embedding(self) -> np.ndarray:
+        """Kayıtlı olmayan kullanıcılar için temsil: kullanıcı embedding'lerinin ortalaması"""
+        return self.user_embedding.mean(axis=0)
+
+    def hotel_vectors(self, hotel_idx: np.ndarray, hotel_features: np.ndarray) -> np.ndarray:
+        """Otel tarafı vektörleri: [otel embedding'i, otel özellik dönüşümü]"""
+        hotel_feat = self._run(self.networks['hotel_features_network'], np.asarray(hotel_features, dtype=np.float32))
+        return np.concatenate([self.hotel_embedding[hotel_idx], hotel_feat], axis=1)
+
+    def user_vectors(self, user_emb: np.ndarray, user_features: np.ndarray) -> np.ndarray:
+        """Kullanıcı tarafı vektörleri: [kullanıcı embedding'i, kullanıcı özellik dönüşümü]"""
+        user_feat = self._run(self.networks['user_features_network'], np.asarray(user_features, dtype=np.float32))
+        return np.concatenate([user_emb, user_feat], axis=1)
+
+    def forward_from_vectors(self, user_vecs: np.ndarray, hotel_vecs: np.ndarray) -> np.ndarray:
+        """Eşleşen satırlardaki kullanıcı ve otel vektörlerinden 1-5 arası puan"""
+        embedding_dim = self.embedding_dim
+        combined = np.concatenate([
+            user_vecs[:, :embedding_dim], hotel_vecs[:, :embedding_dim],
+            user_vecs[:, embedding_dim:], hotel_vecs[:, embedding_dim:]
+        ], axis=1)
+        logits = self._run(self.networks['head'], combined)[:, 0]
+        return 1 + 4 / (1 + np.exp(-logits))
+
+    def forward(self, user_idx: np.ndarray, hotel_idx: np.ndarray, user_features: np.ndarray,
+                hotel_features: np.ndarray) -> np.ndarray:
+        """Kullanıcı-otel çiftleri için ileri geçiş (ImprovedRecommenderNet.forward ile aynı)"""
+        return self.forward_from_vectors(
+            self.user_vectors(self.user_embedding[user_idx], user_features),
+            self.hotel_vectors(hotel_idx, hotel_features)
+        )
+
+
+class NumpyModelArtifact:
+    """
+    model_export.export_npz() ile yazılan .npz model dosyası: ağırlıklar, ölçek parametreleri,
+    ID eşlemeleri, özellik şeması özeti ve eğitim bilgileri
+    """
+
+    def __init__(self, net: NumpyRecommenderNet, user_ids: List[Any], hotel_ids: List[Any],
+                 user_scaler: FeatureScaler, hotel_scaler: FeatureScaler, metadata: Dict[str, Any] = None):
+        self.net = net
+        self.user_ids = list(user_ids)
+        self.hotel_ids = list(hotel_ids)
+        self.user_scaler = user_scaler
+        self.hotel_scaler = hotel_scaler
+        self.metadata = dict(metadata or {})
+
+    @classmethod
+    def load(cls, path: str) -> 'NumpyModelArtifact':
+        """
+        .npz model dosyasını okur ve doğrular
+
+        Raises:
+            ModelArtifactError: Dosya okunamazsa veya şema/boyutlar uyumsuzsa
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {key: data[key] for key in data.files}
+        except Exception as e:
+            raise ModelArtifactError(f"Model dosyası okunamadı ({path}): {e}") from e
+
+        format_version = int(arrays.get('format_version', -1))
+        if format_version != NUMPY_FORMAT_VERSION:
+            raise ModelArtifactError(
+                f"Desteklenmeyen .npz model dosyası sürümü: {format_version} (beklenen: {NUMPY_FORMAT_VERSION})"
+            )
+
+        schema_hash = str(arrays.get('schema_hash', ''))
+        if schema_hash != feature_schema_hash():
+            raise ModelArtifactError(
+                "Model dosyasının özellik şeması mevcut kodla uyumsuz "
+                f"(dosya: {schema_hash[:12]}, kod: {feature_schema_hash()[:12]})"
+            )
+
+        try:
+            user_ids = json.loads(str(arrays['user_ids']))
+            hotel_ids = json.loads(str(arrays['hotel_ids']))
+            metadata = json.loads(str(arrays['metadata']))
+            user_scaler = FeatureScaler(arrays['user_scaler.min'], arrays['user_scaler.scale'])
+            hotel_scaler = FeatureScaler(arrays['hotel_scaler.min'], arrays['hotel_scaler.scale'])
+
+            networks = {}
+            for name in NETWORK_NAMES:
+                ops = []
+                for i, op in enumerate(arrays[f'{name}.ops']):
+                    op = str(op)
+                    if op == 'linear':
+                        params = (arrays[f'{name}.{i}.weight'], arrays[f'{name}.{i}.bias'])
+                    elif op == 'affine':
+                        params = (arrays[f'{name}.{i}.scale'], arrays[f'{name}.{i}.shift'])
+                    else:
+                        params = ()
+                    ops.append((op, params))
+                networks[name] = ops
+
+            net = NumpyRecommenderNet(arrays['user_embedding'], arrays['hotel_embedding'], networks)
+        except KeyError as e:
+            raise ModelArtifactError(f"Model dosyasında eksik alan: {e}") from e
+
+        if len(user_scaler.scale_) != len(USER_FEATURE_NAMES) or len(hotel_scaler.scale_) != len(HOTEL_FEATURE_NAMES):
+            raise ModelArtifactError("Model dosyasındaki ölçek parametreleri özellik şemasıyla uyumsuz")
+        if net.user_embedding.shape[0] != len(user_ids) or net.hotel_embedding.shape[0] != len(hotel_ids):
+            raise ModelArtifactError("Model dosyasındaki embedding boyutları ID eşlemesiyle uyumsuz")
+
+        return cls(net, user_ids, hotel_ids, user_scaler, hotel_scaler, metadata)
+
+
+class NumpyRecommender(BaseRecommender):
+    """
+    .npz model dosyasıyla, PyTorch olmadan öneri sunan sistem (yalnızca çıkarım; eğitim
+    için ImprovedLearningRecommender kullanılır). Öneri ve açıklama çıktıları PyTorch
+    sürümüyle aynı biçimdedir.
+    """
+
+    def __init__(self, users_file: str, hotels_file: str, model_path: str = "improved_hotel_recommender_model.npz"):
+        """
+        Args:
+            users_file: Kullanıcı verileri JSON dosyasının yolu
+            hotels_file: Otel verileri JSON dosyasının yolu
+            model_path: model_export.py --export-npz ile yazılmış model dosyası
+
+        Raises:
+            ModelArtifactError: Model dosyası yoksa, okunamazsa veya uyumsuzsa
+        """
+        start_time = time.time()
+        print("NumPy öneri sistemi başlatılıyor...")
+
+        if not os.path.exists(model_path):
+            raise ModelArtifactError(
+                f"Model dosyası bulunamadı: {model_path} "
+                "(eğitilmiş modelden 'python model_export.py --export-npz' ile oluşturulur)"
+            )
+
+        # Katalog verilerini bellekte tut - dosyalar yalnızca değiştiğinde yeniden okunur
+        self.catalog = CatalogStore(users_file, hotels_file)
+
+        artifact = NumpyModelArtifact.load(model_path)
+        self.net = artifact.net
+        self.dataset = FeatureIndex(self.catalog.snapshot(), artifact.user_ids, artifact.hotel_ids,
+                                    artifact.user_scaler, artifact.hotel_scaler)
+
+        self.model_path = model_path
+        self.model_metadata = artifact.metadata
+        self.model_version = self._checkpoint_version(model_path)
+
+        self._room_table_indices = None
+
+        # Soğuk başlangıç temsili ve tüm otellerin otel tarafı vektörleri (ağırlıklar sabit)
+        self._cold_start_user_embedding = self.net.cold_start_user_embedding()
+        self._hotel_vector_cache = self.net.hotel_vectors(np.arange(self.dataset.num_hotels),
+                                                          self.dataset.hotel_features)
+
+        print(f"Model dosyası '{model_path}' yüklendi. Kullanıcı sayısı: {self.dataset.num_users}, "
+              f"Otel sayısı: {self.dataset.num_hotels}")
+        print(f"Öneri sistemi başlatma süresi: {time.time() - start_time:.2f} saniye")
+
+    def _share_model_arrays(self, directory: str):
+        """Embedding'leri, katman parametrelerini ve otel vektörlerini bellek eşlemeli dosyalara taşır"""
+        net = self.net
+        net.user_embedding = map_shared_array(directory, 'user_embedding', net.user_embedding)
+        net.hotel_embedding = map_shared_array(directory, 'hotel_embedding', net.hotel_embedding)
+        for name, ops in net.networks.items():
+            net.networks[name] = [
+                (op, tuple(map_shared_array(directory, f"{name}.{position}.{i}", param)
+                           for i, param in enumerate(params)))
+                for position, (op, params) in enumerate(ops)
+            ]
+        self._hotel_vector_cache = map_shared_array(directory, 'hotel_vectors', self._hotel_vector_cache)
+
+    def _predict_score_block(self, user_indices: Sequence[Optional[int]], user_features: np.ndarray,
+                             hotel_indices: np.ndarray) -> np.ndarray:
+        """
+        Kullanıcılar x oteller puan bloğunu NumPy ile hesaplar
+
+        Returns:
+            (kullanıcı sayısı x otel sayısı) boyutunda tahmin matrisi (float32)
+        """
+        num_users = len(user_indices)
+        num_hotels = len(hotel_indices)
+        scores = np.empty((num_users, num_hotels), dtype=np.float32)
+        if num_users == 0 or num_hotels == 0:
+            return scores
+
+        # Kullanıcı embedding'leri; kayıtlı olmayanlar için soğuk başlangıç temsili
+        user_emb = np.empty((num_users, self.net.embedding_dim), dtype=np.float32)
+        user_emb[:] = self._cold_start_user_embedding
+        known = [i for i, user_idx in enumerate(user_indices) if user_idx is not None]
+        if known:
+            user_emb[known] = self.net.user_embedding[[user_indices[i] for i in known]]
+
+        user_vecs = self.net.user_vectors(user_emb, user_features)
+        hotel_vecs = self._hotel_vector_cache[np.asarray(hotel_indices, dtype=np.int64)]
+
+        # Bellek kullanımını sınırlamak için kullanıcıları parçalar halinde işle
+        users_per_pass = max(1, NUMPY_PREDICT_BATCH_PAIRS // num_hotels)
+        for start in range(0, num_users, users_per_pass):
+            end = min(start + users_per_pass, num_users)
+            count = end - start
+            predictions = self.net.forward_from_vectors(
+                np.repeat(user_vecs[start:end], num_hotels, axis=0),
+                np.tile(hotel_vecs, (count, 1))
+            )
+            scores[start:end] = predictions.reshape(count, num_hotels)
+
+        return scores
@@ -0,0 +1,194 @@
+import numpy as np
+from typing import List, Dict, Tuple, Any, Sequence
+
+# Kullanıcı tercihlerindeki özellik adları ve oda kaydındaki karşılıkları (sütun sırası sabittir)
+AMENITY_COLUMNS = [
+    ('WiFi', 'hasWifi'),
+    ('TV', 'hasTV'),
+    ('Balkon', 'hasBalcony'),
+    ('Minibar', 'hasMinibar'),
+]
+
+# np.round ile Python round() arasındaki olası fark (en fazla bir kuruş) için güvenlik payı
+_ROUNDING_MARGIN = 0.025
+
+
+class RoomTable:
+    """
+    Otel kataloğundaki odaları sütunlu NumPy dizileri halinde tutan önhesaplanmış tablo.
+
+    Oda sırası, otellerin ve odaların JSON'daki sırasıyla aynıdır; sıralamadaki
+    eşitlikler bu sıraya göre çözüldüğü için tablo bu sırayı korur.
+    """
+
+    # Önbelleğe yazılan sütunlar (type_codes ayrıca saklanır)
+    COLUMNS = ('room_hotel', 'room_offsets', 'price', 'capacity', 'room_type', 'amenities', 'available')
+
+    def __init__(self, hotels: Sequence[Dict[str, Any]], columns: Dict[str, Any] = None):
+        """
+        Args:
+            hotels: Otel kayıtları (odaları ile birlikte)
+            columns: Aynı kayıtlardan önceden derlenmiş sütunlar (columns() çıktısı); verilirse
+                sütunlar yeniden hesaplanmaz, yalnızca kayıt listeleri oluşturulur
+        """
+        self.hotels = []
+        self.rooms = []
+        room_hotel = []
+
+        # Odası olmayan oteller tabloya alınmaz
+        for hotel in hotels:
+            if not hotel.get('rooms'):
+                continue
+            slot = len(self.hotels)
+            self.hotels.append(hotel)
+            for room in hotel['rooms']:
+                self.rooms.append(room)
+                room_hotel.append(slot)
+
+        self.hotel_ids = [hotel['id'] for hotel in self.hotels]
+        self.num_hotels = len(self.hotels)
+        self.num_rooms = len(self.rooms)
+
+        if columns is not None:
+            for name in self.COLUMNS:
+                setattr(self, name, columns[name])
+            self.type_codes = dict(columns['type_codes'])
+            return
+
+        # Her odanın tablodaki otel sırası ve her otelin oda aralığı
+        # (otelin odaları room_offsets[slot]:room_offsets[slot + 1] aralığındadır)
+        self.room_hotel = np.array(room_hotel, dtype=np.int64)
+        self.room_offsets = np.zeros(self.num_hotels + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.room_hotel, minlength=self.num_hotels), out=self.room_offsets[1:])
+
+        self.price = np.array([room['pricePerNight'] for room in self.rooms], dtype=np.float64)
+        self.capacity = np.array([room['capacity'] for room in self.rooms], dtype=np.float64)
+
+        # Oda tiplerini tamsayı kodlarına çevir
+        self.type_codes = {}
+        for room in self.rooms:
+            self.type_codes.setdefault(room['type'], len(self.type_codes))
+        self.room_type = np.array([self.type_codes[room['type']] for room in self.rooms], dtype=np.int64)
+
+        # Oda özellikleri matrisi (oda sayısı x özellik sayısı)
+        self.amenities = np.array(
+            [[bool(room.get(key, False)) for _, key in AMENITY_COLUMNS] for room in self.rooms],
+            dtype=np.int64
+        ).reshape(self.num_rooms, len(AMENITY_COLUMNS))
+
+        self.available = np.array([room.get('status') == 'AVAILABLE' for room in self.rooms], dtype=bool)
+
+    def columns(self) -> Dict[str, Any]:
+        """Tablonun sütunlarını ve oda tipi kodlarını döndürür (önbelleğe yazmak için)"""
+        columns = {name: getattr(self, name) for name in self.COLUMNS}
+        columns['type_codes'] = dict(self.type_codes)
+        return columns
+
+
+def score_rooms(table: RoomTable, base_scores: np.ndarray, user: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Otel bazlı model puanlarına bütçe, oda tipi ve özellik çarpanlarını uygular.
+
+    Hesaplama, eski oda döngüsüyle aynı sırada ve float64 ile yapılır; bu yüzden
+    çıkan puanlar birebir aynıdır.
+
+    Args:
+        table: Oda tablosu
+        base_scores: Tablodaki her otel için modelin temel puanı
+        user: Kullanıcı kaydı
+
+    Returns:
+        (oda puanları, aday maskesi) - aday maskesi kapasitesi yeterli ve müsait odaları işaretler
+    """
+    min_budget = user['preferredBudget']['min']
+    max_budget = user['preferredBudget']['max']
+    price = table.price
+
+    room_score = np.asarray(base_scores, dtype=np.float64)[table.room_hotel]
+
+    # Bütçe uyumu
+    budget_factor = np.select(
+        [price < min_budget * 0.8, price > max_budget * 1.2, price < min_budget, price > max_budget],
+        [0.9, 0.5, 0.95, 0.7],
+        default=1.1
+    )
+    room_score = room_score * budget_factor
+
+    # Oda tipi uyumu
+    preferred_type = table.type_codes.get(user['preferredRoomType'], -1)
+    room_score = room_score * np.where(table.room_type == preferred_type, 1.2, 0.8)
+
+    # Özellik eşleşmesi
+    amenity_count = len(user['preferredAmenities'])
+    if amenity_count > 0:
+        wanted = np.array([name in user['preferredAmenities'] for name, _ in AMENITY_COLUMNS], dtype=np.int64)
+        amenity_match_ratio = (table.amenities @ wanted) / amenity_count
+        room_score = room_score * (0.8 + 0.4 * amenity_match_ratio)
+
+    room_score = np.minimum(5.0, np.maximum(1.0, room_score))
+
+    candidates = (table.capacity >= user['requiredCapacity']) & table.available
+    return room_score, candidates
+
+
+def rank_rooms(scores: np.ndarray, candidates: np.ndarray, top_n: int) -> List[Tuple[int, float]]:
+    """
+    Aday odaları 2 haneye yuvarlanmış puana göre azalan sırada sıralar.
+
+    Sonuç, sorted(..., key=round(puan, 2), reverse=True)[:top_n] ile birebir aynıdır
+    (eşit puanlarda tablo sırası korunur). Büyük kataloglarda önce np.partition ile
+    ilk top_n civarı daraltılır, yalnızca kalan adaylar Python'da sıralanır.
+
+    Returns:
+        (tablodaki oda sırası, yuvarlanmış puan) listesi
+    """
+    positions = np.flatnonzero(candidates)
+    values = scores[positions]
+    count = len(positions)
+
+    if 0 < top_n < count:
+        approx = np.round(values, 2)
+        threshold = np.partition(approx, count - top_n)[count - top_n]
+        keep = approx >= threshold - _ROUNDING_MARGIN
+        positions = positions[keep]
+        values = values[keep]
+
+    rounded = [round(value, 2) for value in values.tolist()]
+    order = sorted(range(len(rounded)), key=rounded.__getitem__, reverse=True)[:top_n]
+    return [(int(positions[i]), rounded[i]) for i in order]
+
+
+def describe_adjustments(room: Dict[str, Any], user: Dict[str, Any]) -> List[str]:
+    """Bir oda için uygulanan çarpanları açıklayan metinleri üretir (debug modu için)"""
+    adjustment_factors = []
+
+    min_budget = user['preferredBudget']['min']
+    max_budget = user['preferredBudget']['max']
+    room_price = room['pricePerNight']
+
+    if room_price < min_budget * 0.8:
+        adjustment_factors.append(f"Bütçe altı ({room_price} < {min_budget}): x0.9")
+    elif room_price > max_budget * 1.2:
+        adjustment_factors.append(f"Bütçe üstü ({room_price} > {max_budget}): x0.5")
+    elif room_price < min_budget:
+        adjustment_factors.append(f"Biraz bütçe altı: x0.95")
+    elif room_price > max_budget:
+        adjustment_factors.append(f"Biraz bütçe üstü: x0.7")
+    else:
+        adjustment_factors.append(f"Bütçeye uygun: x1.1")
+
+    if room['type'] == user['preferredRoomType']:
+        adjustment_factors.append(f"Tercih edilen oda tipi: x1.2")
+    else:
+        adjustment_factors.append(f"Farklı oda tipi: x0.8")
+
+    amenity_count = len(user['preferredAmenities'])
+    if amenity_count > 0:
+        amenity_match_count = sum(
+            1 for name, key in AMENITY_COLUMNS
+            if name in user['preferredAmenities'] and room.get(key, False)
+        )
+        amenity_factor = 0.8 + 0.4 * (amenity_match_count / amenity_count)
+        adjustment_factors.append(f"Özellik eşleşmesi ({amenity_match_count}/{amenity_count}): x{amenity_factor:.2f}")
+
+    return adjustment_factors
@@ -0,0 +1,149 @@
+"""
+Üretim sunumu için ön-çatallı (pre-fork) çok işçili giriş noktası.
+
+Model, katalog ve ölçekler ana süreçte bir kez yüklenip ısıtılır; özellik matrisleri ve model
+ağırlıkları bellek eşlemeli dosyalara taşınır, ardından işçiler çatallanır (fork). İşçiler aynı
+dinleme soketini paylaşır ve dizileri tek kopya olarak kullanır; böylece bellek kullanımı işçi
+sayısıyla doğrusal büyümez. Ölümcül olarak sonlanan işçiler yeniden başlatılır.
+
+Kullanım:
+    python serve.py --workers 4 --port 5001 --torch-threads 1
+    INFERENCE_BACKEND=numpy python serve.py --workers 8
+
+Notlar:
+    - Yalnızca fork destekleyen sistemlerde (Linux, macOS) çalışır.
+    - Sonuç önbelleği ve /metrics ölçümleri işçi başınadır.
+    - Model dosyası her işçide ayrı izlenir; yeniden yüklenen model işçiye özel bellekte tutulur
+      (paylaşımlı kullanıma dönmek için sunucu yeniden başlatılır).
+"""
+import argparse
+import gc
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+import traceback
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Otel öneri API'si - ön-çatallı çok işçili sunum")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5001)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="İşçi süreç sayısı")
+    parser.add_argument('--torch-threads', type=int, default=1,
+                        help="İşçi başına PyTorch/BLAS iş parçacığı sayısı")
+    parser.add_argument('--shared-dir',
+                        help="Bellek eşlemeli dizi dosyalarının dizini (verilmezse geçici dizin kullanılır)")
+    return parser.parse_args()
+
+
+def configure_threads(num_threads: int):
+    """BLAS/OpenMP ve (yüklüyse) PyTorch iş parçacığı sayısını ayarlar"""
+    for name in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+        os.environ[name] = str(num_threads)
+    if 'torch' in sys.modules:
+        sys.modules['torch'].set_num_threads(num_threads)
+
+
+def run_worker(api, listen_socket: socket.socket, args, watch_interval: float):
+    """İşçi süreci: paylaşılan soketten gelen istekleri sunar"""
+    from werkzeug.serving import make_server
+
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    configure_threads(args.torch_threads)
+
+    # Arka plan iş parçacıkları çatallamayla aktarılmaz; dosya izleme işçide başlatılır
+    if watch_interval > 0:
+        api.reloader.start_watching(watch_interval)
+
+    server = make_server(args.host, args.port, api.app, threaded=True, fd=listen_socket.fileno())
+    print(f"İşçi {os.getpid()} istekleri bekliyor.")
+    server.serve_forever()
+
+
+def main():
+    args = parse_args()
+    if not hasattr(os, 'fork'):
+        sys.exit("Ön-çatallı sunum fork desteği gerektirir (Linux/macOS).")
+
+    # Kütüphaneler yüklenmeden önce ayarlanmalı (OpenMP iş parçacıkları ana süreçte açılmaz)
+    configure_threads(args.torch_threads)
+
+    # Model dosyası ana süreçte değil, işçilerde izlenir
+    watch_interval = float(os.environ.get("MODEL_WATCH_INTERVAL", "5"))
+    os.environ["MODEL_WATCH_INTERVAL"] = "0"
+
+    import hotel_recommendation_api as api
+    configure_threads(args.torch_threads)
+
+    shared_dir = args.shared_dir or tempfile.mkdtemp(prefix="hotel-recommender-shared-")
+    start_time = time.time()
+    recommender = api.registry.current()
+    recommender.share_arrays(shared_dir)
+    recommender.warm_up()
+    print(f"Diziler {shared_dir} dizinine eşlendi ve model ısıtıldı ({time.time() - start_time:.2f} saniye).")
+
+    listen_socket = socket.create_server((args.host, args.port), backlog=1024)
+    listen_socket.set_inheritable(True)
+
+    # Çatallamadan önceki nesneler çöp toplayıcıdan çıkarılır; böylece işçilerdeki toplama
+    # turları bu nesnelerin sayfalarına yazıp kopyalanmalarına (copy-on-write) yol açmaz
+    gc.collect()
+    gc.freeze()
+
+    workers = {}
+    stopping = False
+
+    def spawn(slot: int):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(api, listen_socket, args, watch_interval)
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(1)
+        workers[pid] = slot
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for slot in range(args.workers):
+        spawn(slot)
+    print(f"{args.workers} işçi http://{args.host}:{args.port} adresinde çalışıyor (ana süreç {os.getpid()}).")
+
+    try:
+        while workers:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            slot = workers.pop(pid, None)
+            if slot is not None and not stopping:
+                print(f"İşçi {pid} sonlandı (durum {status}), yeniden başlatılıyor...")
+                time.sleep(1)
+                spawn(slot)
+    finally:
+        listen_socket.close()
+        if not args.shared_dir:
+            shutil.rmtree(shared_dir, ignore_errors=True)
+        print("Sunucu kapatıldı.")
+
+
+if __name__ == '__main__':
+    main()
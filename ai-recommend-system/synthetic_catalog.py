@@ -0,0 +1,359 @@
+"""
+Tohumlanmış sentetik otel/kullanıcı kataloğu üreteci (expanded_* dosyalarıyla aynı şema).
+
+Fiyat, oda tipi, kapasite, özellik ve oda durumu dağılımları bir katalog tanımıyla
+(DEFAULT_CATALOG_SPEC; JSON dosyasıyla kısmen değiştirilebilir) belirlenir. Kayıtlar parçalar
+halinde üretilip doğrudan dosyaya yazılır; milyonlarca kayıt için bile bellekte tüm katalog
+tutulmaz. Her parça kendi tohumundan üretildiği için aynı tohum, tanım ve boyutlar parça
+boyutundan bağımsız olarak her zaman aynı dosyaları üretir.
+
+Dağılım biçimleri:
+    {"dist": "uniform", "min": 1, "max": 4}                          tamsayı, uçlar dahil
+    {"dist": "lognormal", "median": 1500, "sigma": 0.3, "min": 500, "max": 10000, "round": 10}
+    {"dist": "choice", "values": ["STANDARD", "DELUXE"], "weights": [0.6, 0.4]}
+
+Kullanım:
+    python synthetic_catalog.py --hotels 100000 --users 1000000 --out-dir datas/synthetic
+    python synthetic_catalog.py --print-spec > spec.json
+    python synthetic_catalog.py --hotels 1000 --users 10000 --spec spec.json --seed 7
+"""
+import argparse
+import copy
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+# Tek seferde üretilip dosyaya yazılan kayıt sayısı (çıktıyı etkilemez)
+GENERATION_CHUNK_SIZE = 10_000
+
+# Çıktıyı belirleyen parça büyüklüğü; her parça [tohum, akış, parça sırası] ile tohumlanır
+_SEED_BLOCK_SIZE = 1_000
+
+# Kullanıcı tercihlerindeki özellik adları ve oda kaydındaki karşılıkları (scoring_engine.AMENITY_COLUMNS)
+AMENITY_FIELDS = {'WiFi': 'hasWifi', 'TV': 'hasTV', 'Balkon': 'hasBalcony', 'Minibar': 'hasMinibar'}
+
+# Varsayılan dağılımlar paket verilerindeki (expanded_*) dağılımlara yakındır
+DEFAULT_CATALOG_SPEC: Dict[str, Any] = {
+    'hotels': {
+        'cities': {'dist': 'choice', 'values': ['Nevşehir', 'Ürgüp', 'Göreme', 'Avanos', 'Uçhisar']},
+        'rooms_per_hotel': {'dist': 'uniform', 'min': 5, 'max': 10},
+        # Otelin fiyat seviyesi ve odaların bu seviyeye eklenen fiyat farkı
+        'base_price': {'dist': 'uniform', 'min': 1000, 'max': 1999},
+        'room_price_offset': {'dist': 'uniform', 'min': 0, 'max': 799},
+    },
+    'rooms': {
+        'type': {'dist': 'choice', 'values': ['STANDARD', 'DELUXE'], 'weights': [0.6, 0.4]},
+        'capacity': {'dist': 'choice', 'values': [1, 2, 3, 4], 'weights': [0.18, 0.32, 0.3, 0.2]},
+        'bed_count': {'dist': 'uniform', 'min': 1, 'max': 2},
+        'status': {'dist': 'choice', 'values': ['AVAILABLE', 'BOOKED'], 'weights': [0.9, 0.1]},
+        # Özellik adı -> odada bulunma olasılığı
+        'amenity_rates': {'WiFi': 0.93, 'TV': 0.63, 'Balkon': 0.6, 'Minibar': 0.79},
+    },
+    'users': {
+        'budget_min': {'dist': 'uniform', 'min': 10, 'max': 19, 'scale': 100},
+        'budget_width': {'dist': 'uniform', 'min': 300, 'max': 700},
+        'room_type': {'dist': 'choice', 'values': ['STANDARD', 'DELUXE'], 'weights': [0.4, 0.6]},
+        'capacity': {'dist': 'choice', 'values': [1, 2, 3, 4], 'weights': [0.21, 0.42, 0.21, 0.16]},
+        'amenity_count': {'dist': 'choice', 'values': [1, 2, 3, 4], 'weights': [0.16, 0.42, 0.24, 0.18]},
+        # İstenen özelliklerin seçilme ağırlıkları (popülerlik)
+        'amenity_weights': {'WiFi': 0.32, 'TV': 0.24, 'Balkon': 0.24, 'Minibar': 0.2},
+        'age': {'dist': 'uniform', 'min': 18, 'max': 70},
+        'gender': {'dist': 'choice', 'values': ['Erkek', 'Kadın']},
+    },
+}
+
+
+def _merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    merged = copy.deepcopy(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict) and 'dist' not in value:
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def load_catalog_spec(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Varsayılan katalog tanımını döndürür; dosya verilirse içindeki alanlar varsayılanların üzerine yazılır
+
+    Raises:
+        ValueError: Tanımda geçersiz bir dağılım varsa
+    """
+    spec = DEFAULT_CATALOG_SPEC
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            spec = _merge(spec, json.load(f))
+    validate_catalog_spec(spec)
+    return spec
+
+
+def catalog_spec_hash(spec: Dict[str, Any]) -> str:
+    """Katalog tanımının kısa içerik özeti (üretilen dosyaların adlandırılması için)"""
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()[:8]
+
+
+def validate_catalog_spec(spec: Dict[str, Any]):
+    """
+    Raises:
+        ValueError: Bilinmeyen dağılım, eksik parametre veya bilinmeyen özellik adı varsa
+    """
+    for section in ('hotels', 'rooms', 'users'):
+        for name, distribution in spec[section].items():
+            if isinstance(distribution, dict) and 'dist' in distribution:
+                # Küçük bir örnek çekilerek parametreler doğrulanır
+                sample(distribution, np.random.default_rng(0), 4)
+    _room_id_base(spec['hotels']['rooms_per_hotel'])
+    for key in ('amenity_rates', 'amenity_weights'):
+        section = spec['rooms'] if key == 'amenity_rates' else spec['users']
+        unknown = set(section[key]) - set(AMENITY_FIELDS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen özellik adı ({key}): {', '.join(sorted(unknown))}")
+
+
+def sample(distribution: Dict[str, Any], rng: np.random.Generator, size: int) -> np.ndarray:
+    """
+    Dağılım tanımından size adet değer çeker
+
+    Raises:
+        ValueError: Dağılım biçimi bilinmiyorsa veya parametreler geçersizse
+    """
+    kind = distribution.get('dist')
+    try:
+        if kind == 'uniform':
+            values = rng.integers(distribution['min'], distribution['max'] + 1, size=size)
+        elif kind == 'lognormal':
+            values = rng.lognormal(np.log(distribution['median']), distribution['sigma'], size=size)
+            values = np.clip(values, distribution.get('min', 0), distribution.get('max', np.inf))
+            step = distribution.get('round', 1)
+            values = (np.round(values / step) * step).astype(np.int64)
+        elif kind == 'choice':
+            choices = distribution['values']
+            weights = distribution.get('weights')
+            if weights is not None:
+                weights = np.asarray(weights, dtype=np.float64)
+                weights = weights / weights.sum()
+            return np.asarray(choices, dtype=object)[rng.choice(len(choices), size=size, p=weights)]
+        else:
+            raise ValueError(f"Bilinmeyen dağılım: {kind!r}")
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Geçersiz dağılım tanımı {distribution}: {e}") from e
+    return values * distribution.get('scale', 1)
+
+
+def _room_id_base(rooms_per_hotel: Dict[str, Any]) -> int:
+    """Oda ID'si = otel ID'si x taban + oda sırası; taban en büyük oda sayısından türetilir (en az 100)"""
+    if rooms_per_hotel['dist'] == 'choice':
+        max_rooms = max(rooms_per_hotel['values'])
+    elif 'max' in rooms_per_hotel:
+        max_rooms = rooms_per_hotel['max']
+    else:
+        raise ValueError("rooms_per_hotel dağılımının bir üst sınırı (max) olmalıdır")
+    return max(100, 10 ** len(str(int(max_rooms))))
+
+
+def _block_rng(seed: int, stream: int, block: int) -> np.random.Generator:
+    return np.random.default_rng([seed, stream, block])
+
+
+def _generate_hotels(start: int, count: int, rng: np.random.Generator, spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """[start, start + count) aralığındaki otelleri (1'den başlayan ID'lerle) üretir"""
+    hotel_spec, room_spec = spec['hotels'], spec['rooms']
+    rooms_per_hotel = sample(hotel_spec['rooms_per_hotel'], rng, count)
+    num_rooms = int(rooms_per_hotel.sum())
+
+    # Oda öznitelikleri tek seferde vektörel üretilir
+    prices = (np.repeat(sample(hotel_spec['base_price'], rng, count), rooms_per_hotel)
+              + sample(hotel_spec['room_price_offset'], rng, num_rooms)).tolist()
+    cities = sample(hotel_spec['cities'], rng, count).tolist()
+    room_types = sample(room_spec['type'], rng, num_rooms).tolist()
+    capacities = [int(value) for value in sample(room_spec['capacity'], rng, num_rooms)]
+    bed_counts = [int(value) for value in sample(room_spec['bed_count'], rng, num_rooms)]
+    statuses = sample(room_spec['status'], rng, num_rooms).tolist()
+    amenity_rates = room_spec['amenity_rates']
+    amenities = [(AMENITY_FIELDS[name], (rng.random(num_rooms) < amenity_rates.get(name, 0.0)).tolist())
+                 for name in AMENITY_FIELDS]
+
+    # Oda ID'leri otel ID'sinden türetilir; böylece parçalar birbirinden bağımsız üretilebilir
+    rooms_id_base = _room_id_base(hotel_spec['rooms_per_hotel'])
+    hotels = []
+    position = 0
+    for offset in range(count):
+        hotel_id = start + offset + 1
+        hotel_name = f"[SYNTHETIC] Hotel {hotel_id}"
+        rooms = []
+        for room_number in range(int(rooms_per_hotel[offset])):
+            room = {
+                'id': hotel_id * rooms_id_base + room_number,
+                'roomNumber': f"{room_number // 10 + 1}{room_number % 10 + 1:02d}",
+                'name': f"Oda {room_number + 1}",
+                'capacity': capacities[position],
+                'type': room_types[position],
+                'description': f"Otel {hotel_id} oda {room_number + 1}",
+                'pricePerNight': prices[position],
+            }
+            for field, values in amenities:
+                room[field] = values[position]
+            room.update({
+                'floorNumber': room_number // 10 + 1,
+                'bedCount': bed_counts[position],
+                'status': statuses[position],
+                'hotelId': hotel_id,
+                'hotelName': hotel_name,
+            })
+            rooms.append(room)
+            position += 1
+
+        city = cities[offset]
+        hotels.append({
+            'id': hotel_id,
+            'name': hotel_name,
+            'city': city,
+            'address': f"{city} Merkez Cadde No:{hotel_id}",
+            'description': f"{city}'de konforlu konaklama - Otel {hotel_id}",
+            'pricePerNight': min((room['pricePerNight'] for room in rooms), default=0),
+            'totalRooms': len(rooms),
+            'availableRooms': sum(1 for room in rooms if room['status'] == 'AVAILABLE'),
+            'rooms': rooms,
+        })
+    return hotels
+
+
+def _generate_users(start: int, count: int, rng: np.random.Generator, spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """[start, start + count) aralığındaki kullanıcıları (1'den başlayan ID'lerle) üretir"""
+    user_spec = spec['users']
+    budget_min = [int(value) for value in sample(user_spec['budget_min'], rng, count)]
+    budget_width = [int(value) for value in sample(user_spec['budget_width'], rng, count)]
+    room_types = sample(user_spec['room_type'], rng, count).tolist()
+    capacities = [int(value) for value in sample(user_spec['capacity'], rng, count)]
+    ages = [int(value) for value in sample(user_spec['age'], rng, count)]
+    genders = sample(user_spec['gender'], rng, count).tolist()
+
+    # İstenen özellikler popülerlik ağırlıklarıyla, tekrarsız seçilir (Gumbel-top-k)
+    amenity_names = list(AMENITY_FIELDS)
+    weights = np.array([user_spec['amenity_weights'].get(name, 0.0) for name in amenity_names])
+    available = int((weights > 0).sum())
+    amenity_counts = np.minimum(
+        np.asarray(sample(user_spec['amenity_count'], rng, count), dtype=np.int64), available
+    ).tolist()
+    with np.errstate(divide='ignore'):
+        keys = np.log(weights) + rng.gumbel(size=(count, len(amenity_names)))
+    amenity_order = np.argsort(-keys, axis=1).tolist()
+
+    users = []
+    for offset in range(count):
+        user_id = start + offset + 1
+        users.append({
+            'id': user_id,
+            'name': f"Kullanıcı {user_id}",
+            'email': f"kullanici{user_id}@example.com",
+            'age': ages[offset],
+            'gender': genders[offset],
+            'preferredBudget': {'min': budget_min[offset], 'max': budget_min[offset] + budget_width[offset]},
+            'preferredRoomType': room_types[offset],
+            'requiredCapacity': capacities[offset],
+            'preferredAmenities': [amenity_names[i] for i in amenity_order[offset][:amenity_counts[offset]]],
+            'specialRequests': "",
+            'travelDates': {'start': "2024-01-01", 'end': "2024-01-05"},
+        })
+    return users
+
+
+def _iter_records(generate, stream: int, total: int, seed: int, spec: Dict[str, Any],
+                  chunk_size: int) -> Iterator[Dict[str, Any]]:
+    blocks_per_chunk = max(1, chunk_size // _SEED_BLOCK_SIZE)
+    for chunk_start in range(0, total, blocks_per_chunk * _SEED_BLOCK_SIZE):
+        records = []
+        chunk_end = min(chunk_start + blocks_per_chunk * _SEED_BLOCK_SIZE, total)
+        for start in range(chunk_start, chunk_end, _SEED_BLOCK_SIZE):
+            count = min(_SEED_BLOCK_SIZE, total - start)
+            records.extend(generate(start, count, _block_rng(seed, stream, start // _SEED_BLOCK_SIZE), spec))
+        yield from records
+
+
+def iter_hotels(num_hotels: int, seed: int = 0, spec: Dict[str, Any] = None,
+                chunk_size: int = GENERATION_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Otelleri parçalar halinde üreterek tek tek döndürür"""
+    return _iter_records(_generate_hotels, 0, num_hotels, seed, spec or DEFAULT_CATALOG_SPEC, chunk_size)
+
+
+def iter_users(num_users: int, seed: int = 0, spec: Dict[str, Any] = None,
+               chunk_size: int = GENERATION_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Kullanıcıları parçalar halinde üreterek tek tek döndürür"""
+    return _iter_records(_generate_users, 1, num_users, seed, spec or DEFAULT_CATALOG_SPEC, chunk_size)
+
+
+def write_json_array(path: str, records: Iterator[Dict[str, Any]]) -> int:
+    """
+    Kayıtları tek tek JSON dizisi olarak dosyaya yazar (geçici dosya + yerine taşıma)
+
+    Returns:
+        Yazılan kayıt sayısı
+    """
+    tmp_path = f"{path}.tmp"
+    count = 0
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for record in records:
+            f.write(',\n' if count else '\n')
+            f.write(json.dumps(record, ensure_ascii=False))
+            count += 1
+        f.write('\n]\n')
+    os.replace(tmp_path, path)
+    return count
+
+
+def write_catalog(users_file: str, hotels_file: str, num_hotels: int, num_users: int, seed: int = 0,
+                  spec: Dict[str, Any] = None, chunk_size: int = GENERATION_CHUNK_SIZE):
+    """
+    Verilen boyutlarda kullanıcı ve otel dosyalarını üretir
+
+    Args:
+        users_file: Yazılacak kullanıcı dosyası
+        hotels_file: Yazılacak otel dosyası
+        num_hotels: Otel sayısı
+        num_users: Kullanıcı sayısı
+        seed: Üretecin tohumu
+        spec: Katalog tanımı (verilmezse DEFAULT_CATALOG_SPEC)
+        chunk_size: Bellekte tek seferde tutulacak kayıt sayısı
+    """
+    for path in (users_file, hotels_file):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    write_json_array(hotels_file, iter_hotels(num_hotels, seed, spec, chunk_size))
+    write_json_array(users_file, iter_users(num_users, seed, spec, chunk_size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik otel/kullanıcı kataloğu üreteci")
+    parser.add_argument('--hotels', type=int, help="Otel sayısı")
+    parser.add_argument('--users', type=int, help="Kullanıcı sayısı")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--spec', help="Varsayılan dağılımların üzerine yazılacak JSON katalog tanımı")
+    parser.add_argument('--chunk-size', type=int, default=GENERATION_CHUNK_SIZE,
+                        help="Bellekte tek seferde tutulacak kayıt sayısı")
+    parser.add_argument('--out-dir', default='datas/synthetic')
+    parser.add_argument('--print-spec', action='store_true', help="Kullanılacak katalog tanımını yazdır ve çık")
+    args = parser.parse_args()
+
+    spec = load_catalog_spec(args.spec)
+    if args.print_spec:
+        print(json.dumps(spec, ensure_ascii=False, indent=2))
+        return
+    if args.hotels is None or args.users is None:
+        parser.error("--hotels ve --users gerekli")
+
+    start_time = time.time()
+    users_file = os.path.join(args.out_dir, f'users_{args.users}.json')
+    hotels_file = os.path.join(args.out_dir, f'hotels_{args.hotels}.json')
+    write_catalog(users_file, hotels_file, args.hotels, args.users, args.seed, spec, args.chunk_size)
+    print(f"{hotels_file} ve {users_file} yazıldı ({time.time() - start_time:.1f} saniye).")
+
+
+if __name__ == '__main__':
+    main()
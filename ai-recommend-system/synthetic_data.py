@@ -0,0 +1,134 @@
+import numpy as np
+from typing import List, Dict, Any, Sequence
+
+from scoring_engine import AMENITY_COLUMNS, RoomTable
+
+# Tek seferde işlenecek en fazla kullanıcı x oda çifti (bellek kullanımını sınırlar)
+SYNTHESIS_CHUNK_PAIRS = 4_000_000
+
+
+class UserTable:
+    """
+    Kullanıcı tercihlerini sütunlu NumPy dizileri halinde tutan tablo
+    (sentetik etkileşim üretiminde yayınlama (broadcast) için)
+    """
+
+    def __init__(self, users: Sequence[Dict[str, Any]], type_codes: Dict[str, int]):
+        """
+        Args:
+            users: Kullanıcı kayıtları
+            type_codes: Oda tipi -> tamsayı kodu (RoomTable.type_codes)
+        """
+        self.num_users = len(users)
+        self.budget_min = np.array([user['preferredBudget']['min'] for user in users], dtype=np.float64)
+        self.budget_max = np.array([user['preferredBudget']['max'] for user in users], dtype=np.float64)
+        self.required_capacity = np.array([user['requiredCapacity'] for user in users], dtype=np.float64)
+
+        # Tablodaki oda tiplerinden biri değilse hiçbir odayla eşleşmez
+        self.room_type = np.array([type_codes.get(user['preferredRoomType'], -1) for user in users], dtype=np.int64)
+
+        # İstenen özellikler matrisi (kullanıcı sayısı x özellik sayısı) ve toplam istenen özellik sayısı
+        self.wanted = np.array(
+            [[name in user['preferredAmenities'] for name, _ in AMENITY_COLUMNS] for user in users],
+            dtype=np.int64
+        ).reshape(self.num_users, len(AMENITY_COLUMNS))
+        self.amenity_count = np.array([len(user['preferredAmenities']) for user in users], dtype=np.float64)
+
+
+def _first_in_segments(mask: np.ndarray, segment_starts: np.ndarray) -> np.ndarray:
+    """
+    Her satırda, her otelin oda aralığındaki ilk True odanın tablo sırasını döndürür (yoksa -1)
+    """
+    num_rooms = mask.shape[1]
+    positions = np.where(mask, np.arange(num_rooms), num_rooms)
+    first = np.minimum.reduceat(positions, segment_starts, axis=1)
+    return np.where(first < num_rooms, first, -1)
+
+
+def synthesize_interactions(users: Sequence[Dict[str, Any]], table: RoomTable, user_indices: Sequence[int],
+                            hotel_indices: Sequence[int], rng: np.random.Generator,
+                            progress=None) -> Dict[str, np.ndarray]:
+    """
+    Kullanıcı ve oda öznitelik dizileri üzerinde yayınlama ile sentetik kullanıcı-otel puanları üretir.
+
+    Puan formülü eski döngüyle aynıdır: bütçe ve kapasiteye uygun oda yoksa 1-2 arası düşük
+    puan; varsa tercih edilen tipteki ilk uygun oda (yoksa ilk uygun oda) seçilir ve fiyat,
+    oda tipi ve özellik uyumunun ağırlıklı toplamına gürültü eklenir.
+
+    Args:
+        users: Kullanıcı kayıtları
+        table: Odası olan otellerin oda tablosu
+        user_indices: Her kullanıcının model indeksi
+        hotel_indices: Tablodaki her otelin model indeksi
+        rng: Rastgele sayı üreteci (tekrarlanabilirlik için tohumlanmış)
+        progress: İşlenen kullanıcı sayısıyla çağrılan ilerleme fonksiyonu (opsiyonel)
+
+    Returns:
+        Sütunlu etkileşim dizileri: user_idx, hotel_idx, room_idx (tablodaki oda sırası,
+        uygun oda yoksa -1) ve rating - kullanıcı sırasına, her kullanıcıda otel sırasına göre
+    """
+    user_table = UserTable(users, table.type_codes)
+    user_indices = np.asarray(user_indices, dtype=np.int64)
+    hotel_indices = np.asarray(hotel_indices, dtype=np.int64)
+    num_hotels = table.num_hotels
+
+    columns: Dict[str, List[np.ndarray]] = {'user_idx': [], 'hotel_idx': [], 'room_idx': [], 'rating': []}
+    if user_table.num_users == 0 or num_hotels == 0:
+        return {
+            'user_idx': np.zeros(0, dtype=np.int64),
+            'hotel_idx': np.zeros(0, dtype=np.int64),
+            'room_idx': np.zeros(0, dtype=np.int64),
+            'rating': np.zeros(0, dtype=np.float64),
+        }
+
+    # Her otelin oda aralığının başlangıcı (odalar tabloda otel sırasıyla art arda durur)
+    segment_starts = np.flatnonzero(np.r_[True, table.room_hotel[1:] != table.room_hotel[:-1]])
+
+    chunk_size = max(1, SYNTHESIS_CHUNK_PAIRS // max(1, table.num_rooms))
+    for start in range(0, user_table.num_users, chunk_size):
+        chunk = slice(start, min(start + chunk_size, user_table.num_users))
+        budget_min = user_table.budget_min[chunk, np.newaxis]
+        budget_max = user_table.budget_max[chunk, np.newaxis]
+
+        # Uygun odalar (kullanıcı bütçesine ve kapasitesine göre) ve bunlardan tercih edilen tipte olanlar
+        suitable = (
+            (budget_min <= table.price) & (table.price <= budget_max)
+            & (table.capacity >= user_table.required_capacity[chunk, np.newaxis])
+        )
+        preferred = suitable & (table.room_type == user_table.room_type[chunk, np.newaxis])
+
+        # En uygun oda: tercih edilen tipteki ilk uygun oda, yoksa ilk uygun oda
+        first_preferred = _first_in_segments(preferred, segment_starts)
+        first_suitable = _first_in_segments(suitable, segment_starts)
+        selected = np.where(first_preferred >= 0, first_preferred, first_suitable)
+        has_room = selected >= 0
+        rooms = np.maximum(selected, 0)
+
+        # Özellik uyumu skoru (0-1 arası)
+        amenity_match_count = (table.amenities[rooms] * user_table.wanted[chunk, np.newaxis, :]).sum(axis=2)
+        amenity_score = amenity_match_count / np.maximum(1, user_table.amenity_count[chunk, np.newaxis])
+
+        # Oda tipi uyum skoru
+        room_type_score = np.where(table.room_type[rooms] == user_table.room_type[chunk, np.newaxis], 1.0, 0.3)
+
+        # Fiyat uyum skoru - tercihen orta bütçeye yakın olsun
+        budget_avg = (budget_min + budget_max) / 2
+        budget_distance = np.abs(table.price[rooms] - budget_avg) / budget_avg
+        price_score = np.maximum(0, 1 - budget_distance)
+
+        # Ağırlıklandırılmış skor ve gürültü; uygun oda yoksa düşük puan
+        base_rating = 1.0 + 4.0 * (0.4 * price_score + 0.3 * room_type_score + 0.3 * amenity_score)
+        noise = rng.normal(0, 0.2, size=base_rating.shape)
+        low_rating = rng.uniform(1.0, 2.0, size=base_rating.shape)
+        rating = np.where(has_room, np.minimum(5, np.maximum(1, base_rating + noise)), low_rating)
+
+        count = rating.shape[0]
+        columns['user_idx'].append(np.repeat(user_indices[chunk], num_hotels))
+        columns['hotel_idx'].append(np.tile(hotel_indices, count))
+        columns['room_idx'].append(selected.reshape(-1))
+        columns['rating'].append(rating.reshape(-1))
+
+        if progress is not None:
+            progress(count)
+
+    return {name: np.concatenate(parts) for name, parts in columns.items()}